@@ -1,7 +1,13 @@
 """AI 분류 모듈"""
 from .base_classifier import BaseClassifier, ClassificationResult, CATEGORIES
-from .rule_classifier import RuleBasedClassifier, classify_posts
-from .exporter import export_uncertain_posts, parse_classified_file
+from .rule_classifier import RuleBasedClassifier, classify_posts, iter_classify_posts, ClassificationStats
+from .keyword_matcher import KeywordMatcher, get_keyword_matcher, load_keyword_index
+from .batch_scorer import SparseKeywordScorer, BatchScores
+from .classification_cache import ClassificationCache, get_classification_cache
+from .cooccurrence_index import CooccurrenceIndex, get_cooccurrence_index
+from .linear_classifier import LinearClassifier, train_linear_classifier
+from .cascade_classifier import CascadeClassifier, CascadeStats, build_cascade_classifier
+from .exporter import export_uncertain_posts, parse_classified_file, UncertainPostWriter
 from .keywords import KEYWORDS
 
 __all__ = [
@@ -10,7 +16,24 @@ __all__ = [
     "CATEGORIES",
     "RuleBasedClassifier",
     "classify_posts",
+    "iter_classify_posts",
+    "ClassificationStats",
+    "KeywordMatcher",
+    "get_keyword_matcher",
+    "load_keyword_index",
+    "SparseKeywordScorer",
+    "BatchScores",
+    "ClassificationCache",
+    "get_classification_cache",
+    "CooccurrenceIndex",
+    "get_cooccurrence_index",
+    "LinearClassifier",
+    "train_linear_classifier",
+    "CascadeClassifier",
+    "CascadeStats",
+    "build_cascade_classifier",
     "export_uncertain_posts",
     "parse_classified_file",
+    "UncertainPostWriter",
     "KEYWORDS",
 ]
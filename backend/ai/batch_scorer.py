@@ -0,0 +1,83 @@
+"""희소 키워드-카테고리 행렬 기반 일괄 점수 계산
+
+대량 분류(백필 등)에서 게시글을 하나씩 점수 계산하지 않고
+1. 모든 텍스트를 Aho-Corasick 매처로 한 번씩 훑어 (게시글, 패턴) 히트 목록(COO)을 만들고
+2. 패턴 × 카테고리 가중치 행렬과 bincount로 게시글 × 카테고리 점수를 한 번에 계산한 뒤
+3. 열을 CATEGORY_PRIORITY 순서로 배치해 argmax만으로 동점 우선순위까지 처리한다.
+
+점수/카테고리/신뢰도는 RuleBasedClassifier.classify와 같다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from .keyword_matcher import KeywordMatcher
+from .keywords import CATEGORY_PRIORITY
+
+
+@dataclass
+class BatchScores:
+    """일괄 점수 계산 결과 (게시글 순서)"""
+    # 최고 점수 카테고리 (matcher.categories index, 동점이면 CATEGORY_PRIORITY 우선)
+    best: np.ndarray
+    # 최고 점수 (매칭된 키워드 수)
+    max_score: np.ndarray
+    # min(1.0, max_score / 3)
+    confidence: np.ndarray
+    # 게시글별 매칭된 패턴 id
+    pattern_ids: list[set[int]]
+
+
+class SparseKeywordScorer:
+    """매처의 패턴 → 카테고리 가중치 행렬을 한 번 만들어 두고 배치 단위로 점수 계산"""
+
+    def __init__(self, matcher: KeywordMatcher, priority: list[str] = CATEGORY_PRIORITY):
+        self.matcher = matcher
+        categories = matcher.categories
+
+        # 열 순서: 우선순위 카테고리 → 나머지 (사전 순서) - argmax는 동점이면 앞 열을 고름
+        columns = [category for category in priority if category in categories]
+        columns += [category for category in categories if category not in columns]
+        self._column_category = np.array([categories.index(category) for category in columns], dtype=np.intp)
+        column_of = {categories.index(category): column for column, category in enumerate(columns)}
+
+        # 패턴 × 카테고리 키워드 수 (같은 카테고리의 중복 키워드는 중복 횟수만큼)
+        self._weights = np.zeros((matcher.num_patterns, len(columns)), dtype=np.int64)
+        for pattern_id in range(matcher.num_patterns):
+            for cat_index, _ in matcher.pattern_entries(pattern_id):
+                self._weights[pattern_id, column_of[cat_index]] += 1
+
+        # 빈 문자열 키워드는 모든 게시글 점수에 더함
+        self._base = np.zeros(len(columns), dtype=np.int64)
+        for cat_index, _ in matcher.always_entries:
+            self._base[column_of[cat_index]] += 1
+
+    def score(self, texts: list[str]) -> BatchScores:
+        """소문자 텍스트 목록 → 게시글별 최고 카테고리/점수/신뢰도"""
+        pattern_ids = []
+        rows = []
+        hits = []
+        for row, text in enumerate(texts):
+            found = self.matcher.find_patterns(text)
+            pattern_ids.append(found)
+            rows.extend([row] * len(found))
+            hits.extend(found)
+
+        n_posts, n_columns = len(texts), len(self._base)
+        rows = np.asarray(rows, dtype=np.intp)
+        hits = np.asarray(hits, dtype=np.intp)
+
+        # COO (게시글, 패턴) × (패턴, 카테고리) → (게시글, 카테고리): 셀 번호별 bincount
+        hit_weights = self._weights[hits]
+        cells = rows[:, None] * n_columns + np.arange(n_columns)
+        scores = np.bincount(cells.ravel(), weights=hit_weights.ravel(), minlength=n_posts * n_columns)
+        scores = scores.reshape(n_posts, n_columns).astype(np.int64) + self._base
+
+        best_column = scores.argmax(axis=1) if n_posts else np.zeros(0, dtype=np.intp)
+        max_score = scores[np.arange(n_posts), best_column]
+        return BatchScores(
+            best=self._column_category[best_column],
+            max_score=max_score,
+            confidence=np.minimum(1.0, max_score / 3),
+            pattern_ids=pattern_ids,
+        )
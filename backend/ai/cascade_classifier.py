@@ -0,0 +1,232 @@
+"""단계별 분류 파이프라인 (규칙 → 느린 분류기, 실행당 예산 제한)
+
+1. RuleBasedClassifier가 모든 게시글을 분류
+2. 신뢰도가 escalate_below 미만이거나 애매한 키워드(AMBIGUOUS_KEYWORDS)가 매칭된 게시글은
+   느린 분류기(예: LinearClassifier, LLM 기반 분류기)로 다시 분류
+   (느린 분류기 결과는 신뢰도가 accept_above 이상이고 규칙 분류보다 높을 때만 사용)
+3. 다시 분류할 게시글 수/시간은 실행당 예산으로 제한하고 인기도(popularity_score) 높은 순으로 처리
+
+예산은 CascadeClassifier 인스턴스(= 한 번의 실행) 단위로 누적된다.
+스트리밍 분류(iter_classify_posts)에서는 배치 순서대로 예산을 쓰고 배치 안에서 인기도 순으로 고른다.
+"""
+import os
+import time
+from dataclasses import dataclass, field
+
+from .base_classifier import BaseClassifier, ClassificationResult
+from .rule_classifier import RuleBasedClassifier
+from .classification_cache import ClassificationCache
+from .cooccurrence_index import CooccurrenceIndex
+from .linear_classifier import LinearClassifier, DEFAULT_MODEL_PATH
+from .memory_classifier import AMBIGUOUS_KEYWORDS
+
+
+def popularity_score(post: dict) -> int:
+    """인기도 (rankings.popularity_score와 같은 계산)"""
+    if post.get("popularity_score") is not None:
+        return post["popularity_score"]
+    return (post.get("views") or 0) + (post.get("likes") or 0) * 10
+
+
+@dataclass
+class StageStats:
+    """단계별 처리 수 / 소요 시간"""
+    posts: int = 0
+    seconds: float = 0.0
+
+    def add(self, posts: int, seconds: float) -> None:
+        self.posts += posts
+        self.seconds += seconds
+
+
+@dataclass
+class CascadeStats:
+    """단계별 분류 통계"""
+    rule: StageStats = field(default_factory=StageStats)
+    escalated: StageStats = field(default_factory=StageStats)
+    # 다시 분류 대상이었던 게시글 수 (예산 초과로 못 한 것 포함)
+    candidates: int = 0
+    # 예산 초과로 규칙 분류 결과를 그대로 쓴 게시글 수
+    over_budget: int = 0
+    # 다시 분류한 게시글 중 느린 분류기 결과를 쓴 게시글 수
+    replaced: int = 0
+
+    def summary(self) -> dict:
+        def stage(stats: StageStats) -> dict:
+            return {
+                "posts": stats.posts,
+                "seconds": round(stats.seconds, 4),
+                "ms_per_post": round(stats.seconds * 1000 / stats.posts, 3) if stats.posts else 0.0,
+            }
+
+        return {
+            "rule": stage(self.rule),
+            "escalated": stage(self.escalated),
+            "candidates": self.candidates,
+            "over_budget": self.over_budget,
+            "replaced": self.replaced,
+        }
+
+
+class CascadeClassifier(BaseClassifier):
+    """
+    규칙 기반 분류 후 불확실/애매한 게시글만 느린 분류기로 다시 분류
+
+    다시 분류한 게시글은 느린 분류기 결과가 더 확실할 때만 그 결과를 사용한다.
+    """
+
+    def __init__(
+        self,
+        secondary: BaseClassifier,
+        primary: RuleBasedClassifier | None = None,
+        escalate_below: float = 0.5,
+        accept_above: float = 0.5,
+        max_escalations: int | None = 200,
+        time_budget: float | None = 5.0,
+        chunk_size: int = 64,
+        cache: ClassificationCache | None = None,
+        workers: int = 1,
+    ):
+        """
+        Args:
+            secondary: 느린 분류기
+            primary: 규칙 기반 분류기 (기본: RuleBasedClassifier())
+            escalate_below: 규칙 분류 신뢰도가 이 값 미만이면 다시 분류 (기본: 키워드 1개 이하 매칭)
+            accept_above: 느린 분류기 결과를 쓰는 최소 신뢰도
+                (LinearClassifier의 사후확률은 항상 1/카테고리 수 이상이라 규칙 분류 임계값과 따로 둠)
+            max_escalations: 실행당 다시 분류할 최대 게시글 수 (None: 제한 없음)
+            time_budget: 실행당 느린 분류기에 쓸 최대 시간(초) (None: 제한 없음)
+            chunk_size: 느린 분류기에 한 번에 넘기는 게시글 수 (조각마다 남은 시간 확인)
+            cache: 규칙 분류 단계에 사용할 분류 캐시
+            workers: 규칙 분류 단계 프로세스 수
+        """
+        self.primary = primary or RuleBasedClassifier()
+        self.secondary = secondary
+        self.escalate_below = escalate_below
+        self.accept_above = accept_above
+        self.max_escalations = max_escalations
+        self.time_budget = time_budget
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.workers = workers
+        self.confidence_threshold = self.primary.confidence_threshold
+        self.stats = CascadeStats()
+
+    def needs_escalation(self, post: dict) -> bool:
+        """규칙 분류 결과를 느린 분류기로 다시 확인해야 하는지"""
+        if post["confidence"] < self.escalate_below:
+            return True
+        # 키워드 사전이 실제로 매칭한 애매한 키워드만 (다른 키워드의 일부로만 들어있는 경우 제외)
+        return any(keyword in AMBIGUOUS_KEYWORDS for keyword in post.get("matched_keywords") or [])
+
+    def accepts(self, rule_post: dict, escalated_post: dict) -> bool:
+        """느린 분류기 결과를 규칙 분류 결과 대신 쓸지"""
+        return escalated_post["confidence"] >= max(self.accept_above, rule_post["confidence"])
+
+    def _remaining_posts(self) -> int | None:
+        if self.max_escalations is None:
+            return None
+        return max(0, self.max_escalations - self.stats.escalated.posts)
+
+    def _remaining_seconds(self) -> float | None:
+        if self.time_budget is None:
+            return None
+        return self.time_budget - self.stats.escalated.seconds
+
+    def _next_chunk_size(self) -> int:
+        """남은 예산 안에서 다음 조각 크기 (지금까지의 게시글당 시간으로 추정)"""
+        size = self.chunk_size
+        remaining_posts = self._remaining_posts()
+        if remaining_posts is not None:
+            size = min(size, remaining_posts)
+
+        remaining_seconds = self._remaining_seconds()
+        if remaining_seconds is not None:
+            if remaining_seconds <= 0:
+                return 0
+            escalated = self.stats.escalated
+            if escalated.posts and escalated.seconds > 0:
+                size = min(size, max(1, int(remaining_seconds / (escalated.seconds / escalated.posts))))
+        return size
+
+    def classify_batch(self, posts: list[dict], workers: int | None = None) -> list[dict]:
+        """
+        여러 게시글 단계별 분류 (결과는 입력 순서)
+
+        Args:
+            posts: 게시글 리스트
+            workers: 규칙 분류 단계 프로세스 수 (기본: 생성 시 지정한 값)
+        """
+        workers = workers or self.workers
+
+        started = time.perf_counter()
+        if self.cache is not None:
+            results = self.cache.classify_batch(self.primary, posts, workers=workers)
+        else:
+            results = self.primary.classify_batch(posts, workers=workers)
+        self.stats.rule.add(len(posts), time.perf_counter() - started)
+
+        # 인기도 높은 순으로 다시 분류
+        candidates = [i for i, post in enumerate(results) if self.needs_escalation(post)]
+        candidates.sort(key=lambda i: popularity_score(results[i]), reverse=True)
+        self.stats.candidates += len(candidates)
+
+        position = 0
+        while position < len(candidates):
+            size = self._next_chunk_size()
+            if size <= 0:
+                break
+            chunk = candidates[position:position + size]
+
+            started = time.perf_counter()
+            escalated = self.secondary.classify_batch([posts[i] for i in chunk])
+            self.stats.escalated.add(len(chunk), time.perf_counter() - started)
+
+            for i, post in zip(chunk, escalated):
+                if self.accepts(results[i], post):
+                    results[i] = post
+                    self.stats.replaced += 1
+            position += len(chunk)
+
+        self.stats.over_budget += len(candidates) - position
+        return results
+
+    def classify(self, title: str, content: str | None = None) -> ClassificationResult:
+        """게시글 하나 분류"""
+        post = self.classify_batch([{"title": title, "content": content}])[0]
+        return ClassificationResult(
+            category=post["category"],
+            confidence=post["confidence"],
+            matched_keywords=post["matched_keywords"],
+        )
+
+    def summarize(self, title: str, content: str | None = None) -> str:
+        """느린 분류기의 요약 사용"""
+        return self.secondary.summarize(title, content)
+
+
+def build_cascade_classifier(
+    confidence_threshold: float = 0.1,
+    cache: ClassificationCache | None = None,
+    cooccurrence: CooccurrenceIndex | None = None,
+) -> CascadeClassifier | None:
+    """
+    저장된 선형 분류기를 느린 분류기로 쓰는 기본 파이프라인
+
+    CASCADE=0이거나 학습된 모델(LINEAR_MODEL_PATH)이 없으면 None.
+    예산은 CASCADE_MAX_POSTS(기본 200), CASCADE_TIME_BUDGET(초, 기본 5.0) 환경변수로 조정한다.
+    """
+    if os.getenv("CASCADE", "1").lower() in ("0", "false", "off"):
+        return None
+
+    model_path = os.getenv("LINEAR_MODEL_PATH") or DEFAULT_MODEL_PATH
+    if not os.path.exists(model_path):
+        return None
+
+    return CascadeClassifier(
+        secondary=LinearClassifier.load(model_path, confidence_threshold),
+        primary=RuleBasedClassifier(confidence_threshold, cooccurrence),
+        max_escalations=int(os.getenv("CASCADE_MAX_POSTS", "200")),
+        time_budget=float(os.getenv("CASCADE_TIME_BUDGET", "5.0")),
+        cache=cache,
+    )
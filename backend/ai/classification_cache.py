@@ -0,0 +1,207 @@
+"""분류 결과 디스크 캐시 (SQLite, LRU)
+
+같은 인기글이 여러 실행에 걸쳐 계속 수집되므로 분류 결과를 저장해 두고 재사용한다.
+- 키: 매칭 대상 텍스트(소문자 제목 + 본문)와 신뢰도 임계값의 해시
+- 키워드 사전(KEYWORDS), 동점 우선순위(CATEGORY_PRIORITY), 분류 로직 버전(CLASSIFIER_VERSION)이 바뀌면
+  저장된 결과를 모두 버림
+- 항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+
+from .keywords import KEYWORDS, CATEGORY_PRIORITY
+from .keyword_matcher import keyword_set_hash
+
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".cache" / "classification.sqlite3"
+
+# 한 번에 조회하는 키 수 (SQLite 변수 개수 제한 이내)
+_QUERY_CHUNK = 500
+
+# 규칙 분류 로직 버전 (점수 계산/동점 처리/애매한 키워드 처리 등 결과가 바뀌는 수정을 하면 올림)
+CLASSIFIER_VERSION = 2
+
+# matched_keywords 저장 시 구분자 (키워드에 쓰이지 않는 제어 문자)
+_KEYWORD_SEPARATOR = "\x1f"
+
+
+class ClassificationCache:
+    """분류 결과 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        keywords: dict[str, list[str]] = KEYWORDS,
+        priority: list[str] = CATEGORY_PRIORITY,
+        max_entries: int = 200_000,
+        touch_interval: float = 6 * 3600,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: CLASSIFICATION_CACHE_PATH 환경변수 또는 backend/.cache/classification.sqlite3)
+            keywords: 키워드 사전 (해시가 바뀌면 캐시 초기화)
+            priority: 동점 시 카테고리 우선순위 (바뀌면 캐시 초기화)
+            max_entries: 최대 항목 수 (초과 시 LRU 삭제)
+            touch_interval: 조회된 항목의 사용 시각을 갱신하는 최소 간격(초) - 매 조회마다 쓰지 않도록
+        """
+        self.path = Path(path or os.getenv("CLASSIFICATION_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        self.max_entries = max_entries
+        self.touch_interval = touch_interval
+        self.version = self.cache_version(keywords, priority)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS entries (
+                key BLOB PRIMARY KEY,
+                category TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                matched_keywords TEXT NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+        """)
+
+        # 키워드 사전/우선순위/분류 로직이 바뀌었으면 기존 결과 무효화
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'keywords_version'").fetchone()
+        if not row or row[0] != self.version:
+            with self._conn:
+                self._conn.execute("DELETE FROM entries")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('keywords_version', ?)", (self.version,)
+                )
+
+    @staticmethod
+    def cache_version(keywords: dict[str, list[str]], priority: list[str]) -> str:
+        """분류 결과에 영향을 주는 설정의 해시"""
+        payload = json.dumps([CLASSIFIER_VERSION, keyword_set_hash(keywords), priority]).encode()
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+    @staticmethod
+    def key(text: str, confidence_threshold: float) -> bytes:
+        """캐시 키 (매칭 대상 텍스트 + 임계값)"""
+        return hashlib.blake2b(f"{confidence_threshold!r}\0{text}".encode(), digest_size=16).digest()
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, tuple[str, float, list[str]]]:
+        """저장된 결과 조회 (찾은 항목은 사용 시각 갱신)"""
+        found = {}
+        stale = []
+        now = time.time()
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for i in range(0, len(unique_keys), _QUERY_CHUNK):
+                chunk = unique_keys[i:i + _QUERY_CHUNK]
+                rows = self._conn.execute(
+                    "SELECT key, category, confidence, matched_keywords, last_used FROM entries"
+                    f" WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, category, confidence, matched_keywords, last_used in rows:
+                    found[key] = (category, confidence, matched_keywords.split(_KEYWORD_SEPARATOR) if matched_keywords else [])
+                    if now - last_used >= self.touch_interval:
+                        stale.append((now, key))
+
+            if stale:
+                with self._conn:
+                    self._conn.executemany("UPDATE entries SET last_used = ? WHERE key = ?", stale)
+        return found
+
+    def put_many(self, items: list[tuple[bytes, str, float, list[str]]]) -> None:
+        """분류 결과 저장 후 용량 초과분 삭제 (LRU)"""
+        if not items:
+            return
+
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (key, category, confidence, matched_keywords, last_used) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (key, category, confidence, _KEYWORD_SEPARATOR.join(matched_keywords), now)
+                    for key, category, confidence, matched_keywords in items
+                ],
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY last_used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def classify_batch(self, classifier, posts: list[dict], workers: int = 1) -> list[dict]:
+        """캐시에 없는 게시글만 분류기로 분류 (결과는 입력 순서)
+
+        Args:
+            classifier: RuleBasedClassifier (매칭 텍스트 규칙과 임계값을 키에 사용)
+            posts: 게시글 리스트
+            workers: 캐시 미스 게시글 분류 프로세스 수
+        """
+        texts = [classifier.match_text(post.get("title", ""), post.get("content")) for post in posts]
+        keys = [self.key(text, classifier.confidence_threshold) for text in texts]
+        cached = self.get_many(keys)
+
+        # 매칭된 애매한 키워드를 문맥(동시출현 인덱스)으로 판정하는 게시글은 캐시를 쓰지 않음 (인덱스가 학습하면 결과가 바뀜)
+        uncacheable = {i for i, text in enumerate(texts) if classifier.uses_context(text)}
+        miss_indexes = [i for i, key in enumerate(keys) if key not in cached or i in uncacheable]
+        fresh = classifier.classify_batch([posts[i] for i in miss_indexes], workers=workers)
+
+        with self._lock:
+            self.hits += len(posts) - len(miss_indexes)
+            self.misses += len(miss_indexes)
+
+        results: list[dict | None] = [None] * len(posts)
+        new_items = {}
+        for i, post in zip(miss_indexes, fresh):
+            results[i] = post
+            if i in uncacheable:
+                continue
+            new_items[keys[i]] = (keys[i], post["category"], post["confidence"], post["matched_keywords"])
+        self.put_many(list(new_items.values()))
+
+        for i, key in enumerate(keys):
+            if results[i] is None:
+                category, confidence, matched_keywords = cached[key]
+                post_copy = posts[i].copy()
+                post_copy["category"] = category
+                post_copy["confidence"] = confidence
+                post_copy["matched_keywords"] = list(matched_keywords)
+                results[i] = post_copy
+        return results
+
+    def summary(self) -> dict:
+        """hit / miss / hit rate"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hit": self.hits,
+                "miss": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: ClassificationCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_classification_cache() -> ClassificationCache | None:
+    """기본 분류 캐시 (CLASSIFICATION_CACHE=0이면 None)"""
+    global _default_cache
+    if os.getenv("CLASSIFICATION_CACHE", "1").lower() in ("0", "false", "off"):
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ClassificationCache()
+        return _default_cache
@@ -0,0 +1,284 @@
+"""애매한 키워드의 문맥 동시출현 인덱스 (SQLite, 실행마다 증분 갱신)
+
+AMBIGUOUS_KEYWORDS(이적, 은퇴, 팬, 논란)처럼 여러 카테고리에 쓰이는 키워드는
+같은 제목에 함께 나온 단어(문맥 단어)로 카테고리를 정한다.
+
+- 테이블: 키워드 → 카테고리 → 문맥 단어 → 출현 수
+- 학습: 분류가 끝난 게시글 중 애매한 키워드 말고 다른 키워드로 카테고리가 정해진 것만 사용
+  (애매한 키워드로 정한 결과를 다시 학습하면 오분류가 굳어지므로)
+  키워드 사전이 실제로 매칭한 애매한 키워드만 학습하고 (팬미팅 안의 "팬" 등 제외),
+  여러 실행에 걸쳐 계속 수집되는 인기글은 한 번만 학습한다 (URL 기준)
+- 판정: 게시글의 문맥 단어마다 (키워드, 단어) 딕셔너리 조회 한 번씩으로 나이브 베이즈 점수 계산
+"""
+import os
+import re
+import math
+import time
+import sqlite3
+import threading
+from collections import Counter
+from pathlib import Path
+
+from .memory_classifier import AMBIGUOUS_KEYWORDS
+from .keywords import KEYWORDS
+from .keyword_matcher import get_keyword_matcher
+
+
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parent.parent / ".cache" / "cooccurrence.sqlite3"
+
+# 문맥 단어: 2글자 이상 한글/영문/숫자
+_TERM_PATTERN = re.compile(r"[0-9a-z가-힣]{2,}")
+
+# 게시글 하나에서 사용하는 최대 문맥 단어 수
+_MAX_TERMS = 32
+
+
+def context_terms(text: str, keyword: str) -> set[str]:
+    """소문자 텍스트 → 문맥 단어 집합 (키워드 자체는 제외)"""
+    terms = set(_TERM_PATTERN.findall(text)[:_MAX_TERMS])
+    terms.discard(keyword)
+    return terms
+
+
+class CooccurrenceIndex:
+    """애매한 키워드 문맥 동시출현 인덱스 (스레드 안전)"""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ambiguous_keywords: dict[str, list[tuple[str, str]]] = AMBIGUOUS_KEYWORDS,
+        min_observations: int = 5,
+        min_probability: float = 0.6,
+        alpha: float = 0.5,
+        keyword_set: dict[str, list[str]] = KEYWORDS,
+        learned_ttl: float = 30 * 24 * 3600,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: COOCCURRENCE_INDEX_PATH 환경변수 또는 backend/.cache/cooccurrence.sqlite3)
+            ambiguous_keywords: 키워드 → [(카테고리, 설명), ...] (학습/판정 대상 카테고리)
+            min_observations: 키워드별 학습 게시글이 이보다 적으면 판정하지 않음
+            min_probability: 최고 카테고리 확률이 이보다 낮으면 판정하지 않음
+            alpha: 스무딩 값
+            keyword_set: 애매한 키워드가 매칭됐는지 확인할 키워드 사전
+            learned_ttl: 학습한 게시글 기록 보존 시간(초) - 수집 대상 기간(7일)보다 길게
+        """
+        self.path = Path(path or os.getenv("COOCCURRENCE_INDEX_PATH") or DEFAULT_INDEX_PATH)
+        self.candidates = {
+            keyword: [category for category, _ in categories]
+            for keyword, categories in ambiguous_keywords.items()
+        }
+        self.min_observations = min_observations
+        self.min_probability = min_probability
+        self.alpha = alpha
+        self.keyword_set = keyword_set
+        self.learned_ttl = learned_ttl
+        self._lock = threading.Lock()
+
+        # (키워드, 문맥 단어) → {카테고리: 출현 수}
+        self._term_counts: dict[tuple[str, str], dict[str, int]] = {}
+        # 키워드 → {카테고리: 학습 게시글 수}
+        self._post_counts: dict[str, Counter] = {keyword: Counter() for keyword in self.candidates}
+        # 키워드 → 문맥 단어 수 (스무딩 분모)
+        self._vocabulary: Counter = Counter()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS terms (
+                keyword TEXT NOT NULL,
+                category TEXT NOT NULL,
+                term TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (keyword, category, term)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS posts (
+                keyword TEXT NOT NULL,
+                category TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (keyword, category)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS learned (
+                post_key TEXT PRIMARY KEY,
+                learned_at REAL NOT NULL
+            ) WITHOUT ROWID;
+        """)
+        self._load()
+
+    def _load(self) -> None:
+        for keyword, category, count in self._conn.execute("SELECT keyword, category, count FROM posts"):
+            if keyword in self._post_counts:
+                self._post_counts[keyword][category] = count
+        for keyword, category, term, count in self._conn.execute("SELECT keyword, category, term, count FROM terms"):
+            if keyword in self.candidates:
+                self._add_term(keyword, category, term, count)
+
+    def _add_term(self, keyword: str, category: str, term: str, count: int) -> None:
+        counts = self._term_counts.get((keyword, term))
+        if counts is None:
+            counts = self._term_counts[(keyword, term)] = {}
+            self._vocabulary[keyword] += 1
+        counts[category] = counts.get(category, 0) + count
+
+    @property
+    def keywords(self) -> list[str]:
+        return list(self.candidates)
+
+    def ambiguous_hits(self, text: str) -> list[str]:
+        """소문자 텍스트에 들어있는 애매한 키워드"""
+        return [keyword for keyword in self.candidates if keyword in text]
+
+    def resolve(self, keyword: str, text: str) -> str | None:
+        """문맥으로 키워드의 카테고리 판정 (근거가 부족하면 None)"""
+        post_counts = self._post_counts.get(keyword)
+        if not post_counts or sum(post_counts.values()) < self.min_observations:
+            return None
+
+        vocabulary = self._vocabulary[keyword] + 1
+        categories = [category for category in self.candidates[keyword] if post_counts[category]]
+        if not categories:
+            return None
+
+        scores = {category: math.log(post_counts[category]) for category in categories}
+        seen_term = False
+        for term in context_terms(text, keyword):
+            counts = self._term_counts.get((keyword, term))
+            if counts is None:
+                continue
+            seen_term = True
+            for category in categories:
+                scores[category] += math.log(
+                    (counts.get(category, 0) + self.alpha) / (post_counts[category] + self.alpha * vocabulary)
+                )
+
+        # 학습된 문맥 단어가 하나도 없으면 사전 확률만으로 판정하지 않음
+        if not seen_term:
+            return None
+
+        best = max(scores, key=scores.get)
+        total = sum(math.exp(score - scores[best]) for score in scores.values())
+        if 1 / total < self.min_probability:
+            return None
+        return best
+
+    @staticmethod
+    def post_key(post: dict) -> str:
+        """학습 중복 확인용 게시글 키 (URL, 없으면 소스 + 제목)"""
+        return post.get("url") or f"{post.get('source', '')}\0{post.get('title', '')}"
+
+    def _unlearned(self, keys: list[str]) -> set[str]:
+        """아직 학습하지 않은 게시글 키"""
+        learned = set()
+        with self._lock:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                learned.update(
+                    key for key, in self._conn.execute(
+                        f"SELECT post_key FROM learned WHERE post_key IN ({','.join('?' * len(chunk))})", chunk
+                    )
+                )
+        return set(keys) - learned
+
+    def learn(self, posts: list[dict], min_other_keywords: int = 1) -> int:
+        """
+        분류된 게시글로 인덱스 증분 갱신 (메모리 + SQLite)
+
+        키워드 사전이 매칭한 애매한 키워드가 있고, 애매하지 않은 매칭 키워드가 min_other_keywords개 이상인 게시글만 사용한다.
+        matched_keywords가 없는 게시글(수동 분류 등)은 카테고리를 그대로 믿는다.
+        이전에 학습한 게시글(같은 URL)은 다시 학습하지 않는다.
+
+        Returns:
+            학습에 사용된 (게시글, 키워드) 수
+        """
+        from .rule_classifier import RuleBasedClassifier
+
+        matcher = get_keyword_matcher(self.keyword_set)
+        candidates = []
+        for post in posts:
+            text = RuleBasedClassifier.match_text(post.get("title", ""), post.get("content"))
+            hits = self.ambiguous_hits(text)
+            if hits:
+                candidates.append((post, text, hits))
+        if not candidates:
+            return 0
+
+        unlearned = self._unlearned(list({self.post_key(post) for post, _, _ in candidates}))
+
+        term_deltas: Counter = Counter()
+        post_deltas: Counter = Counter()
+        learned_keys = set()
+
+        for post, text, hits in candidates:
+            key = self.post_key(post)
+            if key not in unlearned or key in learned_keys:
+                continue
+            category = post.get("category")
+            matched_keywords = post.get("matched_keywords")
+            found = {keyword for category_matched in matcher.match(text).values() for keyword in category_matched}
+            for keyword in hits:
+                if keyword not in found or category not in self.candidates[keyword]:
+                    continue
+                if matched_keywords is not None:
+                    other_keywords = [matched for matched in matched_keywords if matched not in self.candidates]
+                    if len(other_keywords) < min_other_keywords:
+                        continue
+                post_deltas[(keyword, category)] += 1
+                for term in context_terms(text, keyword):
+                    term_deltas[(keyword, category, term)] += 1
+                learned_keys.add(key)
+
+        if not post_deltas:
+            return 0
+
+        with self._lock:
+            for (keyword, category), count in post_deltas.items():
+                self._post_counts[keyword][category] += count
+            for (keyword, category, term), count in term_deltas.items():
+                self._add_term(keyword, category, term, count)
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO posts (keyword, category, count) VALUES (?, ?, ?)"
+                    " ON CONFLICT (keyword, category) DO UPDATE SET count = count + excluded.count",
+                    [(keyword, category, count) for (keyword, category), count in post_deltas.items()],
+                )
+                self._conn.executemany(
+                    "INSERT INTO terms (keyword, category, term, count) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT (keyword, category, term) DO UPDATE SET count = count + excluded.count",
+                    [(keyword, category, term, count) for (keyword, category, term), count in term_deltas.items()],
+                )
+                now = time.time()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO learned (post_key, learned_at) VALUES (?, ?)",
+                    [(key, now) for key in learned_keys],
+                )
+                self._conn.execute("DELETE FROM learned WHERE learned_at < ?", (now - self.learned_ttl,))
+        return sum(post_deltas.values())
+
+    def summary(self) -> dict:
+        """키워드별 학습 게시글 수 / 문맥 단어 수"""
+        with self._lock:
+            return {
+                keyword: {"posts": dict(self._post_counts[keyword]), "terms": self._vocabulary[keyword]}
+                for keyword in self.candidates
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_index: CooccurrenceIndex | None = None
+_default_index_lock = threading.Lock()
+
+
+def get_cooccurrence_index() -> CooccurrenceIndex | None:
+    """기본 동시출현 인덱스 (COOCCURRENCE_INDEX=0이면 None)"""
+    global _default_index
+    if os.getenv("COOCCURRENCE_INDEX", "1").lower() in ("0", "false", "off"):
+        return None
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = CooccurrenceIndex()
+        return _default_index
@@ -1,8 +1,100 @@
 """불확실 게시글 export (수동 분류용)"""
 import os
+import re
+import shutil
+import tempfile
 from datetime import datetime
 
 
+# export 파일의 게시글 첫 줄: "1. [source] title"
+_POST_HEADER = re.compile(r"^\d+\. \[([^\]]*)\] (.*)$")
+
+
+class UncertainPostWriter:
+    """불확실 게시글을 한 개씩 받아 export 파일에 쓰는 writer (export_uncertain_posts와 같은 형식)
+
+    헤더에 전체 개수가 들어가므로 본문은 임시 파일에 먼저 쓰고 close()에서 헤더와 합친다.
+    게시글이 하나도 없으면 파일을 만들지 않는다.
+
+    사용법:
+        with UncertainPostWriter() as writer:
+            for post in posts:
+                writer.write(post)
+        print(writer.filepath)
+    """
+
+    def __init__(self, output_dir: str = "output", filename: str | None = None):
+        """
+        Args:
+            output_dir: 출력 디렉토리
+            filename: 파일명 (기본: uncertain_posts_YYYY-MM-DD.txt)
+        """
+        if filename is None:
+            today = datetime.now().strftime("%Y-%m-%d")
+            filename = f"uncertain_posts_{today}.txt"
+
+        self.output_dir = output_dir
+        self.filename = filename
+        self.count = 0
+        # close() 후 생성된 파일 경로 (게시글이 없으면 None)
+        self.filepath: str | None = None
+        self._body = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+    def write(self, post: dict) -> None:
+        """게시글 한 개 추가"""
+        self.count += 1
+        source = post.get("source", "unknown")
+        title = post.get("title", "제목 없음")
+        url = post.get("url", "")
+        confidence = post.get("confidence", 0)
+        matched = post.get("matched_keywords", [])
+
+        f = self._body
+        f.write(f"{self.count}. [{source}] {title}\n")
+        f.write(f"   URL: {url}\n")
+        f.write(f"   현재 신뢰도: {confidence:.1%}\n")
+        if matched:
+            f.write(f"   매칭 키워드: {', '.join(matched)}\n")
+        f.write(f"   분류: _______ (politics/sports/celebrity/stock/game/issue)\n")
+        f.write(f"   요약:\n")
+        f.write(f"   _______________________________\n")
+        f.write("\n")
+
+    def close(self, write_empty: bool = False) -> str | None:
+        """헤더 + 본문을 export 파일로 저장
+
+        Args:
+            write_empty: True면 게시글이 없어도 파일 생성
+
+        Returns:
+            생성된 파일 경로 (게시글이 없고 write_empty=False면 None)
+        """
+        if self._body.closed:
+            return self.filepath
+
+        if self.count or write_empty:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self.filepath = os.path.join(self.output_dir, self.filename)
+
+            with open(self.filepath, "w", encoding="utf-8") as f:
+                today = datetime.now().strftime("%Y-%m-%d %H:%M")
+                f.write(f"===== {today} 수동 분류 필요 ({self.count}개) =====\n\n")
+                f.write("분류 옵션: politics / sports / celebrity / stock / game / issue\n")
+                f.write("-" * 60 + "\n\n")
+
+                self._body.seek(0)
+                shutil.copyfileobj(self._body, f)
+
+        self._body.close()
+        return self.filepath
+
+    def __enter__(self) -> "UncertainPostWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 def export_uncertain_posts(
     posts: list[dict],
     output_dir: str = "output",
@@ -19,38 +111,10 @@ def export_uncertain_posts(
     Returns:
         생성된 파일 경로
     """
-    os.makedirs(output_dir, exist_ok=True)
-
-    if filename is None:
-        today = datetime.now().strftime("%Y-%m-%d")
-        filename = f"uncertain_posts_{today}.txt"
-
-    filepath = os.path.join(output_dir, filename)
-
-    with open(filepath, "w", encoding="utf-8") as f:
-        today = datetime.now().strftime("%Y-%m-%d %H:%M")
-        f.write(f"===== {today} 수동 분류 필요 ({len(posts)}개) =====\n\n")
-        f.write("분류 옵션: politics / sports / celebrity / stock / game / issue\n")
-        f.write("-" * 60 + "\n\n")
-
-        for i, post in enumerate(posts, 1):
-            source = post.get("source", "unknown")
-            title = post.get("title", "제목 없음")
-            url = post.get("url", "")
-            confidence = post.get("confidence", 0)
-            matched = post.get("matched_keywords", [])
-
-            f.write(f"{i}. [{source}] {title}\n")
-            f.write(f"   URL: {url}\n")
-            f.write(f"   현재 신뢰도: {confidence:.1%}\n")
-            if matched:
-                f.write(f"   매칭 키워드: {', '.join(matched)}\n")
-            f.write(f"   분류: _______ (politics/sports/celebrity/stock/game/issue)\n")
-            f.write(f"   요약:\n")
-            f.write(f"   _______________________________\n")
-            f.write("\n")
-
-    return filepath
+    writer = UncertainPostWriter(output_dir, filename)
+    for post in posts:
+        writer.write(post)
+    return writer.close(write_empty=True)
 
 
 def parse_classified_file(filepath: str) -> list[dict]:
@@ -61,7 +125,7 @@ def parse_classified_file(filepath: str) -> list[dict]:
         filepath: 수동 분류 완료된 파일
 
     Returns:
-        분류 결과 리스트 [{"url": str, "category": str, "summary": str}, ...]
+        분류 결과 리스트 [{"url": str, "category": str, "summary": str, "source": str, "title": str}, ...]
     """
     results = []
     current_post = {}
@@ -69,8 +133,12 @@ def parse_classified_file(filepath: str) -> list[dict]:
     with open(filepath, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
+            header = _POST_HEADER.match(line) if not current_post.get("url") else None
+
+            if header:
+                current_post["source"], current_post["title"] = header.group(1), header.group(2)
 
-            if line.startswith("URL:"):
+            elif line.startswith("URL:"):
                 current_post["url"] = line.replace("URL:", "").strip()
 
             elif "분류:" in line and "_______" not in line:
@@ -0,0 +1,309 @@
+"""다중 키워드 매처 (Aho-Corasick) + 디스크 인덱스
+
+KEYWORDS 전체를 하나의 오토마톤으로 만들어 제목을 한 번만 훑어서 매칭된 키워드를 찾는다.
+결과는 카테고리별로 `keyword.lower() in text` 를 순서대로 검사한 것과 같다.
+- 카테고리 안에서 키워드 순서 유지
+- 같은 카테고리에 중복된 키워드는 중복된 횟수만큼 포함
+
+오토마톤은 평평한 정수 배열로 저장해 두고(.cache/keyword_index) 다음 실행에서 mmap으로 읽는다.
+파일 이름에 키워드 사전 해시가 들어가므로 keywords.py가 바뀌면 자동으로 다시 만든다.
+"""
+import os
+import json
+import mmap
+import struct
+import hashlib
+from array import array
+from collections import deque
+from pathlib import Path
+
+from .keywords import KEYWORDS
+
+
+DEFAULT_INDEX_DIR = Path(__file__).resolve().parent.parent / ".cache" / "keyword_index"
+
+# 인덱스 파일 형식 버전 (형식이 바뀌면 올림 → 기존 파일 무효화)
+INDEX_VERSION = 1
+_MAGIC = b"KWIDX001"
+
+# 전이 키 = 상태 << 21 | 문자 코드 (유니코드 코드 포인트는 21비트 이내)
+_CHAR_BITS = 21
+
+# 인덱스 파일에 저장하는 배열 (이름, array typecode) - 저장 순서
+_ARRAYS = (
+    ("trans_keys", "Q"),
+    ("trans_targets", "I"),
+    ("fail", "I"),
+    ("out_offsets", "I"),
+    ("out_ids", "I"),
+    ("entry_offsets", "I"),
+    ("entry_cats", "I"),
+    ("entry_orders", "I"),
+)
+
+
+def keyword_set_hash(keywords: dict[str, list[str]]) -> str:
+    """키워드 사전 해시 (카테고리/키워드 순서 포함)"""
+    payload = json.dumps([INDEX_VERSION, keywords], ensure_ascii=False).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+class KeywordMatcher:
+    """카테고리별 키워드 사전 → Aho-Corasick 오토마톤
+
+    인덱스 파일에는 상태 전이를 (상태 << 21 | 문자 코드, 다음 상태) 배열로,
+    나머지(실패 링크, 상태별 출력 패턴, 패턴별 키워드 위치)는 오프셋 + 값 배열로 저장한다.
+    """
+
+    def __init__(self, keywords: dict[str, list[str]], arrays: dict | None = None, always: list | None = None):
+        """
+        Args:
+            keywords: 카테고리별 키워드 사전
+            arrays: 인덱스 파일에서 읽은 배열 (None이면 keywords로 새로 만듦)
+            always: 빈 문자열 키워드 위치 [(카테고리 index, 순서), ...] (arrays와 함께 지정)
+        """
+        self.keywords = keywords
+        self.categories = list(keywords)
+        if arrays is None:
+            arrays, always = self._build(keywords)
+
+        self._arrays = arrays
+        self._always = [tuple(entry) for entry in always]
+        # 탐색용 상태별 전이 딕셔너리 (문자 → 다음 상태)
+        self._goto: list[dict[str, int]] = [{} for _ in range(len(arrays["fail"]))]
+        mask = (1 << _CHAR_BITS) - 1
+        for key, next_state in zip(arrays["trans_keys"].tolist(), arrays["trans_targets"].tolist()):
+            self._goto[key >> _CHAR_BITS][chr(key & mask)] = next_state
+        self._fail = arrays["fail"].tolist()
+        # 상태별 출력 패턴 id, 패턴별 (카테고리 index, 순서) - 탐색 중 바로 쓸 수 있게 튜플로
+        out_offsets, out_ids = arrays["out_offsets"].tolist(), arrays["out_ids"].tolist()
+        self._out = [tuple(out_ids[start:end]) for start, end in zip(out_offsets, out_offsets[1:])]
+        entry_offsets = arrays["entry_offsets"].tolist()
+        entries = list(zip(arrays["entry_cats"].tolist(), arrays["entry_orders"].tolist()))
+        self._entries = [entries[start:end] for start, end in zip(entry_offsets, entry_offsets[1:])]
+
+    @staticmethod
+    def _build(keywords: dict[str, list[str]]) -> tuple[dict[str, array], list]:
+        """키워드 사전 → 오토마톤 배열"""
+        goto: list[dict[str, int]] = [{}]
+        pattern_at: list[int | None] = [None]
+        # 패턴(소문자 키워드) id → [(카테고리 index, 카테고리 내 순서), ...]
+        entries: list[list[tuple[int, int]]] = []
+        always = []
+
+        pattern_ids: dict[str, int] = {}
+        for cat_index, category in enumerate(keywords):
+            for order, keyword in enumerate(keywords[category]):
+                pattern = keyword.lower()
+                if not pattern:
+                    always.append((cat_index, order))
+                    continue
+                if pattern not in pattern_ids:
+                    pattern_ids[pattern] = len(entries)
+                    entries.append([])
+                    state = 0
+                    for ch in pattern:
+                        next_state = goto[state].get(ch)
+                        if next_state is None:
+                            next_state = len(goto)
+                            goto[state][ch] = next_state
+                            goto.append({})
+                            pattern_at.append(None)
+                        state = next_state
+                    pattern_at[state] = pattern_ids[pattern]
+                entries[pattern_ids[pattern]].append((cat_index, order))
+
+        # BFS로 실패 링크 계산, 출력 패턴은 실패 링크 쪽 패턴까지 합쳐 둠
+        fail = [0] * len(goto)
+        out = [() if pattern_id is None else (pattern_id,) for pattern_id in pattern_at]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                link = goto[link].get(ch, 0)
+                if link == next_state:
+                    link = 0
+
+                fail[next_state] = link
+                if out[link]:
+                    out[next_state] = out[next_state] + out[link]
+
+        arrays = {name: array(typecode) for name, typecode in _ARRAYS}
+        for state, transitions in enumerate(goto):
+            for ch, next_state in transitions.items():
+                arrays["trans_keys"].append(state << _CHAR_BITS | ord(ch))
+                arrays["trans_targets"].append(next_state)
+        arrays["fail"].extend(fail)
+
+        arrays["out_offsets"].append(0)
+        for pattern_ids_at_state in out:
+            arrays["out_ids"].extend(pattern_ids_at_state)
+            arrays["out_offsets"].append(len(arrays["out_ids"]))
+
+        arrays["entry_offsets"].append(0)
+        for pattern_entries in entries:
+            for cat_index, order in pattern_entries:
+                arrays["entry_cats"].append(cat_index)
+                arrays["entry_orders"].append(order)
+            arrays["entry_offsets"].append(len(arrays["entry_cats"]))
+
+        return arrays, always
+
+    def find_patterns(self, text: str) -> set[int]:
+        """text(소문자)에 들어 있는 패턴 id 집합"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+    @property
+    def num_patterns(self) -> int:
+        """서로 다른 패턴(소문자 키워드) 수"""
+        return len(self._entries)
+
+    def pattern_entries(self, pattern_id: int) -> list[tuple[int, int]]:
+        """패턴 id → [(카테고리 index, 카테고리 내 순서), ...]"""
+        return self._entries[pattern_id]
+
+    @property
+    def always_entries(self) -> list[tuple[int, int]]:
+        """빈 문자열 키워드 (모든 텍스트에 매칭)"""
+        return self._always
+
+    def category_keywords(self, pattern_ids, cat_index: int) -> list[str]:
+        """매칭된 패턴 중 한 카테고리의 키워드 (match()[category]와 동일)"""
+        orders = [order for cat, order in self._always if cat == cat_index]
+        for pattern_id in pattern_ids:
+            orders.extend(order for cat, order in self._entries[pattern_id] if cat == cat_index)
+        orders.sort()
+        keywords = self.keywords[self.categories[cat_index]]
+        return [keywords[order] for order in orders]
+
+    def match(self, text: str) -> dict[str, list[str]]:
+        """text(소문자)에서 매칭된 키워드 (카테고리별, 매칭 없는 카테고리는 빈 리스트)"""
+        hits = list(self._always)
+        for pattern_id in self.find_patterns(text):
+            hits.extend(self._entries[pattern_id])
+        hits.sort()
+
+        matched = {category: [] for category in self.categories}
+        for cat_index, order in hits:
+            category = self.categories[cat_index]
+            matched[category].append(self.keywords[category][order])
+        return matched
+
+    def save(self, path: Path, key: str) -> None:
+        """인덱스 파일 저장
+
+        형식: MAGIC | 헤더 길이(8바이트) | JSON 헤더 | 8바이트 정렬된 배열들 (_ARRAYS 순서)
+        """
+        header = json.dumps({
+            "version": INDEX_VERSION,
+            "key": key,
+            "always": self._always,
+            "sizes": [len(self._arrays[name]) for name, _ in _ARRAYS],
+        }).encode()
+        header += b" " * (-(len(_MAGIC) + 8 + len(header)) % 8)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for name, _ in _ARRAYS:
+                data = self._arrays[name].tobytes()
+                f.write(data)
+                f.write(b"\0" * (-len(data) % 8))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, keywords: dict[str, list[str]], key: str) -> "KeywordMatcher":
+        """인덱스 파일 로드 (mmap → 배열 그대로 사용, 파이썬 객체 생성은 최소화)
+
+        Raises:
+            OSError: 파일 없음
+            ValueError: 형식/버전/키가 맞지 않는 파일
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(buffer)
+        if bytes(view[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError(f"키워드 인덱스 형식이 아닙니다: {path}")
+        offset = len(_MAGIC) + 8
+        header_size = struct.unpack("<Q", view[len(_MAGIC):offset])[0]
+        header = json.loads(bytes(view[offset:offset + header_size]))
+        if header.get("version") != INDEX_VERSION or header.get("key") != key:
+            raise ValueError(f"키워드 인덱스가 현재 키워드 사전과 다릅니다: {path}")
+        offset += header_size
+
+        arrays = {}
+        for (name, typecode), size in zip(_ARRAYS, header["sizes"]):
+            nbytes = size * array(typecode).itemsize
+            if offset + nbytes > len(view):
+                raise ValueError(f"키워드 인덱스 파일이 손상되었습니다: {path}")
+            arrays[name] = view[offset:offset + nbytes].cast(typecode)
+            offset += nbytes + (-nbytes % 8)
+
+        return cls(keywords, arrays=arrays, always=header["always"])
+
+
+def load_keyword_index(
+    keywords: dict[str, list[str]] = KEYWORDS,
+    index_dir: str | Path | None = None,
+    rebuild: bool = False,
+) -> KeywordMatcher:
+    """디스크 인덱스에서 매처 로드 (없거나 키워드 사전이 바뀌었으면 새로 만들어 저장)
+
+    Args:
+        keywords: 카테고리별 키워드 사전
+        index_dir: 인덱스 디렉토리 (기본값: KEYWORD_INDEX_DIR 환경변수 또는 backend/.cache/keyword_index)
+        rebuild: True면 기존 인덱스를 무시하고 다시 만듦
+    """
+    index_dir = Path(index_dir or os.getenv("KEYWORD_INDEX_DIR") or DEFAULT_INDEX_DIR)
+    key = keyword_set_hash(keywords)
+    path = index_dir / f"keywords-{key}.idx"
+
+    if not rebuild:
+        try:
+            return KeywordMatcher.load(path, keywords, key)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"[WARNING] 키워드 인덱스 로드 실패, 다시 생성: {e}")
+
+    matcher = KeywordMatcher(keywords)
+    try:
+        matcher.save(path, key)
+        # 이전 키워드 사전의 인덱스 정리
+        for stale in index_dir.glob("keywords-*.idx"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"[WARNING] 키워드 인덱스 저장 실패: {e}")
+    return matcher
+
+
+_default_matcher: KeywordMatcher | None = None
+
+
+def get_keyword_matcher(keywords: dict[str, list[str]] | None = None) -> KeywordMatcher:
+    """매처 반환 (기본 KEYWORDS 매처는 디스크 인덱스에서 한 번만 로드해 공유)"""
+    global _default_matcher
+    if keywords is not None and keywords is not KEYWORDS:
+        return KeywordMatcher(keywords)
+    if _default_matcher is None:
+        _default_matcher = load_keyword_index()
+    return _default_matcher
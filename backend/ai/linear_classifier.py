@@ -0,0 +1,276 @@
+"""해시 문자 n-gram + 나이브 베이즈 선형 분류기 (NumPy, CPU 전용)
+
+- 특징: 소문자 제목(+본문)의 문자 n-gram을 n_features개 버킷으로 해싱 (해시는 NumPy로 일괄 계산)
+- 모델: 다항 나이브 베이즈 (버킷 × 카테고리 로그 확률 + 카테고리 사전 확률)
+- 학습 데이터: 수동 분류 파일(parse_classified_file) + 규칙 분류기의 고신뢰도 결과
+- 저장: .npz (float32 가중치, 압축)
+
+배치 추론은 전체 배치의 n-gram을 한 번에 해싱하고 bincount로 점수를 합산한다.
+"""
+import os
+from pathlib import Path
+
+import numpy as np
+
+from .base_classifier import BaseClassifier, ClassificationResult, CATEGORIES
+from .exporter import parse_classified_file
+from .rule_classifier import RuleBasedClassifier
+
+
+DEFAULT_MODEL_PATH = Path(__file__).resolve().parent.parent / ".cache" / "linear_classifier.npz"
+
+# 구버전 export 파일의 카테고리 이름 → 현재 이름
+_CATEGORY_ALIASES = {"general": "issue"}
+
+_HASH_MULTIPLIER = np.uint64(1000003)
+_HASH_MIX = np.uint64(0x9E3779B97F4A7C15)
+
+
+def hash_ngrams(texts: list[str], n_features: int, ngram_range: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    """텍스트 목록 → 문자 n-gram 해시 버킷 (COO)
+
+    텍스트마다 앞뒤에 공백을 붙여 단어 경계 n-gram도 만든다.
+    텍스트를 구분자(\\0)로 이어 붙여 한 번에 계산하고, 구분자를 포함하는 n-gram은 버린다.
+
+    Returns:
+        (rows, buckets) - rows[i]번째 텍스트에 buckets[i] 버킷 n-gram이 하나 있음
+    """
+    joined = "\0".join(f" {text} " for text in texts)
+    codes = np.frombuffer(joined.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    is_separator = codes == 0
+    row_of = np.cumsum(is_separator) - is_separator
+    separators_before = np.concatenate(([0], np.cumsum(is_separator)))
+
+    rows, buckets = [], []
+    for n in range(ngram_range[0], ngram_range[1] + 1):
+        count = len(codes) - n + 1
+        if count <= 0:
+            continue
+        h = np.zeros(count, dtype=np.uint64)
+        for k in range(n):
+            h = h * _HASH_MULTIPLIER + codes[k:k + count]
+        h = (h ^ np.uint64(n)) * _HASH_MIX
+        h ^= h >> np.uint64(29)
+
+        valid = separators_before[n:n + count] == separators_before[:count]
+        rows.append(row_of[:count][valid])
+        buckets.append((h[valid] % np.uint64(n_features)).astype(np.intp))
+
+    if not rows:
+        return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+    return np.concatenate(rows).astype(np.intp), np.concatenate(buckets)
+
+
+class LinearClassifier(BaseClassifier):
+    """
+    해시 문자 n-gram 나이브 베이즈 분류기
+
+    - 신뢰도 = 최고 카테고리의 사후 확률
+    - 신뢰도가 임계값 미만이면 "issue"로 분류 (RuleBasedClassifier와 동일한 규칙)
+    - matched_keywords는 항상 빈 리스트
+    """
+
+    def __init__(
+        self,
+        confidence_threshold: float = 0.1,
+        n_features: int = 2 ** 16,
+        ngram_range: tuple[int, int] = (1, 3),
+        alpha: float = 0.1,
+        categories: list[str] = CATEGORIES,
+    ):
+        """
+        Args:
+            confidence_threshold: 이 값 미만이면 "issue"로 분류
+            n_features: 해시 버킷 수
+            ngram_range: 문자 n-gram 길이 범위
+            alpha: 라플라스 스무딩 값
+            categories: 분류 카테고리 (가중치 열 순서)
+        """
+        self.confidence_threshold = confidence_threshold
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.alpha = alpha
+        self.categories = list(categories)
+        # 학습 전에는 None
+        self.log_prior: np.ndarray | None = None
+        self.log_prob: np.ndarray | None = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self.log_prob is not None
+
+    def fit(self, texts: list[str], labels: list[str], sample_weight: list[float] | None = None) -> "LinearClassifier":
+        """학습 (texts는 RuleBasedClassifier.match_text 형식의 소문자 텍스트)"""
+        label_index = {category: i for i, category in enumerate(self.categories)}
+        y = np.array([label_index[label] for label in labels], dtype=np.intp)
+        weights = np.ones(len(texts)) if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+
+        n_classes = len(self.categories)
+        rows, buckets = hash_ngrams(texts, self.n_features, self.ngram_range)
+        counts = np.bincount(
+            buckets * n_classes + y[rows],
+            weights=weights[rows],
+            minlength=self.n_features * n_classes,
+        ).reshape(self.n_features, n_classes)
+
+        class_weight = np.bincount(y, weights=weights, minlength=n_classes)
+        smoothed_prior = class_weight + self.alpha
+        self.log_prior = np.log(smoothed_prior / smoothed_prior.sum())
+
+        smoothed = counts + self.alpha
+        self.log_prob = (np.log(smoothed) - np.log(smoothed.sum(axis=0))).astype(np.float32)
+        return self
+
+    def predict_proba(self, texts: list[str]) -> np.ndarray:
+        """텍스트 목록 → (텍스트 수, 카테고리 수) 사후 확률"""
+        if not self.is_trained:
+            raise ValueError("학습되지 않은 모델입니다. fit() 또는 load()를 먼저 호출하세요.")
+
+        n_texts, n_classes = len(texts), len(self.categories)
+        rows, buckets = hash_ngrams(texts, self.n_features, self.ngram_range)
+        cells = rows[:, None] * n_classes + np.arange(n_classes)
+        scores = np.bincount(
+            cells.ravel(),
+            weights=self.log_prob[buckets].ravel(),
+            minlength=n_texts * n_classes,
+        ).reshape(n_texts, n_classes) + self.log_prior
+
+        scores -= scores.max(axis=1, keepdims=True)
+        proba = np.exp(scores)
+        return proba / proba.sum(axis=1, keepdims=True)
+
+    def _result(self, proba: np.ndarray) -> ClassificationResult:
+        best = int(proba.argmax())
+        confidence = float(proba[best])
+        category = self.categories[best] if confidence >= self.confidence_threshold else "issue"
+        return ClassificationResult(category=category, confidence=confidence, matched_keywords=[])
+
+    def classify(self, title: str, content: str | None = None) -> ClassificationResult:
+        """게시글 하나 분류"""
+        return self._result(self.predict_proba([RuleBasedClassifier.match_text(title, content)])[0])
+
+    def classify_batch(self, posts: list[dict], workers: int = 1) -> list[dict]:
+        """
+        여러 게시글 일괄 분류 (배치 전체를 한 번에 추론)
+
+        Args:
+            posts: 게시글 리스트
+            workers: RuleBasedClassifier와 호환용 (사용하지 않음)
+        """
+        if not posts:
+            return []
+
+        texts = [RuleBasedClassifier.match_text(post.get("title", ""), post.get("content")) for post in posts]
+        results = []
+        for post, proba in zip(posts, self.predict_proba(texts)):
+            result = self._result(proba)
+            post_copy = post.copy()
+            post_copy["category"] = result.category
+            post_copy["confidence"] = result.confidence
+            post_copy["matched_keywords"] = result.matched_keywords
+            results.append(post_copy)
+        return results
+
+    def summarize(self, title: str, content: str | None = None) -> str:
+        """선형 분류기에서는 요약 불가 - 제목 반환"""
+        return title
+
+    def save(self, path: str | Path | None = None) -> Path:
+        """가중치 저장 (.npz)"""
+        if not self.is_trained:
+            raise ValueError("학습되지 않은 모델은 저장할 수 없습니다.")
+
+        path = Path(path or os.getenv("LINEAR_MODEL_PATH") or DEFAULT_MODEL_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                log_prob=self.log_prob,
+                log_prior=self.log_prior,
+                categories=np.array(self.categories),
+                ngram_range=np.array(self.ngram_range),
+                alpha=np.array(self.alpha),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path | None = None, confidence_threshold: float = 0.1) -> "LinearClassifier":
+        """저장된 가중치로 분류기 생성"""
+        path = Path(path or os.getenv("LINEAR_MODEL_PATH") or DEFAULT_MODEL_PATH)
+        with np.load(path) as data:
+            classifier = cls(
+                confidence_threshold=confidence_threshold,
+                n_features=data["log_prob"].shape[0],
+                ngram_range=tuple(int(n) for n in data["ngram_range"]),
+                alpha=float(data["alpha"]),
+                categories=[str(category) for category in data["categories"]],
+            )
+            classifier.log_prob = data["log_prob"]
+            classifier.log_prior = data["log_prior"]
+        return classifier
+
+
+def build_training_set(
+    labelled_files: list[str | Path],
+    posts: list[dict] | None = None,
+    min_rule_confidence: float = 2 / 3,
+    manual_weight: float = 3.0,
+) -> tuple[list[str], list[str], list[float]]:
+    """
+    학습 데이터 구성
+
+    Args:
+        labelled_files: 수동 분류 완료된 export 파일
+        posts: 규칙 분류기로 라벨을 붙일 게시글 (예: raw_posts)
+        min_rule_confidence: 규칙 분류 결과를 학습에 쓸 최소 신뢰도 (기본: 키워드 2개 이상)
+        manual_weight: 수동 분류 샘플 가중치 (규칙 분류 샘플은 1.0)
+
+    Returns:
+        (texts, labels, sample_weight)
+    """
+    texts, labels, weights = [], [], []
+    manual_urls = set()
+
+    for filepath in labelled_files:
+        for item in parse_classified_file(str(filepath)):
+            category = _CATEGORY_ALIASES.get(item["category"], item["category"])
+            if category not in CATEGORIES or not item.get("title"):
+                continue
+            texts.append(RuleBasedClassifier.match_text(item["title"], None))
+            labels.append(category)
+            weights.append(manual_weight)
+            manual_urls.add(item.get("url"))
+
+    if posts:
+        rule_classifier = RuleBasedClassifier(min_rule_confidence)
+        for post in rule_classifier.classify_batch(posts):
+            if post["confidence"] < min_rule_confidence or post.get("url") in manual_urls:
+                continue
+            texts.append(RuleBasedClassifier.match_text(post.get("title", ""), post.get("content")))
+            labels.append(post["category"])
+            weights.append(1.0)
+
+    return texts, labels, weights
+
+
+def train_linear_classifier(
+    labelled_files: list[str | Path],
+    posts: list[dict] | None = None,
+    path: str | Path | None = None,
+    **options,
+) -> LinearClassifier:
+    """수동 분류 파일 + 규칙 분류 고신뢰도 결과로 학습 후 저장
+
+    Args:
+        labelled_files: 수동 분류 완료된 export 파일
+        posts: 규칙 분류기로 라벨을 붙일 게시글
+        path: 모델 저장 경로 (기본값: LINEAR_MODEL_PATH 환경변수 또는 backend/.cache/linear_classifier.npz)
+        options: LinearClassifier 생성 옵션
+    """
+    texts, labels, weights = build_training_set(labelled_files, posts)
+    if not texts:
+        raise ValueError("학습 데이터가 없습니다. (수동 분류 파일 또는 게시글 필요)")
+
+    classifier = LinearClassifier(**options).fit(texts, labels, weights)
+    classifier.save(path)
+    return classifier
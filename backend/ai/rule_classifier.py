@@ -1,43 +1,101 @@
 """규칙 기반 키워드 매칭 분류기"""
+import os
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator
+
 from .base_classifier import BaseClassifier, ClassificationResult
 from .keywords import KEYWORDS, CATEGORY_PRIORITY
+from .keyword_matcher import get_keyword_matcher
+from .batch_scorer import SparseKeywordScorer
+from .classification_cache import ClassificationCache
+from .cooccurrence_index import CooccurrenceIndex
+from .exporter import UncertainPostWriter
 
 
 class RuleBasedClassifier(BaseClassifier):
     """
     키워드 매칭 기반 분류기 (무료)
 
-    - 키워드 매칭으로 카테고리 결정
+    - 키워드 매칭으로 카테고리 결정 (Aho-Corasick 매처로 제목을 한 번만 탐색)
     - 신뢰도 = 매칭된 키워드 수 기반
     - 동점 시 CATEGORY_PRIORITY 순서로 선택
     - 매칭 없으면 "issue"로 분류
+    - 동시출현 인덱스가 있으면 애매한 키워드(AMBIGUOUS_KEYWORDS)는 문맥으로 정한 카테고리에 매칭
     """
 
-    def __init__(self, confidence_threshold: float = 0.1):
+    def __init__(self, confidence_threshold: float = 0.1, cooccurrence: CooccurrenceIndex | None = None):
         """
         Args:
             confidence_threshold: 이 값 미만이면 "uncertain"으로 분류
+            cooccurrence: 애매한 키워드 판정에 사용할 동시출현 인덱스
         """
         self.keywords = KEYWORDS
+        self.matcher = get_keyword_matcher(self.keywords)
         self.confidence_threshold = confidence_threshold
+        self.cooccurrence = cooccurrence
+        self._scorer: SparseKeywordScorer | None = None
 
-    def classify(self, title: str, content: str | None = None) -> ClassificationResult:
-        """키워드 매칭으로 분류"""
+    @staticmethod
+    def match_text(title: str, content: str | None) -> str:
+        """매칭 대상 텍스트 (소문자 제목 + 본문)"""
         text = title.lower()
         if content:
             text += " " + content.lower()
+        return text
+
+    def ambiguous_matches(self, text: str, matched: dict[str, list[str]] | None = None) -> list[str]:
+        """키워드 사전이 실제로 매칭한 애매한 키워드 (다른 키워드의 일부로만 들어있는 경우 제외)
+
+        Args:
+            text: 소문자 매칭 텍스트
+            matched: 이미 구한 매칭 결과 (None이면 애매한 키워드가 부분 문자열로 있을 때만 매칭)
+        """
+        if self.cooccurrence is None:
+            return []
+        hits = self.cooccurrence.ambiguous_hits(text)
+        if not hits:
+            return []
+        if matched is None:
+            matched = self.matcher.match(text)
+        found = {keyword for category_matched in matched.values() for keyword in category_matched}
+        return [keyword for keyword in hits if keyword in found]
 
-        scores = {}
-        matched = {}
+    def _context_categories(self, text: str, matched: dict[str, list[str]]) -> dict[str, str]:
+        """매칭된 애매한 키워드 → 문맥으로 판정한 카테고리 (판정 못 한 키워드 제외)"""
+        resolved = {}
+        for keyword in self.ambiguous_matches(text, matched):
+            category = self.cooccurrence.resolve(keyword, text)
+            if category is not None and category in matched:
+                resolved[keyword] = category
+        return resolved
 
-        for category, keywords in self.keywords.items():
-            category_matched = []
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    category_matched.append(keyword)
+    def uses_context(self, text: str) -> bool:
+        """분류 결과가 동시출현 인덱스(실행마다 바뀜)에 따라 달라지는지 (매칭된 애매한 키워드를 문맥으로 판정할 수 있을 때)"""
+        if self.cooccurrence is None or not self.cooccurrence.ambiguous_hits(text):
+            return False
+        return bool(self._context_categories(text, self.matcher.match(text)))
 
-            scores[category] = len(category_matched)
-            matched[category] = category_matched
+    def _resolve_ambiguous(self, text: str, matched: dict[str, list[str]]) -> dict[str, list[str]]:
+        """매칭된 애매한 키워드를 문맥으로 판정한 카테고리로 옮김 (판정 못 하면 키워드 사전 그대로)"""
+        for keyword, category in self._context_categories(text, matched).items():
+            for category_matched in matched.values():
+                if keyword in category_matched:
+                    category_matched.remove(keyword)
+            matched[category].append(keyword)
+        return matched
+
+    def classify(self, title: str, content: str | None = None) -> ClassificationResult:
+        """키워드 매칭으로 분류"""
+        text = self.match_text(title, content)
+
+        matched = self.matcher.match(text)
+        if self.cooccurrence is not None:
+            matched = self._resolve_ambiguous(text, matched)
+        scores = {category: len(category_matched) for category, category_matched in matched.items()}
 
         # 가장 많이 매칭된 카테고리 선택
         max_score = max(scores.values()) if scores else 0
@@ -77,6 +135,49 @@ class RuleBasedClassifier(BaseClassifier):
             matched_keywords=matched[best_category]
         )
 
+    def classify_batch(self, posts: list[dict], workers: int = 1) -> list[dict]:
+        """
+        여러 게시글 일괄 분류 (희소 행렬 연산, 결과는 classify와 동일)
+
+        카테고리 점수/동점 처리/신뢰도는 배치 전체를 NumPy로 한 번에 계산하고
+        게시글별로는 최고 카테고리의 매칭 키워드만 모은다.
+
+        Args:
+            posts: 게시글 리스트
+            workers: 프로세스 수 (1: 현재 프로세스, 0 또는 None: CPU 수), 결과 순서는 항상 입력 순서
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(posts) >= PARALLEL_MIN_POSTS:
+            return _classify_parallel(posts, self.confidence_threshold, workers, self.cooccurrence)
+
+        if self._scorer is None:
+            self._scorer = SparseKeywordScorer(self.matcher)
+
+        texts = [self.match_text(post.get("title", ""), post.get("content")) for post in posts]
+        scores = self._scorer.score(texts)
+
+        results = []
+        rows = zip(posts, scores.best.tolist(), scores.max_score.tolist(), scores.confidence.tolist(), scores.pattern_ids)
+        for text, (post, best, max_score, confidence, pattern_ids) in zip(texts, rows):
+            if self.uses_context(text):
+                # 애매한 키워드가 있는 게시글은 문맥 판정이 필요해 개별 분류
+                result = self.classify(post.get("title", ""), post.get("content"))
+                category, confidence, matched_keywords = result.category, result.confidence, result.matched_keywords
+            elif max_score == 0:
+                # 어떤 카테고리에도 매칭 안 되면 issue로 분류
+                category, confidence, matched_keywords = "issue", 0.3, []
+            else:
+                matched_keywords = self.matcher.category_keywords(pattern_ids, best)
+                # 신뢰도가 낮으면 issue로 분류
+                category = self.matcher.categories[best] if confidence >= self.confidence_threshold else "issue"
+
+            post_copy = post.copy()
+            post_copy["category"] = category
+            post_copy["confidence"] = confidence
+            post_copy["matched_keywords"] = matched_keywords
+            results.append(post_copy)
+        return results
+
     def summarize(self, title: str, content: str | None = None) -> str:
         """
         규칙 기반에서는 요약 불가 - 제목 반환
@@ -86,21 +187,90 @@ class RuleBasedClassifier(BaseClassifier):
         return title
 
 
-def classify_posts(posts: list[dict], confidence_threshold: float = 0.1) -> tuple[list[dict], list[dict]]:
+# 병렬 분류를 사용할 최소 게시글 수 (그보다 적으면 프로세스 생성 비용이 더 큼)
+PARALLEL_MIN_POSTS = 2000
+
+# 워커 프로세스의 분류기 (initializer에서 한 번 생성)
+_worker_classifier: RuleBasedClassifier | None = None
+
+
+def _init_worker(confidence_threshold: float, cooccurrence_path: str | None) -> None:
+    """워커 초기화 - fork면 부모의 키워드 매처를 그대로 물려받고, spawn이면 디스크 인덱스를 mmap으로 로드"""
+    global _worker_classifier
+    cooccurrence = CooccurrenceIndex(cooccurrence_path) if cooccurrence_path else None
+    _worker_classifier = RuleBasedClassifier(confidence_threshold, cooccurrence)
+
+
+def _classify_shard(posts: list[dict]) -> list[dict]:
+    return _worker_classifier.classify_batch(posts)
+
+
+def _classify_parallel(
+    posts: list[dict],
+    confidence_threshold: float,
+    workers: int,
+    cooccurrence: CooccurrenceIndex | None = None,
+) -> list[dict]:
+    """게시글을 조각으로 나눠 프로세스 풀에서 분류 (조각 순서대로 합침)
+
+    작업마다 전달되는 것은 게시글 조각뿐이고 키워드 인덱스는 워커마다 한 번만 준비된다.
+    """
+    # 부모에서 매처를 먼저 만들어 둠 (fork 시 상속, spawn 시 디스크 인덱스 보장)
+    get_keyword_matcher()
+
+    # 워커당 4조각 정도로 나눠 느린 조각이 있어도 부하가 고르게 분산되도록 함
+    shard_size = max(1, -(-len(posts) // (workers * 4)))
+    shards = [posts[i:i + shard_size] for i in range(0, len(posts), shard_size)]
+
+    start_methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in start_methods else "spawn")
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(shards)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(confidence_threshold, str(cooccurrence.path) if cooccurrence else None),
+    ) as executor:
+        return [post for shard in executor.map(_classify_shard, shards) for post in shard]
+
+
+def _run_classifier(
+    classifier: BaseClassifier,
+    posts: list[dict],
+    workers: int,
+    cache: ClassificationCache | None,
+) -> list[dict]:
+    """일괄 분류 (병렬 처리와 캐시는 키워드 사전 기반인 RuleBasedClassifier에만 적용)"""
+    if not isinstance(classifier, RuleBasedClassifier):
+        return classifier.classify_batch(posts)
+    if cache is not None:
+        return cache.classify_batch(classifier, posts, workers=workers)
+    return classifier.classify_batch(posts, workers=workers)
+
+
+def classify_posts(
+    posts: list[dict],
+    confidence_threshold: float = 0.1,
+    workers: int = 1,
+    cache: ClassificationCache | None = None,
+    classifier: BaseClassifier | None = None,
+) -> tuple[list[dict], list[dict]]:
     """
     게시글 분류 실행
 
     Args:
         posts: 크롤링된 게시글 리스트
         confidence_threshold: 신뢰도 임계값
+        workers: 분류 프로세스 수 (대량 재분류 시 0 또는 None: CPU 수만큼 병렬)
+        cache: 분류 결과 캐시 (지정 시 이전 실행에서 분류한 게시글은 다시 분류하지 않음)
+        classifier: 사용할 분류기 (기본: RuleBasedClassifier, 예: LinearClassifier.load())
 
     Returns:
         (classified_posts, uncertain_posts)
         - classified_posts: 분류 완료된 게시글
         - uncertain_posts: 신뢰도 낮은 게시글 (수동 분류 필요)
     """
-    classifier = RuleBasedClassifier(confidence_threshold)
-    classified = classifier.classify_batch(posts)
+    classifier = classifier or RuleBasedClassifier(confidence_threshold)
+    classified = _run_classifier(classifier, posts, workers, cache)
 
     certain = []
     uncertain = []
@@ -112,3 +282,65 @@ def classify_posts(posts: list[dict], confidence_threshold: float = 0.1) -> tupl
             uncertain.append(post)
 
     return certain, uncertain
+
+
+@dataclass
+class ClassificationStats:
+    """스트리밍 분류 중 누적되는 통계"""
+    # 신뢰도 임계값 이상 게시글의 카테고리별 수
+    categories: Counter = field(default_factory=Counter)
+    classified: int = 0
+    uncertain: int = 0
+
+    def add(self, post: dict, confidence_threshold: float) -> None:
+        """분류된 게시글 반영"""
+        if post["confidence"] >= confidence_threshold:
+            self.classified += 1
+            self.categories[post.get("category", "unknown")] += 1
+        else:
+            self.uncertain += 1
+
+
+def iter_classify_posts(
+    posts: Iterable[dict],
+    confidence_threshold: float = 0.1,
+    batch_size: int = 500,
+    cache: ClassificationCache | None = None,
+    stats: ClassificationStats | None = None,
+    uncertain_writer: UncertainPostWriter | None = None,
+    classifier: BaseClassifier | None = None,
+) -> Iterator[dict]:
+    """
+    게시글 스트리밍 분류 (입력 순서대로 분류된 게시글을 하나씩 반환)
+
+    입력을 batch_size개씩 읽어 일괄 분류하므로 메모리는 배치 크기만큼만 사용한다.
+    통계와 불확실 게시글 export는 게시글이 지나갈 때마다 갱신된다.
+
+    Args:
+        posts: 게시글 iterable (리스트, 제너레이터 등)
+        confidence_threshold: 신뢰도 임계값
+        batch_size: 한 번에 분류할 게시글 수
+        cache: 분류 결과 캐시
+        stats: 카테고리별/불확실 게시글 수를 누적할 통계
+        uncertain_writer: 신뢰도 임계값 미만 게시글을 쓸 writer
+        classifier: 사용할 분류기 (기본: RuleBasedClassifier)
+
+    Yields:
+        분류된 게시글 (category, confidence, matched_keywords 추가, 불확실 게시글 포함)
+    """
+    classifier = classifier or RuleBasedClassifier(confidence_threshold)
+    iterator = iter(posts)
+
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+
+        classified = _run_classifier(classifier, batch, 1, cache)
+
+        for post in classified:
+            if stats is not None:
+                stats.add(post, confidence_threshold)
+            if uncertain_writer is not None and post["confidence"] < confidence_threshold:
+                uncertain_writer.write(post)
+            yield post
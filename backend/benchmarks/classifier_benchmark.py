@@ -0,0 +1,253 @@
+"""
+분류기 처리량/지연 벤치마크 (오프라인)
+
+코퍼스 크기별로 RuleBasedClassifier.classify / classify_batch / classify_posts를 실행하고
+posts/sec, 게시글당 지연(p50/p99), 최대 메모리를 측정한다.
+키워드 사전 크기(KEYWORDS에서 카테고리별 앞쪽 일부만 사용)별 처리량도 측정한다.
+결과는 JSON으로 저장해 브랜치끼리 비교한다.
+
+- classify: 게시글마다 호출 시간을 재서 지연 분포 계산
+- classify_batch / classify_posts: batch_size개씩 호출하고 배치 시간 / 게시글 수를 게시글당 지연으로 사용
+- 최대 메모리: 시간 측정과 별도로 tracemalloc을 켜고 한 번 더 실행, 코퍼스 제외 (--no-memory로 생략)
+
+사용법:
+    python benchmarks/classifier_benchmark.py                       # 1k, 100k, 1M
+    python benchmarks/classifier_benchmark.py --sizes 1000,10000    # 크기 지정
+    python benchmarks/classifier_benchmark.py --corpus titles.txt   # 저장해 둔 실제 제목 사용
+    python benchmarks/classifier_benchmark.py --output result.json --no-memory
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai import RuleBasedClassifier, classify_posts, get_keyword_matcher
+from ai.keywords import KEYWORDS
+from benchmarks.corpus import synthetic_titles, load_titles, to_posts
+
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_DICTIONARY_FRACTIONS = [0.1, 0.25, 0.5, 1.0]
+DEFAULT_BATCH_SIZE = 1_000
+# 키워드 사전 크기 비교에 사용할 코퍼스 크기
+DICTIONARY_SWEEP_SIZE = 100_000
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def _arg_value(flag: str) -> str | None:
+    """명령행 인자 값 (--flag VALUE)"""
+    if flag in sys.argv:
+        index = sys.argv.index(flag)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return None
+
+
+def _git(*args: str) -> str | None:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict:
+    """비교용 실행 환경 정보"""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+        "git_commit": _git("rev-parse", "--short", "HEAD"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def keyword_subset(fraction: float, keywords: dict[str, list[str]] = KEYWORDS) -> dict[str, list[str]]:
+    """카테고리별 앞쪽 fraction 비율의 키워드만 남긴 사전"""
+    return {
+        category: words[:max(1, round(len(words) * fraction))]
+        for category, words in keywords.items()
+    }
+
+
+def make_classifier(keywords: dict[str, list[str]] = KEYWORDS) -> RuleBasedClassifier:
+    """지정한 키워드 사전을 쓰는 분류기"""
+    classifier = RuleBasedClassifier()
+    if keywords is not KEYWORDS:
+        classifier.keywords = keywords
+        classifier.matcher = get_keyword_matcher(keywords)
+    return classifier
+
+
+def _run_classify(classifier: RuleBasedClassifier, posts: list[dict], batch_size: int) -> np.ndarray:
+    latencies = np.empty(len(posts))
+    clock = time.perf_counter
+    for i, post in enumerate(posts):
+        started = clock()
+        classifier.classify(post["title"], post["content"])
+        latencies[i] = clock() - started
+    return latencies
+
+
+def _run_batched(call, posts: list[dict], batch_size: int) -> np.ndarray:
+    latencies = np.empty(len(posts))
+    for i in range(0, len(posts), batch_size):
+        batch = posts[i:i + batch_size]
+        started = time.perf_counter()
+        call(batch)
+        latencies[i:i + len(batch)] = (time.perf_counter() - started) / len(batch)
+    return latencies
+
+
+def _runners(classifier: RuleBasedClassifier) -> dict:
+    return {
+        "classify": lambda posts, batch_size: _run_classify(classifier, posts, batch_size),
+        "classify_batch": lambda posts, batch_size: _run_batched(classifier.classify_batch, posts, batch_size),
+        "classify_posts": lambda posts, batch_size: _run_batched(
+            lambda batch: classify_posts(batch, classifier=classifier), posts, batch_size
+        ),
+    }
+
+
+def measure(runner, posts: list[dict], batch_size: int, memory: bool) -> dict:
+    """한 방식의 처리량/지연/최대 메모리"""
+    gc.collect()
+    started = time.perf_counter()
+    latencies = runner(posts, batch_size)
+    elapsed = time.perf_counter() - started
+
+    result = {
+        "posts": len(posts),
+        "seconds": round(elapsed, 4),
+        "posts_per_sec": round(len(posts) / elapsed, 1) if elapsed else None,
+        "p50_us": round(float(np.percentile(latencies, 50)) * 1e6, 3),
+        "p99_us": round(float(np.percentile(latencies, 99)) * 1e6, 3),
+        "peak_memory_mb": None,
+    }
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            runner(posts, batch_size)
+            result["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 2)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmark(
+    sizes: list[int] = DEFAULT_SIZES,
+    fractions: list[float] = DEFAULT_DICTIONARY_FRACTIONS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    corpus_path: str | None = None,
+    memory: bool = True,
+) -> dict:
+    """
+    벤치마크 실행
+
+    Args:
+        sizes: 코퍼스 크기 목록
+        fractions: 키워드 사전 크기 비율 목록
+        batch_size: classify_batch / classify_posts 호출 단위
+        corpus_path: 제목 파일 (None이면 합성 코퍼스)
+        memory: 최대 메모리 측정 여부
+
+    Returns:
+        JSON으로 저장할 결과
+    """
+    def corpus(count: int) -> list[dict]:
+        titles = load_titles(corpus_path, count) if corpus_path else synthetic_titles(count)
+        return to_posts(titles)
+
+    report = {
+        "environment": environment(),
+        "config": {
+            "sizes": sizes,
+            "dictionary_fractions": fractions,
+            "batch_size": batch_size,
+            "corpus": corpus_path or "synthetic",
+            "memory": memory,
+        },
+        "throughput": [],
+        "dictionary_sweep": [],
+    }
+
+    classifier = make_classifier()
+    for size in sizes:
+        posts = corpus(size)
+        for method, runner in _runners(classifier).items():
+            result = {"size": size, "method": method, **measure(runner, posts, batch_size, memory)}
+            report["throughput"].append(result)
+            print(f"  [{size:>9,}] {method:<15} {result['posts_per_sec']:>12,.0f} posts/s"
+                  f"  p50 {result['p50_us']:>8.2f}us  p99 {result['p99_us']:>8.2f}us"
+                  + (f"  peak {result['peak_memory_mb']:.1f}MB" if result["peak_memory_mb"] is not None else ""))
+        del posts
+
+    sweep_size = min(DICTIONARY_SWEEP_SIZE, max(sizes))
+    posts = corpus(sweep_size)
+    for fraction in fractions:
+        keywords = keyword_subset(fraction)
+        started = time.perf_counter()
+        classifier = make_classifier(keywords)
+        build_seconds = time.perf_counter() - started
+
+        runner = _runners(classifier)["classify_batch"]
+        result = {
+            "fraction": fraction,
+            "keywords": sum(len(words) for words in keywords.values()),
+            "build_seconds": round(build_seconds, 4),
+            **measure(runner, posts, batch_size, memory=False),
+        }
+        report["dictionary_sweep"].append(result)
+        print(f"  [키워드 {result['keywords']:>5}개] classify_batch {result['posts_per_sec']:>12,.0f} posts/s"
+              f"  (매처 생성 {build_seconds * 1000:.1f}ms)")
+
+    return report
+
+
+def main():
+    sizes = [int(size) for size in _arg_value("--sizes").split(",")] if _arg_value("--sizes") else DEFAULT_SIZES
+    fractions = (
+        [float(fraction) for fraction in _arg_value("--fractions").split(",")]
+        if _arg_value("--fractions") else DEFAULT_DICTIONARY_FRACTIONS
+    )
+    batch_size = int(_arg_value("--batch-size") or DEFAULT_BATCH_SIZE)
+    memory = "--no-memory" not in sys.argv
+
+    print("=" * 50)
+    print("분류기 벤치마크")
+    print("=" * 50)
+
+    report = run_benchmark(sizes, fractions, batch_size, _arg_value("--corpus"), memory)
+
+    output = _arg_value("--output")
+    if output:
+        output = Path(output)
+    else:
+        env = report["environment"]
+        name = f"classifier-{env['git_branch'] or 'unknown'}-{env['git_commit'] or 'unknown'}-{datetime.now():%Y%m%d_%H%M%S}.json"
+        output = RESULTS_DIR / name.replace("/", "_")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+벤치마크용 게시글 제목 코퍼스 (오프라인)
+
+- synthetic_titles: KEYWORDS 키워드와 일반 단어를 섞은 합성 한국어 제목 (시드 고정이라 실행마다 같음)
+- load_titles: 한 줄에 제목 하나인 텍스트 파일 (실제 수집한 제목을 저장해 둔 것 등)
+"""
+
+import random
+from pathlib import Path
+
+from ai.keywords import KEYWORDS
+
+
+# 커뮤니티 제목에 흔한 일반 단어 (어떤 카테고리 키워드와도 겹치지 않게 유지)
+FILLER_WORDS = [
+    "오늘", "어제", "근황", "후기", "ㅋㅋㅋ", "진짜", "실화냐", "레전드", "요즘", "이거",
+    "보고", "왔다", "있음", "없음", "ㄷㄷ", "모음", "정리", "최근", "반응", "사진",
+    "영상", "현재", "상황", "역대급", "처음", "봤는데", "싶다", "어떰", "궁금", "질문",
+    "점심", "저녁", "출근", "퇴근", "주말", "산책", "동네", "친구", "회사", "우리",
+]
+
+
+def synthetic_titles(
+    count: int,
+    seed: int = 42,
+    keywords: dict[str, list[str]] = KEYWORDS,
+    keyword_ratio: float = 0.7,
+) -> list[str]:
+    """
+    합성 제목 생성
+
+    Args:
+        count: 제목 수
+        seed: 난수 시드
+        keywords: 키워드를 뽑을 사전
+        keyword_ratio: 키워드가 하나 이상 들어가는 제목 비율
+
+    Returns:
+        제목 리스트 (2~8단어, 키워드 0~3개)
+    """
+    rng = random.Random(seed)
+    vocabulary = [word for words in keywords.values() for word in words if word]
+
+    titles = []
+    for _ in range(count):
+        words = rng.choices(FILLER_WORDS, k=rng.randint(2, 6))
+        if vocabulary and rng.random() < keyword_ratio:
+            for word in rng.choices(vocabulary, k=rng.choice((1, 1, 1, 2, 2, 3))):
+                words.insert(rng.randint(0, len(words)), word)
+        titles.append(" ".join(words))
+    return titles
+
+
+def load_titles(path: str | Path, count: int | None = None) -> list[str]:
+    """제목 파일 로드 (count가 파일보다 크면 반복해서 채움)"""
+    titles = [line.strip() for line in Path(path).read_text(encoding="utf-8").splitlines() if line.strip()]
+    if not titles:
+        raise ValueError(f"제목이 없습니다: {path}")
+    if count is None:
+        return titles
+    return [titles[i % len(titles)] for i in range(count)]
+
+
+def to_posts(titles: list[str]) -> list[dict]:
+    """제목 → 크롤링 결과 형식의 게시글"""
+    return [
+        {
+            "source": "benchmark",
+            "title": title,
+            "url": f"https://example.com/{i}",
+            "content": None,
+            "views": i % 5000,
+            "likes": i % 97,
+        }
+        for i, title in enumerate(titles)
+    ]
@@ -0,0 +1,167 @@
+"""
+저장소 벤치마크 (오프라인, 임시 디렉터리의 SQLite 저장소)
+
+행 수별로 bulk_insert_raw_posts / bulk_upsert_rankings(BulkWriter + SQLiteBackend) 처리량과
+같은 행을 다시 저장하는 Upsert 처리량, get_rankings(전체/카테고리) 지연(p50/p99),
+delete_old_rankings 시간을 측정한다. 결과는 JSON으로 저장해 브랜치끼리 비교한다.
+
+사용법:
+    python benchmarks/storage_benchmark.py                        # 10k, 100k
+    python benchmarks/storage_benchmark.py --sizes 1000,1000000   # 크기 지정
+    python benchmarks/storage_benchmark.py --output result.json
+"""
+
+import sys
+import json
+import time
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai.base_classifier import CATEGORIES
+from storage import SQLiteBackend
+from supabase_client import bulk_insert_raw_posts, bulk_upsert_rankings
+from benchmarks.corpus import synthetic_titles, to_posts
+from benchmarks.classifier_benchmark import RESULTS_DIR, _arg_value, environment
+
+
+DEFAULT_SIZES = [10_000, 100_000]
+# get_rankings 반복 횟수
+QUERY_REPEATS = 200
+
+
+def make_rankings(posts: list[dict], seed: int = 42) -> list[dict]:
+    """게시글 → main.save_rankings 형식의 랭킹 (created_at 일부는 보존 기간 7일 밖)"""
+    rng = random.Random(seed)
+    categories = list(CATEGORIES)
+    now = datetime.utcnow()
+    return [
+        {
+            "keyword": post["title"][:200],
+            "category": rng.choice(categories),
+            "popularity_score": post["views"] + post["likes"] * 10,
+            "summary": post["title"],
+            "source_urls": [post["url"]],
+            "rank_change": 0,
+            "created_at": (now - timedelta(days=rng.randint(0, 14))).isoformat(),
+        }
+        for post in posts
+    ]
+
+
+def _write(write, rows: list[dict], backend: SQLiteBackend) -> dict:
+    result = write(rows, backend=backend)
+    return {
+        "rows": result.rows,
+        "written": result.written,
+        "failed": len(result.failed),
+        "batches": result.batches,
+        "seconds": round(result.seconds, 4),
+        "rows_per_sec": round(result.rows_per_sec, 1),
+    }
+
+
+def _query(call) -> dict:
+    latencies = np.empty(QUERY_REPEATS)
+    for i in range(QUERY_REPEATS):
+        started = time.perf_counter()
+        call()
+        latencies[i] = time.perf_counter() - started
+    return {
+        "repeats": QUERY_REPEATS,
+        "p50_ms": round(float(np.percentile(latencies, 50)) * 1e3, 3),
+        "p99_ms": round(float(np.percentile(latencies, 99)) * 1e3, 3),
+    }
+
+
+def run_size(size: int, directory: Path) -> dict:
+    """행 size개로 한 번 측정 (빈 DB에서 시작)"""
+    backend = SQLiteBackend(directory / f"storage-{size}.sqlite3")
+    try:
+        posts = to_posts(synthetic_titles(size))
+        # 합성 제목은 겹칠 수 있어 랭킹 ID(category + keyword)가 게시글마다 다르도록 URL을 붙임
+        rankings = make_rankings([{**post, "title": f"{post['title']} {post['url']}"} for post in posts])
+
+        result = {"size": size}
+        result["insert_raw_posts"] = _write(bulk_insert_raw_posts, posts, backend)
+        result["upsert_rankings"] = _write(bulk_upsert_rankings, rankings, backend)
+        # 같은 ID를 다시 저장 (ON CONFLICT DO UPDATE 경로)
+        result["reupsert_rankings"] = _write(bulk_upsert_rankings, rankings, backend)
+
+        result["get_rankings"] = _query(lambda: backend.get_rankings(limit=20))
+        result["get_rankings_category"] = _query(lambda: backend.get_rankings(category=CATEGORIES[0], limit=20))
+        result["get_raw_posts"] = _query(lambda: backend.get_raw_posts(limit=100))
+
+        # 다시 저장하면 updated_at이 현재 시각이라 일부를 과거로 되돌린 뒤 삭제
+        with backend._conn:
+            backend._conn.execute("UPDATE rankings SET updated_at = created_at")
+        started = time.perf_counter()
+        deleted = backend.delete_old_rankings(days=7)
+        result["delete_old_rankings"] = {"deleted": deleted, "seconds": round(time.perf_counter() - started, 4)}
+        return result
+    finally:
+        backend.close()
+
+
+def run_benchmark(sizes: list[int] = DEFAULT_SIZES) -> dict:
+    """
+    벤치마크 실행
+
+    Args:
+        sizes: 행 수 목록
+
+    Returns:
+        JSON으로 저장할 결과
+    """
+    report = {
+        "environment": environment(),
+        "config": {"sizes": sizes, "backend": SQLiteBackend.name, "query_repeats": QUERY_REPEATS},
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            result = run_size(size, Path(directory))
+            report["results"].append(result)
+            for name in ("insert_raw_posts", "upsert_rankings", "reupsert_rankings"):
+                stats = result[name]
+                print(f"  [{size:>9,}] {name:<22} {stats['rows_per_sec']:>12,.0f} rows/s"
+                      f"  ({stats['batches']}배치, 실패 {stats['failed']})")
+            for name in ("get_rankings", "get_rankings_category", "get_raw_posts"):
+                stats = result[name]
+                print(f"  [{size:>9,}] {name:<22} p50 {stats['p50_ms']:>7.3f}ms  p99 {stats['p99_ms']:>7.3f}ms")
+            stats = result["delete_old_rankings"]
+            print(f"  [{size:>9,}] delete_old_rankings    {stats['deleted']:>8,}개 삭제 ({stats['seconds']:.3f}초)")
+
+    return report
+
+
+def main():
+    sizes = [int(size) for size in _arg_value("--sizes").split(",")] if _arg_value("--sizes") else DEFAULT_SIZES
+
+    print("=" * 50)
+    print("저장소 벤치마크 (SQLite)")
+    print("=" * 50)
+
+    report = run_benchmark(sizes)
+
+    output = _arg_value("--output")
+    if output:
+        output = Path(output)
+    else:
+        env = report["environment"]
+        name = f"storage-{env['git_branch'] or 'unknown'}-{env['git_commit'] or 'unknown'}-{datetime.now():%Y%m%d_%H%M%S}.json"
+        output = RESULTS_DIR / name.replace("/", "_")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
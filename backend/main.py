@@ -1,7 +1,10 @@
 """크롤링 메인 스크립트"""
 import sys
 import io
+import time
+import asyncio
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 # Windows 콘솔 UTF-8 출력 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -11,22 +14,49 @@ from scrapers import (
     RuliwebScraper,
     PpomppuScraper,
     InvenScraper,
+    get_http_cache,
+    Cassette,
+    use_cassette,
+    IncrementalState,
+    rate_limiter_summary,
+)
+from supabase_client import (
+    bulk_insert_raw_posts,
+    bulk_upsert_rankings,
+    BulkWriteResult,
+    generate_uuid_from_string,
+    deduplicate_by_id,
+    prepare_raw_posts,
+    prepare_rankings,
+    flush_spool,
+    client_summary,
+)
+from row_digest import get_row_digest_store
+from write_spool import WriteSpool, DEFAULT_BACKEND as DEFAULT_SPOOL_BACKEND, get_write_spool
+from storage import StorageBackend, SupabaseBackend, get_storage_backend
+from ai import (
+    RuleBasedClassifier,
+    iter_classify_posts,
+    ClassificationStats,
+    UncertainPostWriter,
+    get_classification_cache,
+    get_cooccurrence_index,
+    build_cascade_classifier,
 )
-from supabase_client import insert_raw_posts, upsert_rankings, delete_old_rankings, generate_uuid_from_string, deduplicate_by_id
-from ai import classify_posts, export_uncertain_posts
 
 
-def filter_old_posts(posts: list[dict], max_age_days: int = 7) -> list[dict]:
+def filter_old_posts(posts: list[dict], max_age_days: int = 7, now: datetime | None = None) -> list[dict]:
     """7일 이상 된 글 제외
 
     Args:
         posts: 게시글 리스트
         max_age_days: 최대 허용 일수 (기본 7일)
+        now: 기준 시각 (기본: 현재 시각, 카세트 재생 시 녹화 시각)
 
     Returns:
         필터링된 게시글 리스트
     """
-    cutoff = datetime.now() - timedelta(days=max_age_days)
+    cutoff = (now or datetime.now()) - timedelta(days=max_age_days)
     filtered = []
     excluded = 0
 
@@ -59,8 +89,113 @@ def filter_old_posts(posts: list[dict], max_age_days: int = 7) -> list[dict]:
     return filtered
 
 
-def run_all_scrapers(pages: int = 1) -> dict:
-    """모든 크롤러 실행"""
+def _arg_value(flag: str) -> str | None:
+    """'--flag 값' 형식 인자의 값 (없으면 None)"""
+    if flag not in sys.argv:
+        return None
+    index = sys.argv.index(flag) + 1
+    if index >= len(sys.argv) or sys.argv[index].startswith("--"):
+        raise SystemExit(f"{flag} 뒤에 디렉토리를 지정해야 합니다.")
+    return sys.argv[index]
+
+
+def _take_page_posts(scraper, page: int, page_posts: list[dict], incremental: IncrementalState | None) -> tuple[list[dict], bool]:
+    """페이지 결과 정리 (증분 모드면 이미 본 게시글 제외)
+
+    Returns:
+        (posts, stop) - stop: 페이지 전체가 이미 본 게시글이라 다음 페이지 불필요
+    """
+    if incremental is None:
+        print(f"  - {scraper.source_name} 페이지 {page}: {len(page_posts)}개")
+        return page_posts, False
+
+    new_posts, exhausted = incremental.take_new(scraper.source_name, page_posts)
+    print(f"  - {scraper.source_name} 페이지 {page}: {len(page_posts)}개 (새 글 {len(new_posts)}개)")
+    if exhausted:
+        print(f"  [INCREMENTAL] {scraper.source_name}: 새 글 없음 → 페이지 {page}에서 중단")
+    return new_posts, exhausted
+
+
+def _run_scraper(scraper, pages: int, incremental: IncrementalState | None = None) -> tuple[list[dict], str | None]:
+    """단일 소스 크롤링 (페이지 순차 요청 → 호스트별 요청 간격 유지)
+
+    Returns:
+        (posts, error_msg) - 오류 없으면 error_msg는 None
+    """
+    try:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {scraper.source_name} 크롤링 시작...")
+        posts = []
+
+        for page in range(1, pages + 1):
+            # 서킷이 열린 소스는 남은 페이지 건너뜀
+            if scraper.circuit_breaker.is_open:
+                break
+            page_posts, stop = _take_page_posts(scraper, page, scraper.scrape(page=page), incremental)
+            posts.extend(page_posts)
+            if stop:
+                break
+
+        print(f"  [OK] {scraper.source_name}: {len(posts)}개 수집 완료")
+        return posts, None
+
+    except Exception as e:
+        error_msg = f"{scraper.source_name}: {str(e)}"
+        print(f"  [ERROR] {error_msg}")
+        return [], error_msg
+
+
+async def _arun_scraper(scraper, pages: int, incremental: IncrementalState | None = None) -> tuple[list[dict], str | None]:
+    """단일 소스 비동기 크롤링 (페이지 동시 요청, 호스트별 동시 요청 수는 세마포어로 제한)
+
+    증분 모드에서는 새 글이 없는 페이지에서 멈출 수 있도록 페이지를 순서대로 요청한다.
+    """
+    try:
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {scraper.source_name} 비동기 크롤링 시작...")
+        if incremental is None:
+            posts = await scraper.ascrape_pages(pages)
+        else:
+            posts = []
+            for page in range(1, pages + 1):
+                if scraper.circuit_breaker.is_open:
+                    break
+                page_posts, stop = _take_page_posts(scraper, page, await scraper.ascrape(page), incremental)
+                posts.extend(page_posts)
+                if stop:
+                    break
+        print(f"  [OK] {scraper.source_name}: {len(posts)}개 수집 완료")
+        return posts, None
+
+    except Exception as e:
+        error_msg = f"{scraper.source_name}: {str(e)}"
+        print(f"  [ERROR] {error_msg}")
+        return [], error_msg
+
+    finally:
+        await scraper.aclose()
+
+
+async def _arun_scrapers(scrapers: list, pages: int, incremental: IncrementalState | None = None) -> list[tuple[list[dict], str | None]]:
+    """모든 소스를 하나의 이벤트 루프에서 동시에 크롤링"""
+    return await asyncio.gather(*(_arun_scraper(scraper, pages, incremental) for scraper in scrapers))
+
+
+def run_all_scrapers(
+    pages: int = 1,
+    concurrent: bool = False,
+    max_workers: int | None = None,
+    use_async: bool = False,
+    incremental: IncrementalState | None = None,
+) -> dict:
+    """모든 크롤러 실행
+
+    Args:
+        pages: 소스별 크롤링 페이지 수
+        concurrent: True면 소스별로 스레드를 나눠 동시에 크롤링
+            (같은 소스의 페이지는 한 스레드에서 순차 요청하므로 호스트별 딜레이는 그대로 유지)
+        max_workers: 동시 실행 스레드 수 (기본: 소스 수)
+        use_async: True면 asyncio 경로(ascrape)로 모든 소스/페이지를 단일 스레드에서 동시에 크롤링
+        incremental: 증분 크롤링 상태 (지정 시 이미 본 게시글 제외, 새 글 없는 페이지에서 중단)
+    """
     scrapers = [
         DcinsideScraper(),
         RuliwebScraper(),
@@ -72,58 +207,101 @@ def run_all_scrapers(pages: int = 1) -> dict:
         "total": 0,
         "by_source": {},
         "errors": [],
+        "circuits": {},
     }
 
+    if use_async:
+        outcomes = asyncio.run(_arun_scrapers(scrapers, pages, incremental))
+    elif concurrent:
+        with ThreadPoolExecutor(max_workers=max_workers or len(scrapers)) as executor:
+            futures = [executor.submit(_run_scraper, scraper, pages, incremental) for scraper in scrapers]
+            outcomes = [future.result() for future in futures]
+    else:
+        outcomes = [_run_scraper(scraper, pages, incremental) for scraper in scrapers]
+
+    # 결과 집계는 스크래퍼 순서대로 (실행 모드와 무관하게 동일한 출력 순서)
     all_posts = []
+    for scraper, (posts, error_msg) in zip(scrapers, outcomes):
+        circuit = scraper.circuit_breaker.snapshot()
+        results["circuits"][scraper.source_name] = circuit
+        if circuit["state"] == "open":
+            results["errors"].append(
+                f"{scraper.source_name}: 서킷 open (실패 {circuit['failures']}회, 건너뛴 요청 {circuit['skipped']}개)"
+            )
+
+        if error_msg:
+            results["errors"].append(error_msg)
+            continue
 
-    for scraper in scrapers:
-        try:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] {scraper.source_name} 크롤링 시작...")
-            posts = []
+        results["by_source"][scraper.source_name] = len(posts)
+        results["total"] += len(posts)
+        all_posts.extend(posts)
 
-            for page in range(1, pages + 1):
-                page_posts = scraper.scrape(page=page)
-                posts.extend(page_posts)
-                print(f"  - 페이지 {page}: {len(page_posts)}개")
+    return results, all_posts
 
-            results["by_source"][scraper.source_name] = len(posts)
-            results["total"] += len(posts)
-            all_posts.extend(posts)
 
-            print(f"  [OK] {scraper.source_name}: {len(posts)}개 수집 완료")
+def _print_progress(table: str):
+    """BulkWriter 진행 상황 출력 콜백"""
+    return lambda done, total: print(f"  {table} 저장: {done}/{total}")
 
-        except Exception as e:
-            error_msg = f"{scraper.source_name}: {str(e)}"
-            results["errors"].append(error_msg)
-            print(f"  [ERROR] {error_msg}")
 
-    return results, all_posts
+def _report_bulk_write(result: BulkWriteResult) -> bool:
+    """대량 저장 결과 출력 (모든 행 저장 시 True)"""
+    print(
+        f"  {result.table}: {result.rows_per_sec:,.0f} rows/s"
+        f" ({result.seconds:.2f}초, 배치 {result.batches}개, 재시도 {result.retries}회, 분할 {result.splits}회)"
+    )
+    if result.skipped:
+        print(f"  {result.table}: 변경 없음 {result.skipped}개 건너뜀")
+    if result.ok:
+        print(f"[OK] {result.table}: {result.written}개 저장 완료")
+        return True
 
+    print(f"[ERROR] {result.table}: {len(result.failed) + len(result.deferred)}/{result.rows}개 저장 실패")
+    for row, error in (result.failed + result.deferred)[:5]:
+        print(f"  - {row.get('id')}: {error[:200]}")
+    return False
 
-def save_raw_posts(posts: list[dict]) -> bool:
-    """raw_posts 테이블에 저장"""
+
+def _row_digests(backend: StorageBackend | None):
+    """행 해시 저장소 (Supabase에 저장한 내용 기준이라 Supabase에 저장할 때만 사용)"""
+    if backend is not None and backend.name != SupabaseBackend.name:
+        return None
+    return get_row_digest_store()
+
+
+def _spool_backend(backend: StorageBackend | None) -> str:
+    """스풀 행에 기록할 저장소 이름 (backend=None은 Supabase)"""
+    return backend.name if backend is not None else DEFAULT_SPOOL_BACKEND
+
+
+def save_raw_posts(posts: list[dict], spool: WriteSpool | None = None, backend: StorageBackend | None = None) -> bool:
+    """raw_posts 테이블에 저장 (spool 지정 시 스풀에만 기록하고 flush_write_spool에서 반영)"""
     if not posts:
         print("저장할 게시글이 없습니다.")
         return False
 
     try:
-        batch_size = 50
-        for i in range(0, len(posts), batch_size):
-            batch = posts[i:i + batch_size]
-            insert_raw_posts(batch)
-            print(f"  raw_posts 저장: {i + len(batch)}/{len(posts)}")
-
-        print(f"[OK] raw_posts: {len(posts)}개 저장 완료")
-        return True
+        if spool is not None:
+            count = spool.append(
+                "raw_posts", deduplicate_by_id(prepare_raw_posts(posts)), backend=_spool_backend(backend)
+            )
+            print(f"[SPOOL] raw_posts: {count}개 기록")
+            return True
+
+        result = bulk_insert_raw_posts(
+            posts, digests=_row_digests(backend), backend=backend, on_progress=_print_progress("raw_posts")
+        )
+        return _report_bulk_write(result)
 
     except Exception as e:
         print(f"[ERROR] raw_posts 저장 실패: {e}")
         return False
 
 
-def save_rankings(posts: list[dict]) -> bool:
+def save_rankings(posts: list[dict], spool: WriteSpool | None = None, backend: StorageBackend | None = None) -> bool:
     """
-    분류된 게시글을 rankings 테이블에 저장
+    분류된 게시글을 rankings 테이블에 저장 (spool 지정 시 스풀에만 기록)
 
     posts 필드를 rankings 스키마에 맞게 변환:
     - title -> keyword
@@ -157,15 +335,18 @@ def save_rankings(posts: list[dict]) -> bool:
             print("저장할 랭킹이 없습니다. (모든 게시글 신뢰도 낮음)")
             return False
 
-        # Upsert 실행
-        batch_size = 50
-        for i in range(0, len(rankings), batch_size):
-            batch = rankings[i:i + batch_size]
-            upsert_rankings(batch)
-            print(f"  rankings 저장: {i + len(batch)}/{len(rankings)}")
+        if spool is not None:
+            count = spool.append(
+                "rankings", deduplicate_by_id(prepare_rankings(rankings)), backend=_spool_backend(backend)
+            )
+            print(f"[SPOOL] rankings: {count}개 기록")
+            return True
 
-        print(f"[OK] rankings: {len(rankings)}개 Upsert 완료")
-        return True
+        # Upsert 실행
+        result = bulk_upsert_rankings(
+            rankings, digests=_row_digests(backend), backend=backend, on_progress=_print_progress("rankings")
+        )
+        return _report_bulk_write(result)
 
     except Exception as e:
         print(f"[ERROR] rankings 저장 실패: {e}")
@@ -174,36 +355,104 @@ def save_rankings(posts: list[dict]) -> bool:
         return False
 
 
-def run_classification(posts: list[dict]) -> tuple[list[dict], list[dict]]:
-    """게시글 분류 실행"""
+def run_classification(posts: list[dict], persist: bool = True) -> list[dict]:
+    """게시글 분류 실행 (스트리밍 분류 - 신뢰도 임계값 이상 게시글만 모음)
+
+    Args:
+        posts: 게시글
+        persist: False면 분류 캐시와 동시출현 인덱스 학습을 사용하지 않음 (카세트 재생 - 운영 상태를 바꾸지 않음)
+    """
     print("\n--- AI 분류 시작 ---")
 
-    classified, uncertain = classify_posts(posts, confidence_threshold=0.1)
+    confidence_threshold = 0.1
+    cache = get_classification_cache() if persist else None
+    stats = ClassificationStats()
+
+    # 애매한 키워드는 이전 실행에서 쌓인 문맥 동시출현 인덱스로 판정
+    cooccurrence = get_cooccurrence_index()
+
+    # 학습된 선형 분류기가 있으면 불확실/애매한 게시글만 예산 안에서 다시 분류
+    cascade = build_cascade_classifier(confidence_threshold, cache=cache, cooccurrence=cooccurrence)
+    classifier = cascade or RuleBasedClassifier(confidence_threshold, cooccurrence)
+
+    # 불확실 게시글은 분류되는 대로 export 파일에 기록
+    with UncertainPostWriter() as uncertain_writer:
+        classified = [
+            post
+            for post in iter_classify_posts(
+                posts,
+                confidence_threshold=confidence_threshold,
+                cache=cache,
+                stats=stats,
+                uncertain_writer=uncertain_writer,
+                classifier=classifier,
+            )
+            if post["confidence"] >= confidence_threshold
+        ]
 
     # 분류 결과 출력
-    categories = {}
-    for post in classified:
-        cat = post.get("category", "unknown")
-        categories[cat] = categories.get(cat, 0) + 1
-
-    print(f"분류 완료: {len(classified)}개")
-    for cat, count in sorted(categories.items()):
+    print(f"분류 완료: {stats.classified}개")
+    for cat, count in sorted(stats.categories.items()):
         print(f"  - {cat}: {count}개")
 
-    print(f"불확실: {len(uncertain)}개")
+    print(f"불확실: {stats.uncertain}개")
+
+    if cascade is not None:
+        cascade_stats = cascade.stats.summary()
+        for stage in ("rule", "escalated"):
+            stage_stats = cascade_stats[stage]
+            print(f"  [{stage}] {stage_stats['posts']}개, {stage_stats['seconds']:.3f}초 ({stage_stats['ms_per_post']:.3f}ms/개)")
+        print(f"  재분류 대상 {cascade_stats['candidates']}개 중 예산 초과 {cascade_stats['over_budget']}개, 느린 분류기 결과 사용 {cascade_stats['replaced']}개")
+
+    if cache is not None:
+        cache_stats = cache.summary()
+        print(f"분류 캐시: hit {cache_stats['hit']} / miss {cache_stats['miss']} (hit rate {cache_stats['hit_rate']:.0%})")
+
+    # 이번 실행 결과로 동시출현 인덱스 증분 갱신
+    if cooccurrence is not None and persist:
+        learned = cooccurrence.learn(classified)
+        if learned:
+            print(f"동시출현 인덱스: {learned}건 학습")
 
     # 불확실 게시글 export
-    if uncertain:
-        filepath = export_uncertain_posts(uncertain)
-        print(f"\n[EXPORT] 수동 분류 필요: {filepath}")
+    if uncertain_writer.filepath:
+        print(f"\n[EXPORT] 수동 분류 필요: {uncertain_writer.filepath}")
+
+    return classified
 
-    return classified, uncertain
 
+def flush_write_spool(spool: WriteSpool, backend: StorageBackend | None = None) -> bool:
+    """스풀을 저장소에 반영 (이전 실행에서 남은 행 포함, 모두 반영되면 True)"""
+    try:
+        results = flush_spool(spool, digests=_row_digests(backend), backend=backend)
+    except Exception as e:
+        print(f"[ERROR] 스풀 반영 실패: {e} (스풀 {spool.pending(backend=_spool_backend(backend))}개는 다음 실행에서 다시 시도)")
+        return False
 
-def cleanup_old_data():
+    for result in results:
+        print(
+            f"  {result.table}: {result.written}개 저장 / 변경 없음 {result.skipped}개"
+            f" ({result.rows_per_sec:,.0f} rows/s, {result.seconds:.2f}초)"
+        )
+        if result.deferred:
+            print(f"  [WARNING] {result.table}: 연결 오류로 {result.deferred}개 저장 못 함 (나머지와 함께 다음 실행으로 미룸)")
+        if result.failed:
+            print(f"  [WARNING] {result.table}: {result.failed}개 저장 실패 (dead letter {result.dead}개)")
+
+    name = _spool_backend(backend)
+    remaining = spool.pending(backend=name)
+    if remaining:
+        print(f"[SPOOL] 남은 행 {remaining}개")
+    for other, count in spool.backends().items():
+        if other != name:
+            print(f"[SPOOL] {other} 저장소 행 {count}개는 STORAGE_BACKEND={other}로 실행할 때 반영")
+    return remaining == 0
+
+
+def cleanup_old_data(backend: StorageBackend):
     """오래된 데이터 정리"""
     try:
-        deleted = delete_old_rankings(days=7)
+        deleted = backend.delete_old_rankings(days=7)
         if deleted > 0:
             print(f"[CLEANUP] 7일 지난 랭킹 {deleted}개 삭제")
     except Exception as e:
@@ -216,48 +465,141 @@ def main():
     print(f"MemeBoard 크롤러 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
 
-    # 크롤링 실행
-    results, posts = run_all_scrapers(pages=2)
+    # 카세트 (--record DIR: 받은 응답 녹화, --replay DIR: 네트워크 없이 녹화된 응답으로 실행)
+    cassette = None
+    if _arg_value("--replay"):
+        cassette = Cassette(_arg_value("--replay"), "replay")
+    elif _arg_value("--record"):
+        cassette = Cassette(_arg_value("--record"), "record")
+    use_cassette(cassette)
+    replaying = cassette is not None and cassette.replaying
+    if cassette:
+        print(f"[CASSETTE] {cassette.mode}: {cassette.path} (기준 시각 {cassette.now.strftime('%Y-%m-%d %H:%M:%S')})")
+
+    # 단계별 소요 시간 (초)
+    timings = {}
+
+    # 증분 모드 (--incremental: 이전 실행에서 저장한 게시글 제외)
+    incremental = IncrementalState() if "--incremental" in sys.argv else None
+
+    # 크롤링 실행 (--concurrent: 소스별 병렬 크롤링, --async: asyncio 단일 스레드 크롤링)
+    started = time.perf_counter()
+    results, posts = run_all_scrapers(
+        pages=2,
+        concurrent="--concurrent" in sys.argv,
+        use_async="--async" in sys.argv,
+        incremental=incremental,
+    )
+    elapsed = timings["crawl"] = time.perf_counter() - started
 
     print("\n--- 수집 결과 ---")
-    print(f"총 게시글: {results['total']}개")
+    print(f"총 게시글: {results['total']}개 ({elapsed:.1f}초)")
     for source, count in results["by_source"].items():
         print(f"  - {source}: {count}개")
 
+    cache_stats = get_http_cache().summary()
+    if cache_stats:
+        print("\n--- HTTP 캐시 ---")
+        for source, stats in cache_stats.items():
+            print(f"  - {source}: hit {stats['hit']} / revalidated {stats['revalidated']} / miss {stats['miss']}")
+
+    limiter_stats = rate_limiter_summary()
+    if limiter_stats:
+        print("\n--- 요청 속도 ---")
+        for host, stats in limiter_stats.items():
+            print(f"  - {host}: {stats['requests']}회 요청, 차단 {stats['throttled']}회, 현재 {stats['rate']}회/초")
+
+    if cassette:
+        stats = cassette.summary()
+        print("\n--- 카세트 ---")
+        print(f"  - 녹화 {stats['recorded']} / 재생 {stats['played']} / 녹화 없음 {stats['missing']}")
+
+    if any(circuit["failures"] for circuit in results["circuits"].values()):
+        print("\n--- 서킷 브레이커 ---")
+        for source, circuit in results["circuits"].items():
+            print(f"  - {source}: {circuit['state']} (실패 {circuit['failures']}회, 건너뜀 {circuit['skipped']}개)")
+
+    if incremental is not None:
+        print("\n--- 증분 크롤링 ---")
+        for source, stats in incremental.summary().items():
+            print(
+                f"  - {source}: 새 글 {stats['new']} / 중복 {stats['seen']}"
+                f" (추적 {stats['tracked']}개, 최신 {stats['high_water'] or '-'})"
+            )
+
     if results["errors"]:
         print("\n--- 오류 ---")
         for error in results["errors"]:
             print(f"  - {error}")
 
     # 오래된 글 필터링 (7일 이상)
-    posts = filter_old_posts(posts, max_age_days=7)
+    started = time.perf_counter()
+    posts = filter_old_posts(posts, max_age_days=7, now=cassette.now if cassette else None)
+    timings["filter"] = time.perf_counter() - started
     print(f"필터링 후: {len(posts)}개")
 
     # AI 분류 (--classify 플래그)
     classified = []
     if "--classify" in sys.argv:
-        classified, uncertain = run_classification(posts)
+        started = time.perf_counter()
+        classified = run_classification(posts, persist=not replaying)
+        timings["classify"] = time.perf_counter() - started
     else:
         classified = posts
 
-    # Supabase 저장 (--save 플래그)
-    if "--save" in sys.argv:
-        print("\n--- Supabase 저장 ---")
+    # 저장 (--save 플래그, 저장소는 STORAGE_BACKEND=sqlite이면 Supabase 대신 로컬 SQLite)
+    # 카세트 재생 중에는 Supabase를 건드리지 않음 (로컬 저장소에는 저장 - 저장 단계 오프라인 벤치마크용)
+    backend = get_storage_backend() if "--save" in sys.argv else None
+    if backend is not None and replaying and backend.name == SupabaseBackend.name:
+        print("\n[CASSETTE] 재생 모드에서는 Supabase 저장을 건너뜁니다. (STORAGE_BACKEND=sqlite로 로컬 저장 가능)")
+
+    elif backend is not None:
+        started = time.perf_counter()
+        print(f"\n--- 저장 ({backend.name}) ---")
+
+        # 저장할 행은 로컬 스풀에 먼저 기록 (WRITE_SPOOL=0이면 저장소에 바로 저장)
+        spool = get_write_spool()
 
         # 1. raw_posts 저장 (원본)
-        save_raw_posts(posts)
+        saved = save_raw_posts(posts, spool, backend)
+
+        # 저장(스풀 기록)에 성공한 경우에만 증분 상태 반영 (실패 시 다음 실행에서 다시 수집, 재생 중에는 반영 안 함)
+        if incremental is not None and saved and not replaying:
+            incremental.commit()
 
         # 2. rankings 저장 (분류된 것만)
         if "--classify" in sys.argv:
-            save_rankings(classified)
+            save_rankings(classified, spool, backend)
+
+        # 3. 스풀 반영 (실패한 행은 스풀에 남아 다음 실행에서 다시 보냄)
+        if spool is not None:
+            flush_write_spool(spool, backend)
+
+        # 4. 오래된 데이터 정리
+        cleanup_old_data(backend)
+        timings["save"] = time.perf_counter() - started
 
-        # 3. 오래된 데이터 정리
-        cleanup_old_data()
+        client_stats = client_summary()
+        if client_stats["clients"]:
+            print(
+                f"  Supabase 연결: 클라이언트 {client_stats['clients']}개 생성 ({client_stats['client_setup_seconds']:.3f}초),"
+                f" 요청 {client_stats['requests']}회 / 새 커넥션 {client_stats['connections']}개"
+                f" ({client_stats['connect_seconds']:.3f}초)"
+            )
 
     else:
         print("\n[TIP] Supabase 저장하려면:")
         print("   python main.py --save           (크롤링만)")
         print("   python main.py --classify --save (분류 포함)")
+        print("   python main.py --concurrent ...  (소스별 병렬 크롤링)")
+        print("   python main.py --async ...       (asyncio 동시 크롤링)")
+        print("   python main.py --incremental --save (새 글만 수집/저장)")
+        print("   python main.py --record DIR ...  (응답 녹화)")
+        print("   python main.py --replay DIR ...  (녹화된 응답으로 오프라인 실행)")
+
+    print("\n--- 단계별 소요 시간 ---")
+    for stage, seconds in timings.items():
+        print(f"  - {stage}: {seconds:.3f}초")
 
     print("\n" + "=" * 50)
     print("완료!")
@@ -0,0 +1,136 @@
+"""저장한 행의 내용 해시 (SQLite) - 바뀌지 않은 행은 다시 Upsert하지 않음
+
+매시간 수집하는 인기글은 대부분 조회수/추천수/제목이 그대로라서
+지난번에 저장한 내용과 같은 행은 보내지 않는다.
+
+- 키: (테이블, 결정론적 ID - generate_uuid_from_url / generate_uuid_from_string)
+- 값: 행 내용(updated_at 등 매번 바뀌는 시각 필드 제외)의 해시 + 마지막 저장 시각
+- max_age가 지난 행은 내용이 같아도 다시 보냄
+  (rankings.updated_at이 갱신되지 않아 delete_old_rankings(7일)가 아직 수집 중인 행을 지우지 않도록)
+
+해시는 저장에 성공한 행만 commit()으로 기록한다.
+"""
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+
+
+DEFAULT_DIGEST_PATH = Path(__file__).resolve().parent / ".cache" / "row_digests.sqlite3"
+
+# 해시에서 제외하는 필드 (저장할 때마다 바뀌는 시각)
+VOLATILE_FIELDS = frozenset({"updated_at", "created_at", "scraped_at"})
+
+# 한 번에 조회하는 키 수 (SQLite 변수 개수 제한 이내)
+_QUERY_CHUNK = 400
+
+
+def row_digest(row: dict) -> bytes:
+    """행 내용 해시 (키 순서 무관)"""
+    content = {key: value for key, value in row.items() if key not in VOLATILE_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, ensure_ascii=False, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+class RowDigestStore:
+    """테이블별 행 내용 해시 저장소 (스레드 안전)"""
+
+    def __init__(self, path: str | Path | None = None, max_age: float = 24 * 3600):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: ROW_DIGEST_PATH 환경변수 또는 backend/.cache/row_digests.sqlite3)
+            max_age: 내용이 같아도 이 시간(초)이 지나면 다시 저장 (rankings 보존 기간 7일보다 짧게)
+        """
+        self.path = Path(path or os.getenv("ROW_DIGEST_PATH") or DEFAULT_DIGEST_PATH)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS digests (
+                table_name TEXT NOT NULL,
+                id TEXT NOT NULL,
+                digest BLOB NOT NULL,
+                written_at REAL NOT NULL,
+                PRIMARY KEY (table_name, id)
+            ) WITHOUT ROWID;
+        """)
+
+    def filter_changed(self, table: str, rows: list[dict]) -> tuple[list[dict], int]:
+        """
+        새 행 / 내용이 바뀐 행 / max_age가 지난 행만 반환
+
+        Args:
+            table: 테이블 이름
+            rows: ID가 채워진 행
+
+        Returns:
+            (changed_rows, skipped_count)
+        """
+        ids = [str(row["id"]) for row in rows]
+        stored = {}
+        with self._lock:
+            for i in range(0, len(ids), _QUERY_CHUNK):
+                chunk = ids[i:i + _QUERY_CHUNK]
+                stored.update(
+                    (row_id, (digest, written_at))
+                    for row_id, digest, written_at in self._conn.execute(
+                        "SELECT id, digest, written_at FROM digests"
+                        f" WHERE table_name = ? AND id IN ({','.join('?' * len(chunk))})",
+                        [table, *chunk],
+                    )
+                )
+
+        fresh_after = time.time() - self.max_age
+        changed = []
+        for row_id, row in zip(ids, rows):
+            previous = stored.get(row_id)
+            if previous and previous[1] >= fresh_after and previous[0] == row_digest(row):
+                continue
+            changed.append(row)
+        return changed, len(rows) - len(changed)
+
+    def commit(self, table: str, rows: list[dict]) -> None:
+        """저장에 성공한 행의 해시 기록"""
+        if not rows:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO digests (table_name, id, digest, written_at) VALUES (?, ?, ?, ?)",
+                [(table, str(row["id"]), row_digest(row), now) for row in rows],
+            )
+
+    def forget(self, table: str, ids: list[str] | None = None) -> None:
+        """해시 삭제 (원격 테이블을 직접 지웠을 때 등 - 다음 저장에서 모두 다시 보냄)"""
+        with self._lock, self._conn:
+            if ids is None:
+                self._conn.execute("DELETE FROM digests WHERE table_name = ?", (table,))
+            else:
+                self._conn.executemany(
+                    "DELETE FROM digests WHERE table_name = ? AND id = ?", [(table, str(row_id)) for row_id in ids]
+                )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_store: RowDigestStore | None = None
+_default_store_lock = threading.Lock()
+
+
+def get_row_digest_store() -> RowDigestStore | None:
+    """기본 해시 저장소 (ROW_DIGEST=0이면 None, ROW_DIGEST_MAX_AGE: 재저장 주기(시간))"""
+    global _default_store
+    if os.getenv("ROW_DIGEST", "1").lower() in ("0", "false", "off"):
+        return None
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = RowDigestStore(max_age=float(os.getenv("ROW_DIGEST_MAX_AGE", "24")) * 3600)
+        return _default_store
@@ -1,5 +1,10 @@
 """크롤러 모듈"""
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, FetchResult
+from .http_cache import HttpCache, get_http_cache
+from .cassette import Cassette, use_cassette, get_cassette
+from .incremental import IncrementalState
+from .resilience import RetryPolicy, CircuitBreaker
+from .rate_limiter import HostRateLimiter, get_rate_limiter, rate_limiter_summary
 from .fmkorea import FmkoreaScraper
 from .dcinside import DcinsideScraper
 from .theqoo import TheqooScraper
@@ -9,6 +14,18 @@ from .inven import InvenScraper
 
 __all__ = [
     "BaseScraper",
+    "FetchResult",
+    "HttpCache",
+    "get_http_cache",
+    "Cassette",
+    "use_cassette",
+    "get_cassette",
+    "IncrementalState",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "HostRateLimiter",
+    "get_rate_limiter",
+    "rate_limiter_summary",
     "FmkoreaScraper",
     "DcinsideScraper",
     "TheqooScraper",
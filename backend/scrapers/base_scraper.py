@@ -1,18 +1,94 @@
 """기본 스크래퍼 클래스"""
+import re
 import time
-import random
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, date
 from typing import Optional
 from urllib.parse import urlparse
+import httpx
 import requests
 from bs4 import BeautifulSoup
 
+from . import lxml_engine
+from .cassette import Cassette, get_cassette
+from .http_cache import HttpCache, get_http_cache
+from .rate_limiter import HostRateLimiter, get_rate_limiter
+from .resilience import RetryPolicy, CircuitBreaker
+
+
+# 스트리밍으로 본문을 읽을 때 조각 크기
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# _parse_date 형식 (모든 행에서 재사용하도록 미리 컴파일)
+_DATETIME_DASH = re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}')
+_DATETIME_DOT = re.compile(r'\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}')
+_DATE_ONLY = re.compile(r'\d{4}[-./]\d{2}[-./]\d{2}$')
+_MONTH_DAY = re.compile(r'(\d{2})[-./](\d{2})$')
+_TIME_ONLY = re.compile(r'\d{2}:\d{2}(:\d{2})?$')
+
+# 비동기 요청용 호스트별 세마포어 (이벤트 루프마다 별도로 생성)
+_host_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@dataclass
+class FetchResult:
+    """HTTP 요청 결과 (원본 바이트 + 디코딩에 사용할 인코딩)"""
+    url: str
+    content: bytes
+    encoding: str | None
+    # 캐시 hit 또는 304 재검증 → 이전 응답과 동일
+    not_modified: bool = False
+    # 캐시된 파싱 결과 (not_modified이고 이전에 파싱한 적이 있을 때만)
+    posts: list[dict] | None = None
+    # 본문을 받으면서 목록 영역을 파싱했는지, 그 결과 (영역이 없었으면 None)
+    streamed: bool = False
+    document: object = None
+
+    @property
+    def text(self) -> str:
+        """본문 문자열 (requests.Response.text와 동일한 디코딩 규칙)"""
+        try:
+            return str(self.content, self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return str(self.content, errors="replace")
+
 
 class BaseScraper(ABC):
-    """모든 스크래퍼의 기본 클래스"""
+    """모든 스크래퍼의 기본 클래스
+
+    목록 페이지 하나를 요청해 파싱하는 스크래퍼는 page_url()과 parse()만 구현하면
+    동기(scrape)와 비동기(ascrape) 경로를 모두 사용할 수 있다.
+    parse()가 받는 문서는 parser 속성에 따라 BeautifulSoup("soup") 또는 lxml 루트("lxml")이다.
+    """
+
+    # parse()에 넘길 문서 형식: "soup" (BeautifulSoup) 또는 "lxml" (lxml_engine)
+    parser: str = "soup"
+    # 게시글 목록이 들어 있는 영역 (lxml 파서에서만 사용, 지정 시 해당 영역까지만 파싱)
+    list_region: lxml_engine.Region | None = None
 
-    def __init__(self, encoding: str = "utf-8"):
+    # 비동기 경로에서 같은 호스트로 동시에 보낼 최대 요청 수
+    max_concurrency_per_host: int = 2
+    # 캐시된 응답을 재검증 없이 재사용하는 시간(초), 0이면 항상 조건부 GET
+    cache_ttl: int = 0
+    # 호스트별 초기/최대 초당 요청 수 (같은 호스트의 제한기가 처음 만들어질 때 적용)
+    request_rate: float = 1.0
+    max_request_rate: float = 3.0
+    # 요청 실패 시 재시도 정책, 연속 실패한 시도 몇 회에 소스를 건너뛸지
+    retry_policy: RetryPolicy = RetryPolicy()
+    failure_threshold: int = 3
+
+    def __init__(self, encoding: str = "utf-8", http_cache: HttpCache | None = None, cassette: Cassette | None = None):
         self.encoding = encoding
+        self.cassette = cassette or get_cassette()
+        # 카세트 녹화/재생 중에는 HTTP 캐시를 쓰지 않음 (녹화: 모든 응답을 실제로 받음, 재생: 매번 같은 파싱)
+        self.http_cache = HttpCache(enabled=False) if self.cassette else (http_cache or get_http_cache())
+        self.circuit_breaker = CircuitBreaker(self.source_name, self.failure_threshold)
+        self._async_client: httpx.AsyncClient | None = None
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -40,42 +116,359 @@ class BaseScraper(ABC):
         """기본 URL"""
         pass
 
+    def _cached_result(self, url: str) -> tuple[FetchResult | None, object]:
+        """TTL 이내 캐시가 있으면 (FetchResult, cached), 아니면 (None, cached)"""
+        cached = self.http_cache.get(url)
+        if cached and cached.age < self.cache_ttl:
+            self.http_cache.record(self.source_name, "hit")
+            return FetchResult(url, cached.body, cached.encoding, not_modified=True, posts=cached.posts), cached
+        return None, cached
+
+    def _revalidated_result(self, url: str, cached) -> FetchResult:
+        """304 Not Modified → 캐시된 응답으로 결과 생성"""
+        self.http_cache.touch(url)
+        self.http_cache.record(self.source_name, "revalidated")
+        return FetchResult(url, cached.body, cached.encoding, not_modified=True, posts=cached.posts)
+
+    def _replay_result(self, url: str) -> Optional[FetchResult]:
+        """재생 모드: 카세트에 녹화된 응답 (녹화되지 않은 URL은 요청 실패와 같이 None)"""
+        entry = self.cassette.play(url)
+        if entry is None:
+            print(f"[{self.source_name}] 카세트에 녹화되지 않은 URL: {url}")
+            return None
+        return FetchResult(url, entry.body, entry.encoding)
+
+    def _rate_limiter(self, url: str) -> HostRateLimiter:
+        """요청 URL 호스트의 공유 제한기"""
+        return get_rate_limiter(urlparse(url).netloc, rate=self.request_rate, max_rate=self.max_request_rate)
+
+    def _request_headers(self, cached, referer: str | None) -> dict | None:
+        headers = self.http_cache.conditional_headers(cached)
+        if referer:
+            headers["Referer"] = referer
+        return headers or None
+
+    def _read_body(self, response: requests.Response, region: lxml_engine.Region | None) -> tuple[bytes, bool, object]:
+        """응답 본문 읽기 (region 지정 시 받는 대로 목록 영역을 증분 파싱)
+
+        Returns:
+            (content, streamed, document)
+        """
+        if region is None or not response.encoding:
+            return response.content, False, None
+
+        stream_parser = lxml_engine.RegionStreamParser(region, response.encoding)
+        chunks = []
+        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            stream_parser.feed(chunk)
+        return b"".join(chunks), True, stream_parser.close()
+
+    def fetch(
+        self,
+        url: str,
+        delay: bool = True,
+        encoding: str = None,
+        referer: str = None,
+        region: lxml_engine.Region | None = None,
+    ) -> Optional[FetchResult]:
+        """페이지 원본 가져오기 (디스크 캐시 + 조건부 GET + 재시도)
+
+        실패한 시도마다 서킷 브레이커에 기록하고(재시도를 모두 쓰면 open), 서킷이 열린 소스는 요청 없이 None을 반환한다.
+        카세트 재생 모드에서는 요청 없이 녹화된 응답을 반환하고, 녹화 모드에서는 받은 응답을 카세트에 저장한다.
+
+        Args:
+            url: 요청 URL
+            delay: 요청 간격에 랜덤 지터 적용 여부 (호스트별 속도 제한은 항상 적용, 캐시 hit이면 요청 없음)
+            encoding: 문자 인코딩 (기본값: self.encoding)
+            referer: Referer 헤더 (None이면 설정하지 않음)
+            region: 지정 시 본문을 스트리밍으로 받으며 해당 영역을 바로 파싱 (FetchResult.document)
+        """
+        if self.cassette and self.cassette.replaying:
+            return self._replay_result(url)
+
+        result, cached = self._cached_result(url)
+        if result:
+            return result
+
+        limiter = self._rate_limiter(url)
+        policy = self.retry_policy
+        for attempt in range(policy.max_retries + 1):
+            # 서킷이 열린 소스는 요청하지 않음 (재시도 대기 중 열린 경우 포함)
+            if self.circuit_breaker.is_open:
+                self.circuit_breaker.record_skip()
+                return None
+
+            try:
+                # 호스트별 토큰 버킷 대기 (차단 응답 시 자동 감속)
+                limiter.acquire(jitter=delay)
+
+                response = self.session.get(
+                    url,
+                    timeout=15,
+                    headers=self._request_headers(cached, referer),
+                    stream=region is not None,
+                )
+                with response:
+                    limiter.on_response(response.status_code, response.headers.get("Retry-After"))
+                    if response.status_code == 304 and cached:
+                        self.circuit_breaker.record_success()
+                        return self._revalidated_result(url, cached)
+                    response.raise_for_status()
+
+                    # 인코딩 설정
+                    use_encoding = encoding or self.encoding
+                    if use_encoding.lower() != "utf-8":
+                        response.encoding = use_encoding
+
+                    # 디코딩하지 않은 바이트 그대로 파서에 전달 (response.text 사용 안 함)
+                    content, streamed, document = self._read_body(response, region)
+                    response_encoding = response.encoding or response.apparent_encoding
+
+            except requests.RequestException as e:
+                if e.response is None:
+                    limiter.on_response(None)
+                retryable = e.response is None or policy.is_retryable(e.response.status_code)
+                max_retries = policy.retries_for(isinstance(e, requests.Timeout))
+                exhausted = retryable and attempt >= max_retries
+                # 시도마다 기록 (재시도를 모두 쓰면 서킷 open → 같은 소스의 남은 페이지는 요청하지 않음)
+                self.circuit_breaker.record_failure(exhausted=exhausted)
+                if not retryable or exhausted:
+                    print(f"[{self.source_name}] 페이지 로드 실패: {e}")
+                    return None
+
+                backoff = policy.backoff(attempt)
+                print(f"[{self.source_name}] 요청 실패, {backoff:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+                time.sleep(backoff)
+                continue
+
+            self.circuit_breaker.record_success()
+
+            self.http_cache.put(url, content, response_encoding, response.headers)
+            if self.cassette:
+                self.cassette.record(url, response.status_code, response.headers, content, response_encoding)
+            self.http_cache.record(self.source_name, "miss")
+            return FetchResult(url, content, response_encoding, streamed=streamed, document=document)
+
     def fetch_page(self, url: str, delay: bool = True, encoding: str = None, referer: str = None) -> Optional[BeautifulSoup]:
         """페이지 HTML 가져오기
 
         Args:
             url: 요청 URL
-            delay: 요청 간 딜레이 적용 여부
+            delay: 요청 간격에 랜덤 지터 적용 여부 (호스트별 속도 제한은 항상 적용)
             encoding: 문자 인코딩 (기본값: self.encoding)
             referer: Referer 헤더 (None이면 설정하지 않음)
         """
-        try:
-            # 요청 간 랜덤 딜레이 (봇 감지 우회)
-            if delay:
-                time.sleep(random.uniform(0.5, 1.5))
-
-            # 요청 헤더
-            headers = {}
-            if referer:
-                headers["Referer"] = referer
-
-            response = self.session.get(url, timeout=15, headers=headers if headers else None)
-            response.raise_for_status()
-
-            # 인코딩 설정
-            use_encoding = encoding or self.encoding
-            if use_encoding.lower() != "utf-8":
-                response.encoding = use_encoding
-
-            return BeautifulSoup(response.text, "lxml")
-        except requests.RequestException as e:
-            print(f"[{self.source_name}] 페이지 로드 실패: {e}")
+        result = self.fetch(url, delay=delay, encoding=encoding, referer=referer)
+        if not result:
             return None
+        return BeautifulSoup(result.text, "lxml")
 
-    @abstractmethod
-    def scrape(self) -> list[dict]:
+    def page_url(self, page: int) -> str | None:
+        """목록 페이지 URL (None이면 page_url/parse 분리 미지원 → scrape 직접 구현)"""
+        return None
+
+    def parse(self, doc) -> list[dict]:
+        """목록 페이지 파싱 (page_url 구현 시 함께 구현, doc 형식은 parser 속성 참고)"""
+        raise NotImplementedError(f"{type(self).__name__}.parse()가 구현되지 않았습니다.")
+
+    def scrape(self, page: int = 1) -> list[dict]:
         """게시글 목록 크롤링"""
-        pass
+        url = self.page_url(page)
+        if url is None:
+            raise NotImplementedError(f"{type(self).__name__}은 scrape() 또는 page_url()/parse()를 구현해야 합니다.")
+
+        return self._parse_result(self.fetch(url, region=self._stream_region))
+
+    @property
+    def _stream_region(self) -> lxml_engine.Region | None:
+        """본문을 받으면서 바로 파싱할 목록 영역 (lxml 파서 + list_region 지정 시)"""
+        return self.list_region if self.parser == "lxml" else None
+
+    def _build_document(self, result: FetchResult, targeted: bool = False):
+        """parser 속성에 맞는 문서 생성
+
+        Args:
+            targeted: True면 list_region까지만 파싱 (영역이 없으면 None)
+        """
+        if self.parser == "lxml":
+            if targeted:
+                return lxml_engine.parse_region(result.content, self.list_region, result.encoding)
+            return lxml_engine.parse_html(result.content, result.encoding)
+        return BeautifulSoup(result.text, "lxml")
+
+    def _parse_result(self, result: FetchResult | None) -> list[dict]:
+        """응답 파싱 (변경 없는 페이지는 캐시된 파싱 결과 재사용)"""
+        if not result:
+            return []
+
+        if result.not_modified and result.posts is not None:
+            return result.posts
+
+        posts = None
+        if self.parser == "lxml" and self.list_region is not None:
+            doc = result.document if result.streamed else self._build_document(result, targeted=True)
+            if doc is None:
+                print(f"[{self.source_name}] 목록 영역을 찾지 못해 전체 페이지 파싱")
+            else:
+                posts = self.parse(doc)
+            # 영역이 없거나 영역에서 게시글을 못 찾으면 (페이지 구조 변경 등) 전체 파싱으로 대체
+            if not posts:
+                posts = None
+
+        if posts is None:
+            doc = self._build_document(result)
+            if doc is None:
+                return []
+            posts = self.parse(doc)
+
+        self.http_cache.store_posts(result.url, posts)
+        return posts
+
+    # ------------------------------------------------------------------
+    # 비동기 경로 (asyncio)
+    # ------------------------------------------------------------------
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """커넥션 풀을 공유하는 비동기 HTTP 클라이언트 (지연 생성)"""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                headers=dict(self.session.headers),
+                timeout=15,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency_per_host * 2,
+                    max_keepalive_connections=self.max_concurrency_per_host,
+                ),
+            )
+        return self._async_client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """현재 이벤트 루프에서 호스트별 동시 요청 수를 제한하는 세마포어"""
+        loop = asyncio.get_running_loop()
+        semaphores = _host_semaphores.setdefault(loop, {})
+        host = urlparse(url).netloc
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(self.max_concurrency_per_host)
+        return semaphores[host]
+
+    async def _aread_body(self, response: httpx.Response, region: lxml_engine.Region | None) -> tuple[bytes, bool, object]:
+        """응답 본문 비동기 읽기 (_read_body의 asyncio 버전)"""
+        if region is None:
+            return await response.aread(), False, None
+
+        stream_parser = lxml_engine.RegionStreamParser(region, response.encoding)
+        chunks = []
+        async for chunk in response.aiter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+            chunks.append(chunk)
+            stream_parser.feed(chunk)
+        return b"".join(chunks), True, stream_parser.close()
+
+    async def afetch(
+        self,
+        url: str,
+        delay: bool = True,
+        encoding: str = None,
+        referer: str = None,
+        region: lxml_engine.Region | None = None,
+    ) -> Optional[FetchResult]:
+        """페이지 원본 비동기 요청 (fetch의 asyncio 버전)"""
+        if self.cassette and self.cassette.replaying:
+            return self._replay_result(url)
+
+        result, cached = self._cached_result(url)
+        if result:
+            return result
+
+        limiter = self._rate_limiter(url)
+        policy = self.retry_policy
+        for attempt in range(policy.max_retries + 1):
+            # 서킷이 열린 소스는 요청하지 않음 (재시도 대기 중 열린 경우 포함)
+            if self.circuit_breaker.is_open:
+                self.circuit_breaker.record_skip()
+                return None
+
+            try:
+                async with self._host_semaphore(url):
+                    # 호스트별 토큰 버킷 대기 - 세마포어를 잡은 채로 대기
+                    await limiter.aacquire(jitter=delay)
+
+                    client = self._get_async_client()
+                    async with client.stream("GET", url, headers=self._request_headers(cached, referer)) as response:
+                        limiter.on_response(response.status_code, response.headers.get("Retry-After"))
+                        if response.status_code == 304 and cached:
+                            self.circuit_breaker.record_success()
+                            return self._revalidated_result(url, cached)
+                        response.raise_for_status()
+
+                        # 인코딩 설정
+                        use_encoding = encoding or self.encoding
+                        if use_encoding.lower() != "utf-8":
+                            response.encoding = use_encoding
+
+                        content, streamed, document = await self._aread_body(response, region)
+
+            except httpx.HTTPError as e:
+                status_error = isinstance(e, httpx.HTTPStatusError)
+                if not status_error:
+                    limiter.on_response(None)
+                retryable = not status_error or policy.is_retryable(e.response.status_code)
+                max_retries = policy.retries_for(isinstance(e, httpx.TimeoutException))
+                exhausted = retryable and attempt >= max_retries
+                # 시도마다 기록 (재시도를 모두 쓰면 서킷 open → 같은 소스의 남은 페이지는 요청하지 않음)
+                self.circuit_breaker.record_failure(exhausted=exhausted)
+                if not retryable or exhausted:
+                    print(f"[{self.source_name}] 페이지 로드 실패: {e}")
+                    return None
+
+                backoff = policy.backoff(attempt)
+                print(f"[{self.source_name}] 요청 실패, {backoff:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+                await asyncio.sleep(backoff)
+                continue
+
+            self.circuit_breaker.record_success()
+
+            self.http_cache.put(url, content, response.encoding, response.headers)
+            if self.cassette:
+                self.cassette.record(url, response.status_code, response.headers, content, response.encoding)
+            self.http_cache.record(self.source_name, "miss")
+            return FetchResult(url, content, response.encoding, streamed=streamed, document=document)
+
+    async def afetch_page(self, url: str, delay: bool = True, encoding: str = None, referer: str = None) -> Optional[BeautifulSoup]:
+        """페이지 HTML 비동기 요청 (fetch_page의 asyncio 버전)
+
+        Args:
+            url: 요청 URL
+            delay: 요청 간격에 랜덤 지터 적용 여부 (호스트별 속도 제한은 항상 적용)
+            encoding: 문자 인코딩 (기본값: self.encoding)
+            referer: Referer 헤더 (None이면 설정하지 않음)
+        """
+        result = await self.afetch(url, delay=delay, encoding=encoding, referer=referer)
+        if not result:
+            return None
+        return BeautifulSoup(result.text, "lxml")
+
+    async def ascrape(self, page: int = 1) -> list[dict]:
+        """게시글 목록 비동기 크롤링
+
+        page_url()/parse()로 분리되지 않은 스크래퍼는 동기 scrape()를 스레드에서 실행한다.
+        """
+        url = self.page_url(page)
+        if url is None:
+            return await asyncio.to_thread(self.scrape, page)
+
+        return self._parse_result(await self.afetch(url, region=self._stream_region))
+
+    async def ascrape_pages(self, pages: int) -> list[dict]:
+        """1~pages 페이지를 동시에 크롤링 (결과는 페이지 순서 유지)"""
+        page_results = await asyncio.gather(*(self.ascrape(page) for page in range(1, pages + 1)))
+        return [post for page_posts in page_results for post in page_posts]
+
+    async def aclose(self) -> None:
+        """비동기 HTTP 클라이언트 정리"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
 
     def format_post(
         self,
@@ -106,14 +499,18 @@ class BaseScraper(ABC):
             "post_date": post_date,
         }
 
+    def _today(self) -> date:
+        """날짜가 생략된 게시일 계산 기준 날짜 (카세트 재생 시 녹화 날짜 - 재생 결과가 실행 날짜에 따라 달라지지 않도록)"""
+        return self.cassette.now.date() if self.cassette else date.today()
+
     def _parse_date(self, date_str: str) -> str | None:
         """날짜 문자열을 ISO 8601 형식으로 변환
 
         지원 형식:
         - "2026-02-01 12:34:56" → 그대로
         - "2026.02.01" → "2026-02-01"
-        - "02.01" 또는 "02-01" → 올해 날짜로 변환
-        - "12:34" → 오늘 날짜 + 시간
+        - "02.01" 또는 "02-01" → 올해 날짜로 변환 (기준: _today)
+        - "12:34" → 오늘 날짜 + 시간 (기준: _today)
 
         Args:
             date_str: 원본 날짜 문자열
@@ -121,9 +518,6 @@ class BaseScraper(ABC):
         Returns:
             ISO 8601 형식 문자열 또는 None
         """
-        from datetime import datetime, date
-        import re
-
         if not date_str:
             return None
 
@@ -131,30 +525,30 @@ class BaseScraper(ABC):
 
         try:
             # 형식 1: 전체 날짜시간 "2026-02-01 12:34:56"
-            if re.match(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', date_str):
+            if _DATETIME_DASH.match(date_str):
                 dt = datetime.strptime(date_str[:16], '%Y-%m-%d %H:%M')
                 return dt.isoformat()
 
             # 형식 2: 전체 날짜시간 (점 구분) "2026.02.01 12:34:56"
-            if re.match(r'\d{4}\.\d{2}\.\d{2}\s+\d{2}:\d{2}', date_str):
+            if _DATETIME_DOT.match(date_str):
                 dt = datetime.strptime(date_str[:16], '%Y.%m.%d %H:%M')
                 return dt.isoformat()
 
             # 형식 3: 날짜만 "2026-02-01" 또는 "2026.02.01"
-            if re.match(r'\d{4}[-./]\d{2}[-./]\d{2}$', date_str):
+            if _DATE_ONLY.match(date_str):
                 date_str = date_str.replace('.', '-').replace('/', '-')
                 return f"{date_str}T00:00:00"
 
             # 형식 4: 월.일만 "02.01" 또는 "02-01" 또는 "02/01"
-            month_day_match = re.match(r'(\d{2})[-./](\d{2})$', date_str)
+            month_day_match = _MONTH_DAY.match(date_str)
             if month_day_match:
                 month, day = month_day_match.groups()
-                year = date.today().year
+                year = self._today().year
                 return f"{year}-{month}-{day}T00:00:00"
 
             # 형식 5: 시간만 "12:34" → 오늘 날짜
-            if re.match(r'\d{2}:\d{2}(:\d{2})?$', date_str):
-                today = date.today()
+            if _TIME_ONLY.match(date_str):
+                today = self._today()
                 return f"{today.isoformat()}T{date_str[:5]}:00"
 
             return None
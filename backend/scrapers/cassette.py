@@ -0,0 +1,134 @@
+"""HTTP 응답 녹화/재생 (카세트)
+
+- record: 스크래퍼가 받은 모든 응답(URL, 상태 코드, 헤더, 본문)을 카세트 디렉토리에 저장
+- replay: 카세트에 녹화된 응답만 돌려줌 (네트워크 요청, 요청 간격 대기, 재시도 없음)
+
+재생 모드에서는 매번 같은 입력으로 파싱/분류/저장 단계를 실행할 수 있으므로
+라이브 사이트 없이 main 전체를 벤치마크/프로파일링할 때 사용한다.
+
+디렉토리 구조:
+    cassette.json           녹화 시각 (재생 시 "현재 시각"으로 사용)
+    {sha1(url)}.json        URL, 상태 코드, 응답 헤더, 인코딩
+    {sha1(url)}.body.gz     응답 본문 (gzip)
+"""
+import os
+import json
+import gzip
+import hashlib
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+
+MODES = ("record", "replay")
+
+
+@dataclass
+class CassetteEntry:
+    """녹화된 응답 하나"""
+    url: str
+    status: int
+    headers: dict[str, str]
+    encoding: str | None
+    body: bytes
+
+
+class Cassette:
+    """카세트 디렉토리 (스레드 안전)"""
+
+    def __init__(self, path: str | Path, mode: str):
+        if mode not in MODES:
+            raise ValueError(f"카세트 모드는 {MODES} 중 하나여야 합니다: {mode}")
+
+        self.path = Path(path)
+        self.mode = mode
+        # played: 재생한 응답 수, missing: 카세트에 없는 URL 요청 수, recorded: 녹화한 응답 수
+        self.stats = Counter()
+        self._lock = threading.Lock()
+
+        manifest_path = self.path / "cassette.json"
+        if self.replaying:
+            if not manifest_path.exists():
+                raise ValueError(f"카세트가 없습니다: {self.path}")
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                self.recorded_at = datetime.fromisoformat(json.load(f)["recorded_at"])
+        else:
+            self.recorded_at = datetime.now()
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump({"recorded_at": self.recorded_at.isoformat()}, f)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @property
+    def now(self) -> datetime:
+        """기준 시각 (재생: 녹화 시각, 녹화: 현재 시각)"""
+        return self.recorded_at if self.replaying else datetime.now()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return self.path / f"{key}.json", self.path / f"{key}.body.gz"
+
+    def record(self, url: str, status: int, headers, body: bytes, encoding: str | None) -> None:
+        """응답 녹화 (같은 URL은 마지막 응답으로 덮어씀)"""
+        meta_path, body_path = self._paths(url)
+
+        tmp_path = body_path.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wb", compresslevel=5) as f:
+            f.write(body)
+        os.replace(tmp_path, body_path)
+
+        tmp_path = meta_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "url": url,
+                "status": status,
+                "headers": dict(headers),
+                "encoding": encoding,
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+
+        with self._lock:
+            self.stats["recorded"] += 1
+
+    def play(self, url: str) -> CassetteEntry | None:
+        """녹화된 응답 (없으면 None)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with gzip.open(body_path, "rb") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            meta = None
+
+        with self._lock:
+            if not meta or meta.get("url") != url:
+                self.stats["missing"] += 1
+                return None
+            self.stats["played"] += 1
+
+        return CassetteEntry(url, meta["status"], meta["headers"], meta["encoding"], body)
+
+    def summary(self) -> dict[str, int]:
+        """녹화/재생 통계"""
+        with self._lock:
+            return {key: self.stats.get(key, 0) for key in ("recorded", "played", "missing")}
+
+
+_active_cassette: Cassette | None = None
+
+
+def use_cassette(cassette: Cassette | None) -> None:
+    """이후 생성되는 스크래퍼가 사용할 카세트 지정 (None이면 해제)"""
+    global _active_cassette
+    _active_cassette = cassette
+
+
+def get_cassette() -> Cassette | None:
+    """현재 카세트 (녹화/재생 모드가 아니면 None)"""
+    return _active_cassette
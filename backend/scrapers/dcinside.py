@@ -1,11 +1,22 @@
 """디시인사이드 개념글 크롤러"""
-import re
 from .base_scraper import BaseScraper
+from .lxml_engine import Region, xpath, has_class, first, text_of, classes_of, digits_int
 
 
 class DcinsideScraper(BaseScraper):
     """디시인사이드 개념글 크롤러"""
 
+    cache_ttl = 600
+    parser = "lxml"
+    list_region = Region("table", cls="gall_list")
+
+    # 행/필드 XPath (클래스 정의 시 한 번만 컴파일)
+    _rows = xpath(f"//tr[{has_class('ub-content')}]")
+    _title = xpath(f".//td[{has_class('gall_tit')}]//a[not({has_class('reply_numbox')})]")
+    _views = xpath(f".//td[{has_class('gall_count')}]")
+    _likes = xpath(f".//td[{has_class('gall_recommend')}]")
+    _date = xpath(f".//td[{has_class('gall_date')}]")
+
     @property
     def source_name(self) -> str:
         return "dcinside"
@@ -14,30 +25,28 @@ class DcinsideScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://gall.dcinside.com"
 
-    def scrape(self, page: int = 1) -> list[dict]:
-        """개념글 크롤링 (hit 갤러리)"""
-        url = f"{self.base_url}/hit?page={page}"
-
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+    def page_url(self, page: int) -> str:
+        """개념글 목록 URL (hit 갤러리)"""
+        return f"{self.base_url}/hit?page={page}"
 
+    def parse(self, doc) -> list[dict]:
+        """개념글 목록 파싱"""
         posts = []
         # 게시글 목록 선택자
-        rows = soup.select("tr.ub-content")
+        rows = self._rows(doc)
 
         for row in rows:
             try:
                 # 공지사항 제외
-                if "notice" in row.get("class", []):
+                if "notice" in classes_of(row):
                     continue
 
                 # 제목 추출
-                title_elem = row.select_one("td.gall_tit a:not(.reply_numbox)")
-                if not title_elem:
+                title_elem = first(self._title(row))
+                if title_elem is None:
                     continue
 
-                title = title_elem.get_text(strip=True)
+                title = text_of(title_elem)
                 href = title_elem.get("href", "")
 
                 # 전체 URL 생성
@@ -50,27 +59,23 @@ class DcinsideScraper(BaseScraper):
 
                 # 조회수 추출
                 views = 0
-                view_elem = row.select_one("td.gall_count")
-                if view_elem:
-                    view_text = view_elem.get_text(strip=True)
-                    if view_text.isdigit():
-                        views = int(view_text)
+                view_elem = first(self._views(row))
+                if view_elem is not None:
+                    views = digits_int(text_of(view_elem))
 
                 # 추천수 추출
                 likes = 0
-                like_elem = row.select_one("td.gall_recommend")
-                if like_elem:
-                    like_text = like_elem.get_text(strip=True)
-                    if like_text.isdigit():
-                        likes = int(like_text)
+                like_elem = first(self._likes(row))
+                if like_elem is not None:
+                    likes = digits_int(text_of(like_elem))
 
                 # 작성일 추출
                 post_date = None
-                date_elem = row.select_one("td.gall_date")
-                if date_elem:
+                date_elem = first(self._date(row))
+                if date_elem is not None:
                     # title 속성에 전체 날짜시간이 있음: "2026-02-01 12:34:56"
                     # 없으면 텍스트에서 시간만: "12:34"
-                    date_str = date_elem.get("title") or date_elem.get_text(strip=True)
+                    date_str = date_elem.get("title") or text_of(date_elem)
                     post_date = self._parse_date(date_str)
 
                 posts.append(self.format_post(
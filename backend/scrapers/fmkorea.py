@@ -11,6 +11,10 @@ from .base_scraper import BaseScraper
 class FmkoreaScraper(BaseScraper):
     """에펨코리아 포텐 크롤러"""
 
+    # 430 차단이 잦아 보수적으로 시작 (차단 응답 시 제한기가 추가로 감속)
+    request_rate = 0.3
+    max_request_rate = 1.0
+
     @property
     def source_name(self) -> str:
         return "fmkorea"
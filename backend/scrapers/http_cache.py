@@ -0,0 +1,171 @@
+"""스크래퍼 HTTP 응답 디스크 캐시
+
+URL별로 응답 본문(gzip)과 메타데이터(ETag, Last-Modified, 인코딩, 파싱 결과)를 저장한다.
+- TTL 이내: 네트워크 요청 없이 캐시 사용 (hit)
+- TTL 경과: 조건부 GET(If-None-Match / If-Modified-Since) → 304면 캐시 사용 (revalidated)
+- 그 외: 새로 다운로드 (miss)
+
+304/hit인 경우 저장해 둔 파싱 결과(posts)를 그대로 돌려주므로 다운로드와 파싱을 모두 건너뛴다.
+"""
+import os
+import json
+import gzip
+import time
+import hashlib
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "http"
+
+
+@dataclass
+class CachedResponse:
+    """캐시된 응답 메타데이터 (본문은 필요할 때 읽음)"""
+    url: str
+    encoding: str | None
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    posts: list[dict] | None = None
+    body_path: Path | None = field(default=None, repr=False)
+
+    @property
+    def age(self) -> float:
+        """마지막 다운로드/재검증 이후 경과 시간(초)"""
+        return time.time() - self.fetched_at
+
+    @property
+    def body(self) -> bytes:
+        """캐시된 응답 본문"""
+        with gzip.open(self.body_path, "rb") as f:
+            return f.read()
+
+
+class HttpCache:
+    """URL 키 기반 디스크 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_dir: str | Path | None = None, enabled: bool = True):
+        self.cache_dir = Path(cache_dir or os.getenv("SCRAPER_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        self.enabled = enabled
+        # {source: Counter(hit=, miss=, revalidated=)}
+        self.stats: dict[str, Counter] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body.gz"
+
+    def _write_meta(self, meta_path: Path, meta: dict) -> None:
+        tmp_path = meta_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+
+    def _read_meta(self, meta_path: Path) -> dict | None:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, url: str) -> CachedResponse | None:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        if not self.enabled:
+            return None
+
+        meta_path, body_path = self._paths(url)
+        meta = self._read_meta(meta_path)
+        if not meta or meta.get("url") != url or not body_path.exists():
+            return None
+
+        return CachedResponse(
+            url=url,
+            encoding=meta.get("encoding"),
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            fetched_at=meta.get("fetched_at", 0),
+            posts=meta.get("posts"),
+            body_path=body_path,
+        )
+
+    def put(self, url: str, body: bytes, encoding: str | None, headers) -> None:
+        """새로 받은 응답 저장 (이전 파싱 결과는 무효화)"""
+        if not self.enabled:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        meta_path, body_path = self._paths(url)
+
+        tmp_path = body_path.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wb", compresslevel=5) as f:
+            f.write(body)
+        os.replace(tmp_path, body_path)
+
+        self._write_meta(meta_path, {
+            "url": url,
+            "encoding": encoding,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "posts": None,
+        })
+
+    def touch(self, url: str) -> None:
+        """304 재검증 성공 → fetched_at 갱신 (TTL 재시작)"""
+        self._update_meta(url, fetched_at=time.time())
+
+    def store_posts(self, url: str, posts: list[dict]) -> None:
+        """응답 본문의 파싱 결과 저장 (다음 hit/304 때 파싱 생략)"""
+        self._update_meta(url, posts=posts)
+
+    def _update_meta(self, url: str, **updates) -> None:
+        if not self.enabled:
+            return
+
+        meta_path, _ = self._paths(url)
+        meta = self._read_meta(meta_path)
+        if not meta or meta.get("url") != url:
+            return
+
+        meta.update(updates)
+        self._write_meta(meta_path, meta)
+
+    def conditional_headers(self, cached: CachedResponse | None) -> dict:
+        """재검증용 조건부 요청 헤더"""
+        headers = {}
+        if cached:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    def record(self, source: str, outcome: str) -> None:
+        """hit / miss / revalidated 카운트"""
+        with self._lock:
+            self.stats[source][outcome] += 1
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """소스별 캐시 통계"""
+        with self._lock:
+            return {
+                source: {key: counter.get(key, 0) for key in ("hit", "revalidated", "miss")}
+                for source, counter in self.stats.items()
+            }
+
+
+_default_cache: HttpCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """모든 스크래퍼가 공유하는 기본 캐시 (SCRAPER_HTTP_CACHE=0이면 비활성화)"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            enabled = os.getenv("SCRAPER_HTTP_CACHE", "1").lower() not in ("0", "false", "off")
+            _default_cache = HttpCache(enabled=enabled)
+        return _default_cache
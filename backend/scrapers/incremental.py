@@ -0,0 +1,151 @@
+"""증분 크롤링 상태 (소스별 이미 본 게시글 + high-water mark)
+
+이미 본 게시글 URL은 64비트 해시의 정렬 배열로 저장한다 (URL 100만 개 ≈ 8MB).
+- 조회: 이진 탐색 O(log n)
+- 저장: 이번 실행에서 새로 본 해시를 정렬 병합 O(n)
+
+새로 본 게시글은 commit() 전까지 디스크에 반영되지 않는다.
+저장(Supabase)에 실패한 실행의 게시글이 다음 실행에서 누락되지 않도록
+main에서 저장이 끝난 뒤에만 commit()을 호출한다.
+"""
+import os
+import json
+import heapq
+import hashlib
+import threading
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+
+
+DEFAULT_STATE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "incremental"
+
+
+def url_hash(url: str) -> int:
+    """URL → 64비트 해시"""
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "little")
+
+
+class SeenPostIndex:
+    """단일 소스의 이미 본 게시글 인덱스"""
+
+    def __init__(self, source: str, state_dir: Path):
+        self.source = source
+        self._seen_path = state_dir / f"{source}.seen"
+        self._meta_path = state_dir / f"{source}.json"
+
+        self.hashes = array("Q")
+        self.high_water: str | None = None
+        # 이번 실행에서 처음 본 해시 (commit 전)
+        self.pending: set[int] = set()
+        self._pending_high_water: str | None = None
+
+        if self._seen_path.exists():
+            with open(self._seen_path, "rb") as f:
+                self.hashes.frombytes(f.read())
+        if self._meta_path.exists():
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                self.high_water = json.load(f).get("high_water")
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def is_committed(self, key: int) -> bool:
+        """이전 실행에서 이미 저장된 게시글인지"""
+        i = bisect_left(self.hashes, key)
+        return i < len(self.hashes) and self.hashes[i] == key
+
+    def take_new(self, posts: list[dict]) -> tuple[list[dict], int]:
+        """처음 보는 게시글만 반환
+
+        Returns:
+            (new_posts, seen_count) - seen_count: 이미 본(이전 실행 또는 이번 실행) 게시글 수
+        """
+        new_posts = []
+        seen_count = 0
+        for post in posts:
+            url = post.get("url")
+            if not url:
+                new_posts.append(post)
+                continue
+
+            key = url_hash(url)
+            if key in self.pending or self.is_committed(key):
+                seen_count += 1
+                continue
+
+            self.pending.add(key)
+            new_posts.append(post)
+
+            post_date = post.get("post_date")
+            if post_date and (self._pending_high_water is None or post_date > self._pending_high_water):
+                self._pending_high_water = post_date
+
+        return new_posts, seen_count
+
+    def commit(self) -> None:
+        """이번 실행에서 본 게시글을 디스크에 반영"""
+        if self.pending:
+            merged = heapq.merge(self.hashes, sorted(self.pending))
+            self.hashes = array("Q", merged)
+            self.pending.clear()
+
+        if self._pending_high_water and (self.high_water is None or self._pending_high_water > self.high_water):
+            self.high_water = self._pending_high_water
+        self._pending_high_water = None
+
+        self._seen_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._seen_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            self.hashes.tofile(f)
+        os.replace(tmp_path, self._seen_path)
+
+        with open(self._meta_path, "w", encoding="utf-8") as f:
+            json.dump({"high_water": self.high_water, "count": len(self.hashes)}, f)
+
+
+class IncrementalState:
+    """모든 소스의 증분 크롤링 상태 (소스별 인덱스는 처음 사용할 때 로드)"""
+
+    def __init__(self, state_dir: str | Path | None = None):
+        self.state_dir = Path(state_dir or os.getenv("SCRAPER_STATE_DIR") or DEFAULT_STATE_DIR)
+        self._indexes: dict[str, SeenPostIndex] = {}
+        self._lock = threading.Lock()
+        # {source: {"new": int, "seen": int}}
+        self.stats: dict[str, dict[str, int]] = {}
+
+    def index(self, source: str) -> SeenPostIndex:
+        with self._lock:
+            if source not in self._indexes:
+                self._indexes[source] = SeenPostIndex(source, self.state_dir)
+                self.stats[source] = {"new": 0, "seen": 0}
+            return self._indexes[source]
+
+    def take_new(self, source: str, posts: list[dict]) -> tuple[list[dict], bool]:
+        """한 페이지에서 새 게시글만 추림
+
+        Returns:
+            (new_posts, exhausted) - exhausted: 페이지 전체가 이미 본 게시글 → 다음 페이지 불필요
+        """
+        index = self.index(source)
+        new_posts, seen_count = index.take_new(posts)
+
+        with self._lock:
+            self.stats[source]["new"] += len(new_posts)
+            self.stats[source]["seen"] += seen_count
+
+        return new_posts, bool(posts) and not new_posts
+
+    def commit(self) -> None:
+        """모든 소스의 상태 저장 (저장 성공 후 호출)"""
+        with self._lock:
+            for index in self._indexes.values():
+                index.commit()
+
+    def summary(self) -> dict[str, dict]:
+        """소스별 새 게시글/중복 게시글 수와 high-water mark"""
+        with self._lock:
+            return {
+                source: {**self.stats[source], "high_water": index.high_water, "tracked": len(index)}
+                for source, index in self._indexes.items()
+            }
@@ -1,11 +1,25 @@
 """인벤 뉴스/이슈 크롤러"""
 import re
 from .base_scraper import BaseScraper
+from .lxml_engine import xpath, text_of
+
+
+# 기사 링크 패턴: /webzine/news/?news=숫자
+_NEWS_HREF = re.compile(r"/webzine/news/\?news=\d+")
+# 제목 끝의 댓글 수 (예: "[3]")
+_COMMENT_COUNT = re.compile(r'\[\d+\]$')
+_WHITESPACE = re.compile(r'\s+')
 
 
 class InvenScraper(BaseScraper):
     """인벤 뉴스 크롤러"""
 
+    cache_ttl = 1800  # 뉴스 목록은 갱신이 느림
+    parser = "lxml"
+
+    # 기사 링크 후보 (href 패턴은 XPath 1.0에 정규식이 없어 파이썬에서 확인)
+    _news_links = xpath("//a[contains(@href, '/webzine/news/?news=')]")
+
     @property
     def source_name(self) -> str:
         return "inven"
@@ -14,19 +28,18 @@ class InvenScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://www.inven.co.kr"
 
-    def scrape(self, page: int = 1) -> list[dict]:
-        """뉴스 페이지 크롤링"""
+    def page_url(self, page: int) -> str:
+        """뉴스 목록 URL"""
         # 인벤 뉴스 메인 페이지
-        url = f"{self.base_url}/webzine/news/"
-
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+        return f"{self.base_url}/webzine/news/"
 
+    def parse(self, doc) -> list[dict]:
+        """뉴스 목록 파싱"""
         posts = []
+        today = f"{self._today().isoformat()}T00:00:00"
 
         # 기사 링크 패턴: /webzine/news/?news=숫자
-        article_links = soup.find_all("a", href=re.compile(r"/webzine/news/\?news=\d+"))
+        article_links = [link for link in self._news_links(doc) if _NEWS_HREF.search(link.get("href", ""))]
 
         seen_urls = set()  # 중복 제거용
 
@@ -39,14 +52,14 @@ class InvenScraper(BaseScraper):
                     continue
                 seen_urls.add(href)
 
-                title = link.get_text(strip=True)
+                title = text_of(link)
                 if not title or len(title) < 5:
                     continue
 
                 # 댓글 수 제거 (예: "[기사제목][3]" -> "[기사제목]")
-                title = re.sub(r'\[\d+\]$', '', title).strip()
+                title = _COMMENT_COUNT.sub('', title).strip()
                 # 카테고리 태그 정리 (유지하되 불필요 공백 제거)
-                title = re.sub(r'\s+', ' ', title)
+                title = _WHITESPACE.sub(' ', title)
 
                 # 전체 URL 생성
                 if href.startswith("//"):
@@ -61,8 +74,7 @@ class InvenScraper(BaseScraper):
                 # 인벤 뉴스는 조회수/추천수가 목록에 표시되지 않음
                 # 뉴스 기사 날짜는 별도 파싱 필요 (목록에서 추출 어려움)
                 # 뉴스 페이지라 보통 당일 기사이므로 오늘 날짜 사용
-                from datetime import date
-                post_date = f"{date.today().isoformat()}T00:00:00"
+                post_date = today
 
                 posts.append(self.format_post(
                     title=title,
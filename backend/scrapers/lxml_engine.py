@@ -0,0 +1,192 @@
+"""lxml 기반 목록 페이지 파싱 엔진
+
+BeautifulSoup 트리를 만들지 않고 lxml 트리에서 직접 필드를 추출한다.
+XPath는 스크래퍼 클래스 정의 시점에 한 번만 컴파일해 모든 행에 재사용한다.
+
+추출 결과는 BeautifulSoup 기반 파싱과 같아야 하므로 텍스트 추출 규칙도 맞춘다.
+- text_of(el) == el.get_text(strip=True)  (주석/script/style/template 제외)
+"""
+import re
+import codecs
+from dataclasses import dataclass
+from lxml import etree
+
+
+# 텍스트 노드 (BeautifulSoup get_text와 동일하게 script/style/template 내부 제외)
+_TEXT_NODES = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+
+_FIRST_INT = re.compile(r"(\d+)")
+
+# 파서에 한 번에 넣는 크기
+_CHUNK_SIZE = 64 * 1024
+
+# libxml2에 바이트를 그대로 넘겨도 파이썬 디코딩과 결과가 같은 인코딩 (codecs 정규화 이름)
+_NATIVE_ENCODINGS = {"utf-8", "iso8859-1"}
+
+
+@dataclass(frozen=True)
+class Region:
+    """목록 영역 (예: Region("table", cls="gall_list"), Region(id="revolution_main_table"))"""
+    tag: str | None = None
+    id: str | None = None
+    cls: str | None = None
+
+    def matches(self, el) -> bool:
+        if self.tag is not None and el.tag != self.tag:
+            return False
+        if self.id is not None and el.get("id") != self.id:
+            return False
+        if self.cls is not None and self.cls not in el.get("class", "").split():
+            return False
+        return True
+
+
+def xpath(expr: str) -> etree.XPath:
+    """결과를 일반 문자열로 돌려주는 컴파일된 XPath"""
+    return etree.XPath(expr, smart_strings=False)
+
+
+def has_class(cls: str) -> str:
+    """CSS 클래스 선택자(.cls)에 해당하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+def _feed_mode(encoding: str | None) -> tuple[str | None, object]:
+    """(lxml에 넘길 인코딩, 파이썬 증분 디코더) 결정
+
+    UTF-8/Latin-1은 바이트를 그대로 libxml2에 넘긴다 (잘못된 바이트 처리도 파이썬 replace와 같음).
+    그 외(EUC-KR 등)는 libxml2가 잘못된 바이트에서 문서를 잘라버리므로
+    파이썬 증분 디코더(errors="replace")로 조각별로 디코딩해 넘긴다. 전체 문자열은 만들지 않는다.
+    """
+    try:
+        codec = codecs.lookup(encoding or "utf-8")
+    except LookupError:
+        codec = codecs.lookup("utf-8")
+
+    if codec.name in _NATIVE_ENCODINGS:
+        return codec.name, None
+    return None, codec.incrementaldecoder(errors="replace")
+
+
+class RegionStreamParser:
+    """응답 본문 조각을 받아 목록 영역까지만 파싱하는 증분 파서
+
+    - 영역이 시작되면 그 앞의 요소(head, 메뉴 등)를 트리에서 떼어내고
+    - 영역이 닫히면 이후 조각(광고, 스크립트, 푸터 등)은 파싱하지 않는다.
+    region.tag를 지정하면 해당 태그 이벤트만 받아 파이썬 쪽 처리도 최소화된다.
+    """
+
+    def __init__(self, region: Region, encoding: str | None):
+        lxml_encoding, self._decoder = _feed_mode(encoding)
+        self._parser = etree.HTMLPullParser(events=("start", "end"), tag=region.tag, encoding=lxml_encoding)
+        self._region = region
+        self._region_el = None
+        self.root = None
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """본문 조각 입력 (영역 파싱이 끝났으면 True, 이후 입력은 무시)"""
+        if self.done:
+            return True
+        data = self._decoder.decode(chunk) if self._decoder else chunk
+        if data:
+            self._parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> etree._Element | None:
+        """입력 종료 → 문서 루트 (영역 앞 요소는 제거됨, 절대 XPath 사용 가능), 영역이 없으면 None"""
+        if not self.done:
+            if self._decoder:
+                tail = self._decoder.decode(b"", final=True)
+                if tail:
+                    self._parser.feed(tail)
+            try:
+                self._parser.close()
+            except etree.XMLSyntaxError:
+                # 빈 문서
+                pass
+            self._read_events()
+            self.done = True
+        return self.root
+
+    def _read_events(self) -> bool:
+        for event, el in self._parser.read_events():
+            if self._region_el is None:
+                if event == "start" and self._region.matches(el):
+                    self._region_el = el
+                    _drop_preceding(el)
+            elif event == "end" and el is self._region_el:
+                self.root = el.getroottree().getroot()
+                self.done = True
+                break
+        return self.done
+
+
+def parse_html(content: bytes, encoding: str | None) -> etree._Element | None:
+    """HTML 바이트 → lxml 루트 (빈 문서면 None)"""
+    lxml_encoding, decoder = _feed_mode(encoding)
+    if decoder is None:
+        return etree.fromstring(content, etree.HTMLParser(encoding=lxml_encoding))
+
+    parser = etree.HTMLPullParser()
+    for offset in range(0, len(content), _CHUNK_SIZE):
+        text = decoder.decode(content[offset:offset + _CHUNK_SIZE])
+        if text:
+            parser.feed(text)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        parser.feed(tail)
+    try:
+        return parser.close()
+    except etree.XMLSyntaxError:
+        # 빈 문서
+        return None
+
+
+def parse_region(content: bytes, region: Region, encoding: str | None) -> etree._Element | None:
+    """HTML 바이트에서 목록 영역까지만 파싱 (영역이 없으면 None)"""
+    parser = RegionStreamParser(region, encoding)
+    for offset in range(0, len(content), _CHUNK_SIZE):
+        if parser.feed(content[offset:offset + _CHUNK_SIZE]):
+            break
+    return parser.close()
+
+
+def _drop_preceding(el) -> None:
+    """el과 그 조상들의 앞쪽 형제 요소 제거 (영역을 포함할 수 없는 부분)"""
+    node = el
+    while node is not None:
+        parent = node.getparent()
+        if parent is not None:
+            for sibling in list(node.itersiblings(preceding=True)):
+                parent.remove(sibling)
+        node = parent
+
+
+def first(nodes: list):
+    """XPath 결과의 첫 요소 (select_one과 동일, 없으면 None)"""
+    return nodes[0] if nodes else None
+
+
+def text_of(el) -> str:
+    """el.get_text(strip=True)와 같은 결과"""
+    return "".join(s.strip() for s in _TEXT_NODES(el))
+
+
+def classes_of(el) -> list[str]:
+    """class 속성 목록 (BeautifulSoup el.get("class", [])와 동일)"""
+    return el.get("class", "").split()
+
+
+def digits_int(text: str) -> int:
+    """숫자로만 된 문자열이면 정수, 아니면 0"""
+    return int(text) if text.isdigit() else 0
+
+
+def search_int(text: str, pattern: re.Pattern = _FIRST_INT) -> int:
+    """쉼표를 제거한 문자열에서 pattern의 첫 그룹을 정수로 (없으면 0)"""
+    match = pattern.search(text.replace(",", ""))
+    return int(match.group(1)) if match else 0
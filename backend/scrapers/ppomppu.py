@@ -1,11 +1,26 @@
 """뽐뿌 핫딜 게시판 크롤러"""
 import re
 from .base_scraper import BaseScraper
+from .lxml_engine import Region, xpath, has_class, first, text_of, search_int
+
+
+# "추천 - 비추천" 형태에서 앞쪽 추천수
+_LEADING_INT = re.compile(r"^(\d+)")
 
 
 class PpomppuScraper(BaseScraper):
     """뽐뿌 핫딜 크롤러"""
 
+    cache_ttl = 300  # 핫딜 목록은 갱신이 잦음
+    parser = "lxml"
+    list_region = Region("table", id="revolution_main_table")
+
+    # 행/필드 XPath (클래스 정의 시 한 번만 컴파일)
+    _main_table = xpath("//*[@id='revolution_main_table']")
+    _rows = xpath(f".//tr[{has_class('baseList')}]")
+    _view_links = xpath(".//a[contains(@href, 'view.php')]")
+    _cells = xpath(".//td")
+
     def __init__(self):
         # 뽐뿌는 EUC-KR 인코딩 사용
         super().__init__(encoding="euc-kr")
@@ -18,31 +33,29 @@ class PpomppuScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://www.ppomppu.co.kr"
 
-    def scrape(self, page: int = 1) -> list[dict]:
-        """핫딜 게시판 크롤링"""
-        url = f"{self.base_url}/zboard/zboard.php?id=ppomppu&page={page}"
-
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+    def page_url(self, page: int) -> str:
+        """핫딜 게시판 목록 URL"""
+        return f"{self.base_url}/zboard/zboard.php?id=ppomppu&page={page}"
 
+    def parse(self, doc) -> list[dict]:
+        """핫딜 게시판 목록 파싱"""
         posts = []
         # 메인 테이블에서 게시글 행 선택 (baseList 클래스)
-        main_table = soup.select_one("#revolution_main_table")
-        if not main_table:
+        main_table = first(self._main_table(doc))
+        if main_table is None:
             return []
 
-        rows = main_table.select("tr.baseList")
+        rows = self._rows(main_table)
 
         for row in rows:
             try:
                 # 제목 링크 (두번째 a[href*='view.php']가 제목)
-                title_links = row.select("a[href*='view.php']")
+                title_links = self._view_links(row)
                 if len(title_links) < 2:
                     continue
 
                 title_elem = title_links[1]  # 두번째가 제목 링크
-                title = title_elem.get_text(strip=True)
+                title = text_of(title_elem)
 
                 # 빈 제목 스킵
                 if not title or len(title) < 2:
@@ -59,29 +72,22 @@ class PpomppuScraper(BaseScraper):
                     post_url = f"{self.base_url}/zboard/{href}"
 
                 # td 구조: 0=번호, 1=제목, 2=작성자, 3=날짜, 4=추천, 5=조회수
-                tds = row.select("td")
+                tds = self._cells(row)
 
                 # 조회수 추출 (6번째 td, 인덱스 5)
                 views = 0
                 if len(tds) >= 6:
-                    view_text = tds[5].get_text(strip=True)
-                    view_match = re.search(r"(\d+)", view_text.replace(",", ""))
-                    if view_match:
-                        views = int(view_match.group(1))
+                    views = search_int(text_of(tds[5]))
 
                 # 추천수 추출 (5번째 td, 인덱스 4) - "추천 - 비추천" 형태
                 likes = 0
                 if len(tds) >= 5:
-                    like_text = tds[4].get_text(strip=True)
-                    like_match = re.search(r"^(\d+)", like_text.replace(",", ""))
-                    if like_match:
-                        likes = int(like_match.group(1))
+                    likes = search_int(text_of(tds[4]), _LEADING_INT)
 
                 # 작성일 추출 (4번째 td, 인덱스 3)
                 post_date = None
                 if len(tds) >= 4:
-                    date_str = tds[3].get_text(strip=True)
-                    post_date = self._parse_date(date_str)
+                    post_date = self._parse_date(text_of(tds[3]))
 
                 posts.append(self.format_post(
                     title=title,
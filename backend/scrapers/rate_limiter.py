@@ -0,0 +1,137 @@
+"""호스트별 적응형 토큰 버킷 요청 제한기
+
+같은 도메인에 요청하는 모든 스크래퍼가 하나의 제한기를 공유한다.
+- 토큰 버킷: 초당 rate개 토큰 보충, burst개까지 누적
+- 차단 응답(429/430/503): 속도를 절반으로 줄이고 Retry-After 동안 요청 중지
+- 정상 응답: 속도를 조금씩 올려 max_rate까지 회복 (AIMD)
+"""
+import time
+import random
+import asyncio
+import threading
+from email.utils import parsedate_to_datetime
+
+
+# 봇 차단/과부하 응답 코드 (430: fmkorea 봇 차단)
+THROTTLE_STATUS_CODES = {429, 430, 503}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더 → 대기 시간(초)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostRateLimiter:
+    """단일 호스트 토큰 버킷 (스레드/asyncio 공용)"""
+
+    def __init__(
+        self,
+        host: str,
+        rate: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: float = 3.0,
+        burst: float = 1.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        jitter: float = 0.3,
+    ):
+        """
+        Args:
+            host: 호스트 이름
+            rate: 초기 초당 요청 수
+            min_rate / max_rate: 속도 조절 범위
+            burst: 최대 누적 토큰 수
+            increase: 정상 응답마다 올리는 초당 요청 수
+            decrease: 차단 응답 시 곱하는 비율
+            jitter: 요청 간격에 더하는 랜덤 지터 비율 (봇 감지 우회)
+        """
+        self.host = host
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.jitter = jitter
+
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.throttled = 0
+
+    def _reserve(self, jitter: bool = True) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            self.requests += 1
+
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+
+        if jitter and self.jitter:
+            wait += random.uniform(0, self.jitter / self.rate)
+        return wait
+
+    def acquire(self, jitter: bool = True) -> None:
+        """요청 전 호출 (필요한 만큼 대기)"""
+        wait = self._reserve(jitter)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, jitter: bool = True) -> None:
+        """acquire의 asyncio 버전"""
+        wait = self._reserve(jitter)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_response(self, status_code: int | None, retry_after: str | None = None) -> None:
+        """응답 결과로 속도 조절 (status_code=None: 타임아웃/연결 오류)"""
+        with self._lock:
+            if status_code is None or status_code in THROTTLE_STATUS_CODES:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                if status_code is not None:
+                    self.throttled += 1
+                    delay = parse_retry_after(retry_after)
+                    if delay is None:
+                        delay = 1 / self.rate
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+            elif status_code < 400:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def snapshot(self) -> dict:
+        """현재 상태 (실행 요약용)"""
+        with self._lock:
+            return {"rate": round(self.rate, 2), "requests": self.requests, "throttled": self.throttled}
+
+
+_limiters: dict[str, HostRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(host: str, **options) -> HostRateLimiter:
+    """호스트별 공유 제한기 (처음 생성할 때만 options 적용)"""
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = HostRateLimiter(host, **options)
+        return _limiters[host]
+
+
+def rate_limiter_summary() -> dict[str, dict]:
+    """호스트별 제한기 상태"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.host: limiter.snapshot() for limiter in limiters}
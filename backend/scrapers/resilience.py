@@ -0,0 +1,80 @@
+"""요청 재시도 정책과 소스별 서킷 브레이커"""
+import random
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """지수 백오프 + 지터 재시도 정책"""
+    max_retries: int = 2
+    # 타임아웃 재시도 횟수 (타임아웃은 시도마다 요청 제한 시간만큼 걸려 응답 없는 소스에서 비용이 큼)
+    max_timeout_retries: int = 1
+    base_delay: float = 1.0
+    max_delay: float = 10.0
+    # 재시도할 HTTP 상태 코드 (그 외 4xx는 재시도해도 결과가 같으므로 즉시 실패)
+    retry_status_codes: frozenset[int] = frozenset({429, 430, 500, 502, 503, 504})
+
+    def is_retryable(self, status_code: int) -> bool:
+        return status_code in self.retry_status_codes
+
+    def retries_for(self, timed_out: bool) -> int:
+        """오류 종류별 최대 재시도 횟수"""
+        return min(self.max_retries, self.max_timeout_retries) if timed_out else self.max_retries
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째(0부터) 실패 후 대기 시간 (full jitter)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """소스별 서킷 브레이커
+
+    실패한 요청 시도(재시도 포함)가 연속 failure_threshold회에 도달하거나
+    재시도할 수 있는 오류(타임아웃, 5xx 등)로 한 페이지의 재시도를 모두 쓰면 open 상태가 되어
+    이번 실행에서 해당 소스의 남은 요청을 모두 건너뛴다.
+    """
+
+    def __init__(self, source: str, failure_threshold: int = 3):
+        self.source = source
+        self.failure_threshold = failure_threshold
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.skipped = 0
+        self.state = "closed"
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == "open"
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+
+    def record_failure(self, exhausted: bool = False) -> None:
+        """실패한 요청 시도 기록
+
+        Args:
+            exhausted: 재시도할 수 있는 오류로 재시도를 모두 썼는지 (True면 바로 open)
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            self.total_failures += 1
+            if self.state == "open":
+                return
+            if exhausted:
+                self.state = "open"
+                print(f"[{self.source}] {self.consecutive_failures}회 시도 모두 실패 → 서킷 open (이번 실행에서 건너뜀)")
+            elif self.consecutive_failures >= self.failure_threshold:
+                self.state = "open"
+                print(f"[{self.source}] 연속 {self.consecutive_failures}회 실패 → 서킷 open (이번 실행에서 건너뜀)")
+
+    def record_skip(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def snapshot(self) -> dict:
+        """현재 상태 (실행 요약용)"""
+        with self._lock:
+            return {"state": self.state, "failures": self.total_failures, "skipped": self.skipped}
@@ -1,11 +1,28 @@
 """루리웹 베스트 게시판 크롤러"""
 import re
 from .base_scraper import BaseScraper
+from .lxml_engine import Region, xpath, has_class, first, text_of, search_int
+
+
+# 제목 끝의 댓글 수 (예: "제목(59)")
+_COMMENT_COUNT = re.compile(r'\s*\(\d+\)\s*$')
 
 
 class RuliwebScraper(BaseScraper):
     """루리웹 베스트 크롤러"""
 
+    cache_ttl = 600
+    parser = "lxml"
+    list_region = Region("table", cls="board_list_table")
+
+    # 행/필드 XPath (클래스 정의 시 한 번만 컴파일)
+    _rows = xpath(f"//tr[{has_class('table_body')}]")
+    _subject_link = xpath(f".//a[{has_class('subject_link')}]")
+    _subject_any = xpath(f".//td[{has_class('subject')}]//a")
+    _views = xpath(f".//td[{has_class('hit')}]")
+    _likes = xpath(f".//td[{has_class('recomd')}]")
+    _date = xpath(f".//td[{has_class('time')}]")
+
     @property
     def source_name(self) -> str:
         return "ruliweb"
@@ -14,28 +31,28 @@ class RuliwebScraper(BaseScraper):
     def base_url(self) -> str:
         return "https://bbs.ruliweb.com"
 
-    def scrape(self, page: int = 1) -> list[dict]:
-        """베스트 게시판 크롤링"""
-        url = f"{self.base_url}/best/selection?page={page}"
-
-        soup = self.fetch_page(url)
-        if not soup:
-            return []
+    def page_url(self, page: int) -> str:
+        """베스트 게시판 목록 URL"""
+        return f"{self.base_url}/best/selection?page={page}"
 
+    def parse(self, doc) -> list[dict]:
+        """베스트 게시판 목록 파싱"""
         posts = []
         # 게시글 목록 선택자 - 테이블 구조
-        rows = soup.select("tr.table_body")
+        rows = self._rows(doc)
 
         for row in rows:
             try:
                 # 제목 추출 (subject_link 클래스)
-                title_elem = row.select_one("a.subject_link") or row.select_one("td.subject a")
-                if not title_elem:
+                title_elem = first(self._subject_link(row))
+                if title_elem is None:
+                    title_elem = first(self._subject_any(row))
+                if title_elem is None:
                     continue
 
-                title = title_elem.get_text(strip=True)
+                title = text_of(title_elem)
                 # 댓글 수 제거 (예: "제목(59)" -> "제목")
-                title = re.sub(r'\s*\(\d+\)\s*$', '', title).strip()
+                title = _COMMENT_COUNT.sub('', title).strip()
 
                 href = title_elem.get("href", "")
 
@@ -51,28 +68,21 @@ class RuliwebScraper(BaseScraper):
 
                 # 조회수 추출 (td.hit)
                 views = 0
-                view_elem = row.select_one("td.hit")
-                if view_elem:
-                    view_text = view_elem.get_text(strip=True)
-                    view_match = re.search(r"(\d+)", view_text.replace(",", ""))
-                    if view_match:
-                        views = int(view_match.group(1))
+                view_elem = first(self._views(row))
+                if view_elem is not None:
+                    views = search_int(text_of(view_elem))
 
                 # 추천수 추출 (td.recomd)
                 likes = 0
-                like_elem = row.select_one("td.recomd")
-                if like_elem:
-                    like_text = like_elem.get_text(strip=True)
-                    like_match = re.search(r"(\d+)", like_text.replace(",", ""))
-                    if like_match:
-                        likes = int(like_match.group(1))
+                like_elem = first(self._likes(row))
+                if like_elem is not None:
+                    likes = search_int(text_of(like_elem))
 
                 # 작성일 추출 (td.time)
                 post_date = None
-                date_elem = row.select_one("td.time")
-                if date_elem:
-                    date_str = date_elem.get_text(strip=True)
-                    post_date = self._parse_date(date_str)
+                date_elem = first(self._date(row))
+                if date_elem is not None:
+                    post_date = self._parse_date(text_of(date_elem))
 
                 posts.append(self.format_post(
                     title=title,
@@ -0,0 +1,37 @@
+"""
+키워드 인덱스 생성 (ai/keywords.py → .cache/keyword_index)
+
+분류기는 인덱스가 없거나 keywords.py가 바뀌면 자동으로 다시 만들지만,
+배포/스케줄 실행 전에 미리 만들어 두면 첫 실행에서도 생성 시간이 들지 않는다.
+
+사용법:
+    python scripts/build_keyword_index.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai.keywords import KEYWORDS
+from ai.keyword_matcher import load_keyword_index, keyword_set_hash
+
+
+def main():
+    started = time.perf_counter()
+    load_keyword_index(rebuild=True)
+    built = time.perf_counter() - started
+
+    started = time.perf_counter()
+    load_keyword_index()
+    loaded = time.perf_counter() - started
+
+    total = sum(len(words) for words in KEYWORDS.values())
+    print(f"키워드 인덱스 생성 완료: {total}개 키워드 (해시 {keyword_set_hash(KEYWORDS)})")
+    print(f"  생성 {built * 1000:.1f}ms / 로드 {loaded * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
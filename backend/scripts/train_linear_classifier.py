@@ -0,0 +1,55 @@
+"""
+선형 분류기 학습 (수동 분류 파일 + 규칙 분류 고신뢰도 결과)
+
+수동 분류를 마친 export 파일(output/uncertain_posts_*.txt)과
+저장소(STORAGE_BACKEND)의 raw_posts를 규칙 분류기로 분류한 결과 중 신뢰도가 높은 것을 학습 데이터로 사용한다.
+
+사용법:
+    python scripts/train_linear_classifier.py                     # output/ 수동 분류 파일만
+    python scripts/train_linear_classifier.py --raw-posts 5000    # + raw_posts 최근 5000개
+    python scripts/train_linear_classifier.py output/a.txt output/b.txt
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ai.linear_classifier import build_training_set, LinearClassifier
+
+
+def main():
+    args = sys.argv[1:]
+
+    raw_limit = 0
+    if "--raw-posts" in args:
+        index = args.index("--raw-posts")
+        raw_limit = int(args[index + 1])
+        del args[index:index + 2]
+
+    labelled_files = args or sorted(str(p) for p in (Path(__file__).parent.parent / "output").glob("uncertain_posts_*.txt"))
+
+    posts = []
+    if raw_limit:
+        from storage import get_storage_backend
+        posts = get_storage_backend().get_raw_posts(limit=raw_limit)
+        print(f"raw_posts {len(posts)}개 로드")
+
+    texts, labels, weights = build_training_set(labelled_files, posts)
+    if not texts:
+        print("학습 데이터가 없습니다. (수동 분류 파일 또는 --raw-posts 필요)")
+        sys.exit(1)
+
+    manual = sum(1 for weight in weights if weight != 1.0)
+    print(f"학습 데이터: {len(texts)}개 (수동 분류 {manual}개, 규칙 분류 {len(texts) - manual}개)")
+
+    started = time.perf_counter()
+    classifier = LinearClassifier().fit(texts, labels, weights)
+    path = classifier.save()
+    print(f"학습 완료 ({time.perf_counter() - started:.2f}초): {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""저장소 모듈 (STORAGE_BACKEND 환경변수로 선택: supabase | sqlite)"""
+import os
+import threading
+
+from .base import StorageBackend
+from .supabase_backend import SupabaseBackend
+from .sqlite_backend import SQLiteBackend
+
+
+BACKENDS: dict[str, type[StorageBackend]] = {
+    SupabaseBackend.name: SupabaseBackend,
+    SQLiteBackend.name: SQLiteBackend,
+}
+
+_default_backend: StorageBackend | None = None
+_default_backend_lock = threading.Lock()
+
+
+def get_storage_backend() -> StorageBackend:
+    """기본 저장소 (STORAGE_BACKEND, 기본값 supabase - sqlite는 SQLITE_STORAGE_PATH에 저장)"""
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            name = os.getenv("STORAGE_BACKEND", SupabaseBackend.name).lower()
+            if name not in BACKENDS:
+                raise ValueError(f"알 수 없는 STORAGE_BACKEND: {name} (사용 가능: {', '.join(BACKENDS)})")
+            _default_backend = BACKENDS[name]()
+        return _default_backend
+
+
+__all__ = [
+    "StorageBackend",
+    "SupabaseBackend",
+    "SQLiteBackend",
+    "BACKENDS",
+    "get_storage_backend",
+]
@@ -0,0 +1,63 @@
+"""저장소 인터페이스"""
+from abc import ABC, abstractmethod
+
+from supabase_client import is_transient_error
+
+
+class StorageBackend(ABC):
+    """raw_posts / rankings 저장소 (확장 가능)
+
+    구현체는 여러 스레드에서 동시에 호출될 수 있다 (BulkWriter).
+    """
+
+    # 출력/설정용 이름 (STORAGE_BACKEND 환경변수 값)
+    name: str = ""
+
+    def connect(self) -> None:
+        """연결/설정 확인 (설정 오류를 행 단위 저장 실패보다 먼저 드러내기 위함)"""
+
+    def is_transient(self, error: Exception) -> bool:
+        """재시도하면 성공할 수 있는 오류인지 (BulkWriter가 재시도/스풀에 남길지, 배치를 나눠 데이터 문제를 찾을지 결정)"""
+        return is_transient_error(error)
+
+    @abstractmethod
+    def insert_raw_posts(self, posts: list[dict]) -> list[dict]:
+        """
+        원본 게시글 저장 (같은 ID면 업데이트)
+
+        Args:
+            posts: 게시글 (ID가 없으면 URL 기반 UUID 생성)
+
+        Returns:
+            저장된 행
+        """
+        pass
+
+    @abstractmethod
+    def upsert_rankings(self, rankings: list[dict]) -> list[dict]:
+        """
+        순위 데이터 Upsert (keyword + category 기반 UUID)
+
+        Returns:
+            저장된 행
+        """
+        pass
+
+    @abstractmethod
+    def get_raw_posts(self, source: str | None = None, limit: int = 100) -> list[dict]:
+        """원본 게시글 조회 (최근 수집 순)"""
+        pass
+
+    @abstractmethod
+    def get_rankings(self, category: str | None = None, limit: int = 20) -> list[dict]:
+        """순위 데이터 조회 (popularity_score 내림차순)"""
+        pass
+
+    @abstractmethod
+    def delete_old_rankings(self, days: int = 7) -> int:
+        """updated_at이 days일보다 오래된 순위 데이터 삭제
+
+        Returns:
+            삭제된 행 수
+        """
+        pass
@@ -0,0 +1,155 @@
+"""내장 SQLite 저장소 (Supabase 없이 로컬 실행/부하 테스트/대량 처리용)
+
+- 스키마는 Supabase rankings / raw_posts 테이블과 같은 컬럼 (UUID·시각은 TEXT(ISO 8601, UTC), source_urls는 JSON TEXT)
+- WAL 모드 (읽기와 쓰기가 서로 막지 않음), 한 연결을 락으로 공유
+- 인덱스: rankings(category, popularity_score, created_at, updated_at, keyword), raw_posts(source, scraped_at)
+- Upsert는 PostgREST처럼 보낸 컬럼만 갱신 (INSERT ... ON CONFLICT (id) DO UPDATE)
+"""
+import os
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from supabase_client import prepare_raw_posts, prepare_rankings, deduplicate_by_id
+
+from .base import StorageBackend
+
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / ".cache" / "memeboard.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rankings (
+    id TEXT PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT 'issue',
+    popularity_score INTEGER NOT NULL DEFAULT 0,
+    summary TEXT,
+    source_urls TEXT DEFAULT '[]',
+    rank_change INTEGER DEFAULT 0,
+    post_date TEXT,
+    thumbnail_url TEXT,
+    ai_summary TEXT,
+    community_reaction TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_rankings_category ON rankings (category, popularity_score DESC);
+CREATE INDEX IF NOT EXISTS idx_rankings_popularity ON rankings (popularity_score DESC);
+CREATE INDEX IF NOT EXISTS idx_rankings_created_at ON rankings (created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_rankings_updated_at ON rankings (updated_at);
+CREATE INDEX IF NOT EXISTS idx_rankings_keyword ON rankings (keyword);
+
+CREATE TABLE IF NOT EXISTS raw_posts (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT,
+    url TEXT,
+    views INTEGER DEFAULT 0,
+    likes INTEGER DEFAULT 0,
+    post_date TEXT,
+    scraped_at TEXT DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+);
+CREATE INDEX IF NOT EXISTS idx_raw_posts_source ON raw_posts (source, scraped_at DESC);
+CREATE INDEX IF NOT EXISTS idx_raw_posts_scraped_at ON raw_posts (scraped_at DESC);
+"""
+
+# JSON으로 저장하는 컬럼
+_JSON_COLUMNS = {"source_urls"}
+
+
+class SQLiteBackend(StorageBackend):
+    """SQLite 저장소 (스레드 안전)"""
+
+    name = "sqlite"
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        Args:
+            path: DB 파일 경로 (기본값: SQLITE_STORAGE_PATH 환경변수 또는 backend/.cache/memeboard.sqlite3)
+        """
+        self.path = Path(path or os.getenv("SQLITE_STORAGE_PATH") or DEFAULT_DB_PATH)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;" + _SCHEMA)
+        self._columns = {
+            table: [row["name"] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+            for table in ("rankings", "raw_posts")
+        }
+
+    def is_transient(self, error: Exception) -> bool:
+        # database is locked, 디스크 I/O 오류 등 (알 수 없는 컬럼은 _upsert에서 ValueError로 먼저 걸러냄)
+        return isinstance(error, sqlite3.OperationalError) or super().is_transient(error)
+
+    def _upsert(self, table: str, rows: list[dict]) -> list[dict]:
+        """보낸 컬럼만 갱신하는 Upsert (컬럼 구성이 같은 행끼리 묶어 executemany)"""
+        known = self._columns[table]
+        known_set = set(known)
+        groups: dict[tuple[str, ...], list[dict]] = {}
+        for row in rows:
+            unknown = row.keys() - known_set
+            if unknown:
+                raise ValueError(f"{table}: 알 수 없는 컬럼 {sorted(unknown)}")
+            groups.setdefault(tuple(column for column in known if column in row), []).append(row)
+
+        with self._lock, self._conn:
+            for columns, group in groups.items():
+                updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "id")
+                self._conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+                    f" ON CONFLICT (id) DO {'UPDATE SET ' + updates if updates else 'NOTHING'}",
+                    [
+                        [
+                            json.dumps(row[column], ensure_ascii=False) if column in _JSON_COLUMNS else row[column]
+                            for column in columns
+                        ]
+                        for row in group
+                    ],
+                )
+        return rows
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> dict:
+        item = dict(row)
+        for column in _JSON_COLUMNS & item.keys():
+            if item[column] is not None:
+                item[column] = json.loads(item[column])
+        return item
+
+    def _select(self, sql: str, params: list) -> list[dict]:
+        with self._lock:
+            return [self._to_dict(row) for row in self._conn.execute(sql, params)]
+
+    def insert_raw_posts(self, posts: list[dict]) -> list[dict]:
+        return self._upsert("raw_posts", deduplicate_by_id(prepare_raw_posts(posts)))
+
+    def upsert_rankings(self, rankings: list[dict]) -> list[dict]:
+        return self._upsert("rankings", deduplicate_by_id(prepare_rankings(rankings)))
+
+    def get_raw_posts(self, source: str | None = None, limit: int = 100) -> list[dict]:
+        if source:
+            return self._select(
+                "SELECT * FROM raw_posts WHERE source = ? ORDER BY scraped_at DESC LIMIT ?", [source, limit]
+            )
+        return self._select("SELECT * FROM raw_posts ORDER BY scraped_at DESC LIMIT ?", [limit])
+
+    def get_rankings(self, category: str | None = None, limit: int = 20) -> list[dict]:
+        if category:
+            return self._select(
+                "SELECT * FROM rankings WHERE category = ? ORDER BY popularity_score DESC LIMIT ?", [category, limit]
+            )
+        return self._select("SELECT * FROM rankings ORDER BY popularity_score DESC LIMIT ?", [limit])
+
+    def delete_old_rankings(self, days: int = 7) -> int:
+        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM rankings WHERE updated_at < ?", (cutoff,)).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,28 @@
+"""Supabase 저장소 (supabase_client 함수 사용)"""
+import supabase_client
+
+from .base import StorageBackend
+
+
+class SupabaseBackend(StorageBackend):
+    """Supabase 저장소 - 프로세스 공유 클라이언트(get_client) 사용"""
+
+    name = "supabase"
+
+    def connect(self) -> None:
+        supabase_client.get_client()
+
+    def insert_raw_posts(self, posts: list[dict]) -> list[dict]:
+        return supabase_client.insert_raw_posts(posts)
+
+    def upsert_rankings(self, rankings: list[dict]) -> list[dict]:
+        return supabase_client.upsert_rankings(rankings)
+
+    def get_raw_posts(self, source: str | None = None, limit: int = 100) -> list[dict]:
+        return supabase_client.get_raw_posts(source, limit)
+
+    def get_rankings(self, category: str | None = None, limit: int = 20) -> list[dict]:
+        return supabase_client.get_rankings(category, limit)
+
+    def delete_old_rankings(self, days: int = 7) -> int:
+        return supabase_client.delete_old_rankings(days)
@@ -1,23 +1,130 @@
 """Supabase 클라이언트 모듈"""
 import os
+import json
+import time
 import uuid
+import random
 import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Callable, TYPE_CHECKING
+
+import httpx
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from postgrest.exceptions import APIError
+from supabase import create_client, Client, ClientOptions
+
+from row_digest import RowDigestStore
+from write_spool import WriteSpool, FlushResult, DEFAULT_BACKEND as DEFAULT_SPOOL_BACKEND
+
+if TYPE_CHECKING:
+    from storage import StorageBackend
 
 load_dotenv()
 
 
-def get_client() -> Client:
-    """Supabase 클라이언트 인스턴스 반환"""
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_KEY")
+# 프로세스 전체에서 공유하는 클라이언트 (첫 호출 시 생성, 모든 저장 함수가 같은 커넥션 풀 사용)
+_client: Client | None = None
+_http_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+# 클라이언트 생성 / 커넥션 연결 통계
+_stats_lock = threading.Lock()
+_client_stats = {
+    "clients": 0,
+    "client_setup_seconds": 0.0,
+    "requests": 0,
+    "connections": 0,
+    "connect_seconds": 0.0,
+}
+_trace_state = threading.local()
+
+
+def _count_request(request: httpx.Request) -> None:
+    """요청 수 집계 + 새 커넥션 연결(TCP/TLS) 시간 측정용 trace 등록"""
+    with _stats_lock:
+        _client_stats["requests"] += 1
+    request.extensions["trace"] = _trace_connection
+
+
+def _trace_connection(event_name: str, info: dict) -> None:
+    """httpcore trace 콜백 - 커넥션을 새로 맺을 때만 connect_tcp/start_tls 이벤트가 옴"""
+    if event_name in ("connection.connect_tcp.started", "connection.start_tls.started"):
+        _trace_state.started = time.perf_counter()
+    elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+        elapsed = time.perf_counter() - getattr(_trace_state, "started", time.perf_counter())
+        with _stats_lock:
+            _client_stats["connect_seconds"] += elapsed
+            if event_name == "connection.connect_tcp.complete":
+                _client_stats["connections"] += 1
+
+
+def _create_http_client() -> httpx.Client:
+    """keep-alive 커넥션 풀 (동시 저장 스레드 수만큼 커넥션 유지)"""
+    return httpx.Client(
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        follow_redirects=True,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("SUPABASE_MAX_CONNECTIONS", "8")),
+            max_keepalive_connections=int(os.getenv("SUPABASE_MAX_CONNECTIONS", "8")),
+            keepalive_expiry=60.0,
+        ),
+        event_hooks={"request": [_count_request]},
+    )
 
-    if not url or not key:
-        raise ValueError("SUPABASE_URL과 SUPABASE_KEY 환경변수가 필요합니다.")
 
-    return create_client(url, key)
+def get_client() -> Client:
+    """Supabase 클라이언트 반환 (프로세스 전체 공유, 스레드 안전)"""
+    global _client, _http_client
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            started = time.perf_counter()
+            url = os.getenv("SUPABASE_URL")
+            key = os.getenv("SUPABASE_KEY")
+
+            if not url or not key:
+                raise ValueError("SUPABASE_URL과 SUPABASE_KEY 환경변수가 필요합니다.")
+
+            _http_client = _create_http_client()
+            try:
+                client = create_client(url, key, options=ClientOptions(httpx_client=_http_client))
+            except TypeError:
+                # httpx_client 옵션이 없는 구버전 supabase - 클라이언트 내부 세션을 공유
+                _http_client.close()
+                _http_client = None
+                client = create_client(url, key)
+
+            # PostgREST 클라이언트는 지연 생성되므로 여러 스레드가 동시에 만들지 않도록 여기서 생성
+            client.postgrest
+
+            _client = client
+            with _stats_lock:
+                _client_stats["clients"] += 1
+                _client_stats["client_setup_seconds"] += time.perf_counter() - started
+    return _client
+
+
+def close_client() -> None:
+    """공유 클라이언트와 커넥션 풀 정리 (다음 get_client()에서 다시 생성)"""
+    global _client, _http_client
+    with _client_lock:
+        if _http_client is not None:
+            _http_client.close()
+        _client = None
+        _http_client = None
+
+
+def client_summary() -> dict:
+    """클라이언트 생성 수/시간, 요청 수, 새 커넥션 수/연결 시간 (이번 실행 누적)"""
+    with _stats_lock:
+        return dict(_client_stats)
 
 
 def generate_uuid_from_string(source: str, title: str) -> str:
@@ -51,13 +158,8 @@ def deduplicate_by_id(items: list[dict]) -> list[dict]:
     return list(seen.values())
 
 
-def insert_raw_posts(posts: list[dict]) -> dict:
-    """원본 게시글 저장 (중복 시 업데이트)
-
-    URL 기반으로 UUID를 생성하여 같은 URL의 게시글은 업데이트됨
-    """
-    client = get_client()
-
+def prepare_raw_posts(posts: list[dict]) -> list[dict]:
+    """raw_posts 저장 전처리 - ID가 없는 게시글에 결정론적 UUID 추가 (posts를 직접 수정)"""
     # UUID 형식 ID 추가 (URL 기반 - 더 정확한 중복 방지)
     for post in posts:
         if "id" not in post:
@@ -70,6 +172,16 @@ def insert_raw_posts(posts: list[dict]) -> dict:
                     post.get("source", "unknown"),
                     post.get("title", "")
                 )
+    return posts
+
+
+def insert_raw_posts(posts: list[dict]) -> dict:
+    """원본 게시글 저장 (중복 시 업데이트)
+
+    URL 기반으로 UUID를 생성하여 같은 URL의 게시글은 업데이트됨
+    """
+    client = get_client()
+    prepare_raw_posts(posts)
 
     # 배치 내 중복 제거
     posts = deduplicate_by_id(posts)
@@ -94,13 +206,8 @@ def get_raw_posts(source: str = None, limit: int = 100) -> list[dict]:
     return result.data
 
 
-def upsert_rankings(rankings: list[dict]) -> dict:
-    """
-    순위 데이터 Upsert (중복 방지)
-    - keyword + category를 기준으로 UUID 생성
-    """
-    client = get_client()
-
+def prepare_rankings(rankings: list[dict]) -> list[dict]:
+    """rankings 저장 전처리 - ID/시각/기본값 채움 (rankings를 직접 수정)"""
     now = datetime.utcnow().isoformat()
 
     for ranking in rankings:
@@ -124,6 +231,16 @@ def upsert_rankings(rankings: list[dict]) -> dict:
                 ranking["source_urls"] = [ranking["source_urls"]]
             elif ranking["source_urls"] is None:
                 ranking["source_urls"] = []
+    return rankings
+
+
+def upsert_rankings(rankings: list[dict]) -> dict:
+    """
+    순위 데이터 Upsert (중복 방지)
+    - keyword + category를 기준으로 UUID 생성
+    """
+    client = get_client()
+    prepare_rankings(rankings)
 
     # 배치 내 중복 제거
     rankings = deduplicate_by_id(rankings)
@@ -165,6 +282,322 @@ def delete_old_rankings(days: int = 7) -> int:
     return len(result.data) if result.data else 0
 
 
+
+# ------------------------------------------------------------------
+# 대량 저장 (BulkWriter)
+# ------------------------------------------------------------------
+
+# 일시적 오류로 보는 PostgreSQL SQLSTATE 클래스 (연결, 트랜잭션 충돌, 자원 부족, 운영자 개입/statement timeout)
+_TRANSIENT_SQLSTATE_CLASSES = ("08", "40", "53", "57")
+
+# 일시적 오류로 보는 PostgREST 오류 코드 (DB 연결 실패, 내부 연결 오류, 스키마 캐시 로드 실패, 커넥션 풀 대기 시간 초과
+# - 503/504 응답이지만 JSON 본문이라 code에 HTTP 상태 코드 대신 들어옴)
+_TRANSIENT_POSTGREST_CODES = frozenset({"PGRST000", "PGRST001", "PGRST002", "PGRST003"})
+
+
+def is_transient_error(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 오류인지 (그 외는 데이터 문제로 보고 배치를 나눔)"""
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, APIError):
+        code = str(error.code or "")
+        # JSON이 아닌 오류 응답(게이트웨이 등)은 HTTP 상태 코드가 code에 들어옴
+        if code.isdigit() and len(code) == 3:
+            return code == "429" or code.startswith("5")
+        if code in _TRANSIENT_POSTGREST_CODES:
+            return True
+        return code[:2] in _TRANSIENT_SQLSTATE_CLASSES
+    return False
+
+
+@dataclass
+class BulkWriteResult:
+    """대량 저장 결과"""
+    table: str
+    rows: int = 0
+    written: int = 0
+    # (행, 오류 메시지) - 분할해서 보내도 저장하지 못한 행 (데이터 문제)
+    failed: list[tuple[dict, str]] = field(default_factory=list)
+    # 재시도 횟수를 넘긴 일시적 오류(연결 실패, 5xx 등)로 저장하지 못한 행 - 나중에 다시 보내면 됨
+    deferred: list[tuple[dict, str]] = field(default_factory=list)
+    # 지난번에 저장한 내용과 같아서 보내지 않은 행 수
+    skipped: int = 0
+    batches: int = 0
+    retries: int = 0
+    splits: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.written / self.seconds if self.seconds else 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.deferred
+
+
+class BulkWriter:
+    """
+    병렬 적응형 대량 Upsert
+
+    - 배치 크기: 응답이 target_latency의 절반보다 빠르면 1.5배, 느리거나 일시적 오류가 나면 절반
+      (min_batch ~ max_batch 행, max_batch_bytes 바이트 이내)
+    - 동시에 max_in_flight개 배치까지 전송 (공유 클라이언트의 커넥션 풀 사용)
+    - 일시적 오류(is_transient, 기본값 is_transient_error)는 지수 백오프로 재시도
+    - 그 외 오류는 배치를 반으로 나눠 다시 보내 문제 행만 실패 처리
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[dict]], object],
+        table: str,
+        max_in_flight: int | None = None,
+        initial_batch: int = 50,
+        min_batch: int = 10,
+        max_batch: int = 1000,
+        max_batch_bytes: int = 1_000_000,
+        target_latency: float = 1.0,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        is_transient: Callable[[Exception], bool] = is_transient_error,
+    ):
+        """
+        Args:
+            write_batch: 배치 하나를 저장하는 함수 (예: insert_raw_posts)
+            table: 테이블 이름 (출력/결과용)
+            max_in_flight: 동시에 전송할 최대 배치 수 (기본값: SUPABASE_MAX_IN_FLIGHT 환경변수 또는 4)
+            initial_batch: 첫 배치 크기
+            min_batch / max_batch: 배치 크기 범위
+            max_batch_bytes: 배치 하나의 최대 JSON 크기
+            target_latency: 목표 배치 응답 시간(초)
+            max_retries: 일시적 오류 재시도 횟수
+            base_delay / max_delay: 재시도 대기 시간 (full jitter 지수 백오프)
+            is_transient: 재시도할 오류인지 판정 (저장소마다 다름 - StorageBackend.is_transient)
+        """
+        self.write_batch = write_batch
+        self.table = table
+        self.max_in_flight = max_in_flight or int(os.getenv("SUPABASE_MAX_IN_FLIGHT", "4"))
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.max_batch_bytes = max_batch_bytes
+        self.target_latency = target_latency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.is_transient = is_transient
+        self.batch_size = max(min_batch, min(initial_batch, max_batch))
+        self._lock = threading.Lock()
+        self._retries = 0
+
+    def _adapt(self, latency: float | None) -> None:
+        """배치 응답 시간(None: 일시적 오류)으로 다음 배치 크기 조정"""
+        with self._lock:
+            if latency is None or latency > self.target_latency:
+                self.batch_size = max(self.min_batch, self.batch_size // 2)
+            elif latency < self.target_latency / 2:
+                self.batch_size = min(self.max_batch, int(self.batch_size * 1.5) + 1)
+
+    def _next_batch(self, rows: list[dict], position: int) -> tuple[list[dict], int]:
+        """position부터 배치 크기/바이트 한도까지 행을 묶음 (최소 1행)"""
+        with self._lock:
+            size = self.batch_size
+        end = position
+        payload_bytes = 0
+        while end < len(rows) and end - position < size:
+            row_bytes = len(json.dumps(rows[end], ensure_ascii=False, default=str).encode())
+            if end > position and payload_bytes + row_bytes > self.max_batch_bytes:
+                break
+            payload_bytes += row_bytes
+            end += 1
+        return rows[position:end], end
+
+    def _send(self, batch: list[dict]) -> None:
+        """배치 전송 (일시적 오류는 재시도, 그 외 오류는 호출자에게 전달)"""
+        for attempt in range(self.max_retries + 1):
+            started = time.perf_counter()
+            try:
+                self.write_batch(batch)
+            except Exception as e:
+                transient = self.is_transient(e)
+                if transient:
+                    self._adapt(None)
+                if not transient or attempt == self.max_retries:
+                    raise
+                with self._lock:
+                    self._retries += 1
+                time.sleep(random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt))))
+            else:
+                self._adapt(time.perf_counter() - started)
+                return
+
+    def write(self, rows: list[dict], on_progress: Callable[[int, int], None] | None = None) -> BulkWriteResult:
+        """
+        행 전체 저장
+
+        Args:
+            rows: 저장할 행 (배치 간 중복이 없도록 미리 ID 기준 중복 제거할 것)
+            on_progress: 배치가 끝날 때마다 (처리된 행 수, 전체 행 수)로 호출
+
+        Returns:
+            BulkWriteResult
+        """
+        result = BulkWriteResult(table=self.table, rows=len(rows))
+        started = time.perf_counter()
+        self._retries = 0
+
+        # 오류로 나뉜 배치는 새 배치보다 먼저 전송
+        pending: deque[list[dict]] = deque()
+        position = 0
+        done_rows = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            in_flight = {}
+            while position < len(rows) or pending or in_flight:
+                while len(in_flight) < self.max_in_flight and (pending or position < len(rows)):
+                    if pending:
+                        batch = pending.popleft()
+                    else:
+                        batch, position = self._next_batch(rows, position)
+                    in_flight[executor.submit(self._send, batch)] = batch
+                    result.batches += 1
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    batch = in_flight.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        result.written += len(batch)
+                        done_rows += len(batch)
+                    elif not self.is_transient(error) and len(batch) > 1:
+                        # 문제 행을 찾을 때까지 반씩 나눠 다시 전송
+                        middle = len(batch) // 2
+                        pending.append(batch[:middle])
+                        pending.append(batch[middle:])
+                        result.splits += 1
+                        continue
+                    else:
+                        target = result.deferred if self.is_transient(error) else result.failed
+                        target.extend((row, str(error)) for row in batch)
+                        done_rows += len(batch)
+
+                    if on_progress is not None:
+                        on_progress(done_rows, len(rows))
+
+        result.retries = self._retries
+        result.seconds = time.perf_counter() - started
+        return result
+
+
+def _bulk_write(
+    table: str,
+    write_batch: Callable[[list[dict]], object],
+    rows: list[dict],
+    digests: RowDigestStore | None,
+    options: dict,
+) -> BulkWriteResult:
+    """바뀐 행만 BulkWriter로 저장하고 성공한 행의 해시 기록"""
+    on_progress = options.pop("on_progress", None)
+    changed, skipped = digests.filter_changed(table, rows) if digests is not None else (rows, 0)
+
+    result = BulkWriter(write_batch, table, **options).write(changed, on_progress)
+    result.skipped = skipped
+
+    if digests is not None:
+        failed = {id(row) for row, _ in result.failed + result.deferred}
+        digests.commit(table, [row for row in changed if id(row) not in failed])
+    return result
+
+
+def bulk_insert_raw_posts(
+    posts: list[dict],
+    digests: RowDigestStore | None = None,
+    backend: "StorageBackend | None" = None,
+    **options,
+) -> BulkWriteResult:
+    """raw_posts 대량 저장 (ID 생성 후 전체 중복 제거)
+
+    Args:
+        posts: 게시글
+        digests: 지정 시 지난번과 내용이 같은 행은 보내지 않음
+        backend: 저장소 (기본값: Supabase)
+        options: BulkWriter 옵션 (on_progress 포함)
+    """
+    rows = deduplicate_by_id(prepare_raw_posts(posts))
+    write_batch = insert_raw_posts
+    if backend is not None:
+        write_batch = backend.insert_raw_posts
+        options.setdefault("is_transient", backend.is_transient)
+    return _bulk_write("raw_posts", write_batch, rows, digests, options)
+
+
+def bulk_upsert_rankings(
+    rankings: list[dict],
+    digests: RowDigestStore | None = None,
+    backend: "StorageBackend | None" = None,
+    **options,
+) -> BulkWriteResult:
+    """rankings 대량 Upsert (ID 생성 후 전체 중복 제거)
+
+    Args:
+        rankings: 랭킹
+        digests: 지정 시 지난번과 내용이 같은 행은 보내지 않음 (updated_at 등 시각 필드는 비교에서 제외)
+        backend: 저장소 (기본값: Supabase)
+        options: BulkWriter 옵션 (on_progress 포함)
+    """
+    rows = deduplicate_by_id(prepare_rankings(rankings))
+    write_batch = upsert_rankings
+    if backend is not None:
+        write_batch = backend.upsert_rankings
+        options.setdefault("is_transient", backend.is_transient)
+    return _bulk_write("rankings", write_batch, rows, digests, options)
+
+
+# 스풀 테이블 → 대량 저장 함수
+SPOOL_WRITERS = {
+    "raw_posts": bulk_insert_raw_posts,
+    "rankings": bulk_upsert_rankings,
+}
+
+
+def flush_spool(
+    spool: WriteSpool,
+    digests: RowDigestStore | None = None,
+    backend: "StorageBackend | None" = None,
+    **options,
+) -> list[FlushResult]:
+    """
+    쓰기 스풀을 저장소에 반영 (이전 실행에서 남은 행 포함, 먼저 기록된 테이블부터)
+
+    이 저장소 앞으로 기록된 행만 보낸다 (다른 저장소의 행은 그 저장소로 실행할 때 반영).
+
+    Args:
+        spool: 쓰기 스풀
+        digests: 지정 시 지난번과 내용이 같은 행은 보내지 않음
+        backend: 저장소 (기본값: Supabase)
+        options: BulkWriter 옵션
+    """
+    # 설정 오류(환경변수 없음 등)가 행 단위 실패로 집계되지 않도록 먼저 연결
+    if backend is not None:
+        backend.connect()
+    else:
+        get_client()
+
+    backend_name = backend.name if backend is not None else DEFAULT_SPOOL_BACKEND
+    results = []
+    for table in spool.tables(backend_name):
+        write = SPOOL_WRITERS.get(table)
+        if write is None:
+            print(f"[WARNING] 스풀: 알 수 없는 테이블 {table} (건너뜀)")
+            continue
+        results.append(spool.flush(
+            table,
+            lambda rows, write=write: write(rows, digests=digests, backend=backend, **options),
+            backend=backend_name,
+        ))
+    return results
+
+
 if __name__ == "__main__":
     # 연결 테스트
     try:
@@ -0,0 +1,20 @@
+"""pytest 공통 설정 - backend를 import 경로에 넣고, 운영 캐시(backend/.cache)를 건드리지 않도록 임시 디렉터리 사용"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+_TMP_DIR = Path(tempfile.mkdtemp(prefix="memeboard-tests-"))
+
+# 모듈 기본 인스턴스(get_*)가 만들어지기 전에 설정
+os.environ.setdefault("SCRAPER_HTTP_CACHE", "0")
+os.environ.setdefault("SCRAPER_CACHE_DIR", str(_TMP_DIR / "http_cache"))
+os.environ.setdefault("SCRAPER_STATE_DIR", str(_TMP_DIR / "state"))
+os.environ.setdefault("KEYWORD_INDEX_DIR", str(_TMP_DIR / "keyword_index"))
+os.environ.setdefault("CLASSIFICATION_CACHE", "0")
+os.environ.setdefault("COOCCURRENCE_INDEX", "0")
+os.environ.setdefault("ROW_DIGEST", "0")
+os.environ.setdefault("WRITE_SPOOL", "0")
@@ -0,0 +1,151 @@
+"""BulkWriter - 데이터 오류 배치 분할, 일시적 오류 재시도/보류, 배치 크기 한도"""
+import threading
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+from supabase_client import BulkWriter, is_transient_error
+
+
+def _rows(count: int, **extra) -> list[dict]:
+    return [{"id": f"row-{i}", **extra} for i in range(count)]
+
+
+class FakeTable:
+    """배치를 받아 저장하는 가짜 저장소 (bad 행이 있으면 배치 전체 실패, 처음 fail_first번은 일시적 오류)"""
+
+    def __init__(self, fail_first: int = 0, error: Exception | None = None):
+        self.fail_first = fail_first
+        self.error = error or httpx.ConnectError("connection refused")
+        self.calls = 0
+        self.batches: list[list[dict]] = []
+        self.saved: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def write(self, batch: list[dict]) -> list[dict]:
+        with self._lock:
+            self.calls += 1
+            if self.calls <= self.fail_first:
+                raise self.error
+            self.batches.append(batch)
+        if any(row.get("bad") for row in batch):
+            raise ValueError("invalid input syntax")
+        with self._lock:
+            self.saved.update((row["id"], row) for row in batch)
+        return batch
+
+
+def _writer(table: FakeTable, **options) -> BulkWriter:
+    options = {"max_in_flight": 2, "base_delay": 0, "max_delay": 0, **options}
+    return BulkWriter(table.write, "rankings", **options)
+
+
+def test_writes_all_rows():
+    table = FakeTable()
+    rows = _rows(523)
+    progress = []
+
+    result = _writer(table).write(rows, on_progress=lambda done, total: progress.append((done, total)))
+
+    assert result.ok
+    assert result.written == 523
+    assert set(table.saved) == {row["id"] for row in rows}
+    assert progress[-1] == (523, 523)
+
+
+def test_splits_batches_to_isolate_bad_rows():
+    table = FakeTable()
+    rows = _rows(200)
+    for i in (3, 77, 150):
+        rows[i]["bad"] = True
+
+    result = _writer(table, initial_batch=64).write(rows)
+
+    assert result.written == 197
+    assert sorted(row["id"] for row, _ in result.failed) == ["row-150", "row-3", "row-77"]
+    assert all("invalid input syntax" in error for _, error in result.failed)
+    assert not result.deferred
+    assert result.splits > 0
+    assert len(table.saved) == 197
+
+
+def test_retries_transient_errors():
+    table = FakeTable(fail_first=2)
+
+    result = _writer(table, max_in_flight=1, initial_batch=10).write(_rows(10))
+
+    assert result.ok
+    assert result.written == 10
+    assert result.retries == 2
+    assert result.splits == 0
+
+
+def test_defers_rows_when_retries_run_out():
+    table = FakeTable(fail_first=100)
+
+    result = _writer(table, max_in_flight=1, max_retries=2, initial_batch=10).write(_rows(10))
+
+    assert result.written == 0
+    assert len(result.deferred) == 10
+    assert not result.failed
+    # 일시적 오류는 데이터 문제가 아니므로 나누지 않음
+    assert result.splits == 0
+    assert table.calls == 3
+
+
+def test_batch_size_adapts_to_latency():
+    writer = _writer(FakeTable(), initial_batch=40, min_batch=10, max_batch=100, target_latency=1.0)
+
+    writer._adapt(None)  # 일시적 오류
+    assert writer.batch_size == 20
+    writer._adapt(2.0)  # 목표보다 느림
+    assert writer.batch_size == 10
+    writer._adapt(2.0)
+    assert writer.batch_size == 10  # min_batch
+    writer._adapt(0.1)  # 목표의 절반보다 빠름
+    assert writer.batch_size == 16
+    writer._adapt(0.7)  # 목표 근처면 유지
+    assert writer.batch_size == 16
+    for _ in range(10):
+        writer._adapt(0.1)
+    assert writer.batch_size == 100  # max_batch
+
+
+def test_custom_is_transient():
+    table = FakeTable(fail_first=1, error=RuntimeError("database is locked"))
+
+    result = _writer(table, max_in_flight=1, is_transient=lambda e: isinstance(e, RuntimeError)).write(_rows(5))
+
+    assert result.ok
+    assert result.retries == 1
+
+
+def test_respects_max_batch_bytes():
+    table = FakeTable()
+    rows = _rows(30, summary="x" * 1000)
+
+    result = _writer(table, initial_batch=1000, max_batch=1000, max_batch_bytes=5000).write(rows)
+
+    assert result.written == 30
+    assert max(len(batch) for batch in table.batches) <= 4
+
+
+@pytest.mark.parametrize("error, transient", [
+    (httpx.ConnectError("refused"), True),
+    (httpx.ReadTimeout("timeout"), True),
+    (APIError({"code": "503", "message": "Service Unavailable"}), True),
+    (APIError({"code": "429", "message": "Too Many Requests"}), True),
+    (APIError({"code": "404", "message": "Not Found"}), False),
+    (APIError({"code": "PGRST001", "message": "Database client error"}), True),
+    (APIError({"code": "PGRST003", "message": "Timed out acquiring connection"}), True),
+    (APIError({"code": "PGRST204", "message": "Column not found"}), False),
+    (APIError({"code": "08006", "message": "connection failure"}), True),
+    (APIError({"code": "40001", "message": "serialization failure"}), True),
+    (APIError({"code": "57014", "message": "statement timeout"}), True),
+    (APIError({"code": "22P02", "message": "invalid input syntax"}), False),
+    (APIError({"code": "23505", "message": "duplicate key"}), False),
+    (ValueError("bad row"), False),
+])
+def test_is_transient_error(error, transient):
+    assert is_transient_error(error) is transient
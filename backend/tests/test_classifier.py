@@ -0,0 +1,127 @@
+"""규칙 분류기 동등성 - classify / classify_batch(희소 행렬) / 병렬 모드 / 분류 캐시 결과가 같은지"""
+import re
+
+import pytest
+
+from ai import rule_classifier
+from ai.keywords import KEYWORDS
+from ai.rule_classifier import RuleBasedClassifier, iter_classify_posts
+from ai.classification_cache import ClassificationCache
+from ai.cooccurrence_index import CooccurrenceIndex
+from benchmarks.corpus import synthetic_titles, to_posts
+
+
+def _plain_keyword(category: str) -> str:
+    """다른 카테고리 키워드와 겹치지 않는 한글 키워드 (문맥 학습용)"""
+    others = [word for name, words in KEYWORDS.items() if name != category for word in words]
+    for word in KEYWORDS[category]:
+        if re.fullmatch(r"[가-힣]{2,}", word) and not any(word in other or other in word for other in others if other):
+            return word
+    raise AssertionError(f"{category}: 쓸 수 있는 키워드가 없음")
+
+
+CELEBRITY = _plain_keyword("celebrity")
+
+EDGE_TITLES = [
+    "",
+    "아무 키워드도 없는 제목",
+    "축구 이적 확정",
+    f"{CELEBRITY} 소속사 이적 확정",
+    "소속사 이적 발표",
+    "감독 이적 발표",
+    "팬미팅 콘서트 후기",
+    "국회 본회의 주식 코스피",  # 동점 → CATEGORY_PRIORITY
+    "EPL KBO ATP 경기 결과",
+]
+
+
+def _result(post: dict) -> tuple:
+    return post["category"], post["confidence"], post["matched_keywords"]
+
+
+def _classify_each(classifier: RuleBasedClassifier, posts: list[dict]) -> list[tuple]:
+    results = []
+    for post in posts:
+        result = classifier.classify(post.get("title", ""), post.get("content"))
+        results.append((result.category, result.confidence, result.matched_keywords))
+    return results
+
+
+@pytest.fixture(scope="module")
+def posts() -> list[dict]:
+    posts = to_posts(synthetic_titles(800) + EDGE_TITLES)
+    # 본문이 있는 게시글 (제목 + 본문을 함께 매칭)
+    posts[0]["content"] = "본문에 축구 이적 소식"
+    return posts
+
+
+@pytest.fixture
+def cooccurrence(tmp_path) -> CooccurrenceIndex:
+    """"이적"을 문맥(소속사/감독)으로 판정하도록 학습한 인덱스"""
+    index = CooccurrenceIndex(tmp_path / "cooccurrence.sqlite3")
+    training = []
+    for i in range(8):
+        training.append({
+            "url": f"https://example.com/celebrity/{i}",
+            "title": f"{CELEBRITY} 소속사 이적 {i}",
+            "category": "celebrity",
+            "matched_keywords": ["이적", CELEBRITY],
+        })
+        training.append({
+            "url": f"https://example.com/sports/{i}",
+            "title": f"축구 감독 이적 {i}",
+            "category": "sports",
+            "matched_keywords": ["이적", "축구"],
+        })
+    assert index.learn(training) == 16
+    yield index
+    index.close()
+
+
+@pytest.fixture(params=[False, True], ids=["rules", "context"])
+def classifier(request, cooccurrence) -> RuleBasedClassifier:
+    return RuleBasedClassifier(0.1, cooccurrence if request.param else None)
+
+
+def test_batch_matches_classify(classifier, posts):
+    assert [_result(post) for post in classifier.classify_batch(posts)] == _classify_each(classifier, posts)
+
+
+def test_parallel_matches_single_process(classifier, posts, monkeypatch):
+    monkeypatch.setattr(rule_classifier, "PARALLEL_MIN_POSTS", 100)
+
+    parallel = classifier.classify_batch(posts, workers=2)
+
+    assert [post["url"] for post in parallel] == [post["url"] for post in posts]
+    assert [_result(post) for post in parallel] == _classify_each(classifier, posts)
+
+
+def test_cache_matches_classify(classifier, posts, tmp_path):
+    cache = ClassificationCache(tmp_path / "classification.sqlite3")
+    expected = _classify_each(classifier, posts)
+
+    first = cache.classify_batch(classifier, posts)
+    second = cache.classify_batch(classifier, posts)
+
+    assert [_result(post) for post in first] == expected
+    assert [_result(post) for post in second] == expected
+    assert cache.hits > 0
+    cache.close()
+
+
+def test_streaming_matches_batch(classifier, posts):
+    streamed = list(iter_classify_posts(posts, batch_size=97, classifier=classifier))
+    assert [_result(post) for post in streamed] == [_result(post) for post in classifier.classify_batch(posts)]
+
+
+def test_context_resolves_ambiguous_keyword(cooccurrence):
+    with_context = RuleBasedClassifier(0.1, cooccurrence)
+    without_context = RuleBasedClassifier(0.1)
+    title = "소속사 이적 발표"
+
+    assert without_context.classify(title).category == "sports"
+    assert with_context.classify(title).category == "celebrity"
+    assert with_context.classify(title).matched_keywords == ["이적"]
+    assert with_context.uses_context(title.lower())
+    # 팬미팅 안의 "팬"은 키워드 사전이 매칭한 키워드가 아니므로 문맥 판정 대상이 아님
+    assert not with_context.uses_context("팬미팅 콘서트 후기")
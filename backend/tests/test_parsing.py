@@ -0,0 +1,290 @@
+"""목록 파싱 동등성 - lxml 파서가 이전 BeautifulSoup 파서와 같은 게시글을 추출하는지
+
+이전 파서(BeautifulSoup + CSS 선택자)는 비교 기준으로 여기에만 남겨 둔다.
+lxml 경로는 전체 파싱, 목록 영역 파싱, 조각 단위 스트리밍 파싱을 모두 확인한다.
+"""
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scrapers import DcinsideScraper, PpomppuScraper, RuliwebScraper, InvenScraper, FetchResult
+from scrapers import lxml_engine
+
+
+# ----------------------------------------------------------------------
+# 이전 BeautifulSoup 파서 (비교 기준)
+# ----------------------------------------------------------------------
+
+def _full_url(href: str, base: str, relative_base: str) -> str:
+    if href.startswith("//"):
+        return f"https:{href}"
+    if href.startswith("/"):
+        return f"{base}{href}"
+    if href.startswith("http"):
+        return href
+    return f"{relative_base}/{href}"
+
+
+def _soup_dcinside(scraper, soup) -> list[dict]:
+    posts = []
+    for row in soup.select("tr.ub-content"):
+        if "notice" in row.get("class", []):
+            continue
+        title_elem = row.select_one("td.gall_tit a:not(.reply_numbox)")
+        if not title_elem:
+            continue
+        href = title_elem.get("href", "")
+        post_url = f"https://gall.dcinside.com{href}" if href.startswith("/") else (
+            href if href.startswith("http") else f"{scraper.base_url}/{href}"
+        )
+        views = likes = 0
+        view_elem = row.select_one("td.gall_count")
+        if view_elem and view_elem.get_text(strip=True).isdigit():
+            views = int(view_elem.get_text(strip=True))
+        like_elem = row.select_one("td.gall_recommend")
+        if like_elem and like_elem.get_text(strip=True).isdigit():
+            likes = int(like_elem.get_text(strip=True))
+        post_date = None
+        date_elem = row.select_one("td.gall_date")
+        if date_elem:
+            post_date = scraper._parse_date(date_elem.get("title") or date_elem.get_text(strip=True))
+        posts.append(scraper.format_post(
+            title=title_elem.get_text(strip=True), url=post_url, views=views, likes=likes, post_date=post_date,
+        ))
+    return posts
+
+
+def _soup_ppomppu(scraper, soup) -> list[dict]:
+    posts = []
+    main_table = soup.select_one("#revolution_main_table")
+    if not main_table:
+        return []
+    for row in main_table.select("tr.baseList"):
+        title_links = row.select("a[href*='view.php']")
+        if len(title_links) < 2:
+            continue
+        title = title_links[1].get_text(strip=True)
+        if not title or len(title) < 2:
+            continue
+        href = title_links[1].get("href", "")
+        post_url = f"{scraper.base_url}{href}" if href.startswith("/") else (
+            href if href.startswith("http") else f"{scraper.base_url}/zboard/{href}"
+        )
+        tds = row.select("td")
+        views = likes = 0
+        post_date = None
+        if len(tds) >= 6:
+            match = re.search(r"(\d+)", tds[5].get_text(strip=True).replace(",", ""))
+            views = int(match.group(1)) if match else 0
+        if len(tds) >= 5:
+            match = re.search(r"^(\d+)", tds[4].get_text(strip=True).replace(",", ""))
+            likes = int(match.group(1)) if match else 0
+        if len(tds) >= 4:
+            post_date = scraper._parse_date(tds[3].get_text(strip=True))
+        posts.append(scraper.format_post(title=title, url=post_url, views=views, likes=likes, post_date=post_date))
+    return posts
+
+
+def _soup_ruliweb(scraper, soup) -> list[dict]:
+    posts = []
+    for row in soup.select("tr.table_body"):
+        title_elem = row.select_one("a.subject_link") or row.select_one("td.subject a")
+        if not title_elem:
+            continue
+        title = re.sub(r'\s*\(\d+\)\s*$', '', title_elem.get_text(strip=True)).strip()
+        post_url = _full_url(title_elem.get("href", ""), "https://bbs.ruliweb.com", scraper.base_url)
+        views = likes = 0
+        view_elem = row.select_one("td.hit")
+        if view_elem:
+            match = re.search(r"(\d+)", view_elem.get_text(strip=True).replace(",", ""))
+            views = int(match.group(1)) if match else 0
+        like_elem = row.select_one("td.recomd")
+        if like_elem:
+            match = re.search(r"(\d+)", like_elem.get_text(strip=True).replace(",", ""))
+            likes = int(match.group(1)) if match else 0
+        date_elem = row.select_one("td.time")
+        post_date = scraper._parse_date(date_elem.get_text(strip=True)) if date_elem else None
+        posts.append(scraper.format_post(title=title, url=post_url, views=views, likes=likes, post_date=post_date))
+    return posts
+
+
+def _soup_inven(scraper, soup) -> list[dict]:
+    posts = []
+    seen_urls = set()
+    today = f"{scraper._today().isoformat()}T00:00:00"
+    for link in soup.find_all("a", href=re.compile(r"/webzine/news/\?news=\d+")):
+        href = link.get("href", "")
+        if href in seen_urls:
+            continue
+        seen_urls.add(href)
+        title = link.get_text(strip=True)
+        if not title or len(title) < 5:
+            continue
+        title = re.sub(r'\s+', ' ', re.sub(r'\[\d+\]$', '', title).strip())
+        post_url = _full_url(href, scraper.base_url, scraper.base_url)
+        posts.append(scraper.format_post(title=title, url=post_url, views=0, likes=0, post_date=today))
+    return posts
+
+
+# ----------------------------------------------------------------------
+# 목록 페이지 (영역 앞뒤 요소, 공지, 스크립트, 쉼표 숫자, 상대 URL 등 경계 사례 포함)
+# ----------------------------------------------------------------------
+
+DCINSIDE_HTML = """<!DOCTYPE html>
+<html><head><title>개념글</title><script>var rows = "<tr class='ub-content'>";</script></head>
+<body>
+<div class="gnb"><table class="menu"><tr><td>메뉴</td></tr></table></div>
+<table class="gall_list">
+  <tbody>
+    <tr class="ub-content us-post notice"><td class="gall_tit"><a href="/board/view/?id=hit&no=1">공지입니다</a></td></tr>
+    <tr class="ub-content us-post">
+      <td class="gall_tit ub-word"><a href="/board/view/?id=hit&no=2"><em class="icon_img"></em>  첫 번째 <b>개념글</b> </a>
+        <a class="reply_numbox" href="#"><span>[12]</span></a></td>
+      <td class="gall_date" title="2026-02-01 12:34:56">12:34</td>
+      <td class="gall_count">1234</td>
+      <td class="gall_recommend">56</td>
+    </tr>
+    <tr class="ub-content us-post">
+      <td class="gall_tit"><a href="https://gall.dcinside.com/mgallery/board/view/?id=x&no=3">외부 링크<script>bad()</script></a></td>
+      <td class="gall_date">02.03</td>
+      <td class="gall_count">1,234</td>
+      <td class="gall_recommend">-</td>
+    </tr>
+    <tr class="ub-content us-post">
+      <td class="gall_tit"><a href="board/view/?id=hit&amp;no=4">상대&nbsp;경로</a></td>
+      <td class="gall_date">2026.02.04</td>
+    </tr>
+    <tr class="ub-content us-post"><td class="gall_tit"><a class="reply_numbox" href="#">[1]</a></td></tr>
+  </tbody>
+</table>
+<div class="footer"><script>track();</script></div>
+</body></html>
+"""
+
+PPOMPPU_HTML = """<html><head><meta charset="euc-kr"><title>뽐뿌게시판</title></head>
+<body>
+<table class="top"><tr class="baseList"><td><a href="view.php?id=ppomppu&no=0">x</a><a href="view.php?id=ppomppu&no=0">영역 밖</a></td></tr></table>
+<table id="revolution_main_table">
+  <tr class="baseList">
+    <td>1001</td>
+    <td><a href="view.php?id=ppomppu&no=1001"><img src="t.jpg"></a>
+        <a href="view.php?id=ppomppu&no=1001"><span>[쿠팡] 무선 이어폰 (29,900원/무료)</span></a></td>
+    <td>작성자</td><td>26/02/01</td><td>12 - 3</td><td>1,234</td>
+  </tr>
+  <tr class="baseList">
+    <td>1002</td>
+    <td><a href="/zboard/view.php?id=ppomppu&no=1002"></a><a href="/zboard/view.php?id=ppomppu&no=1002">잘못된 바이트 {bad} 포함</a></td>
+    <td>작성자</td><td>12:34:56</td><td>-</td><td>조회 77</td>
+  </tr>
+  <tr class="baseList"><td>1003</td><td><a href="view.php?id=ppomppu&no=1003">하나뿐</a></td></tr>
+  <tr class="baseList"><td>1004</td><td><a href="view.php?no=1004"></a><a href="view.php?no=1004">짧</a></td></tr>
+  <tr class="baseList"><td>1005</td><td><a href="http://www.ppomppu.co.kr/zboard/view.php?no=1005"></a><a href="http://www.ppomppu.co.kr/zboard/view.php?no=1005">열 부족</a></td><td>작성자</td></tr>
+</table>
+<div class="footer">푸터</div>
+</body></html>
+"""
+
+RULIWEB_HTML = """<html><head><title>루리웹</title></head>
+<body>
+<table class="board_list_table">
+  <tr class="table_head"><th>제목</th></tr>
+  <tr class="table_body blocktarget">
+    <td class="subject"><div><a class="subject_link deco" href="https://bbs.ruliweb.com/best/board/300143/read/1">첫 글 (59)</a></div></td>
+    <td class="recomd">12</td><td class="hit">1,234</td><td class="time">12:34</td>
+  </tr>
+  <tr class="table_body">
+    <td class="subject"><a href="//bbs.ruliweb.com/best/board/300143/read/2">프로토콜 상대 <strong>URL</strong></a></td>
+    <td class="recomd">추천 7</td><td class="hit">-</td><td class="time">2026.02.01</td>
+  </tr>
+  <tr class="table_body">
+    <td class="subject"><a class="subject_link" href="/best/board/300143/read/3">제목(3)(12)</a></td>
+    <td class="time">26.02.01</td>
+  </tr>
+  <tr class="table_body"><td class="subject">링크 없음</td></tr>
+</table>
+<table class="ad"><tr><td>광고</td></tr></table>
+</body></html>
+"""
+
+INVEN_HTML = """<html><head><title>인벤</title></head>
+<body>
+<div class="news">
+  <a href="/webzine/news/?news=1001">[게임] 신작   발표 소식[3]</a>
+  <a href="/webzine/news/?news=1001">중복 링크 제목입니다</a>
+  <a href="https://www.inven.co.kr/webzine/news/?news=1002&site=lol">LoL 패치 노트 정리</a>
+  <a href="//www.inven.co.kr/webzine/news/?news=1003"><span>[e스포츠]</span> <b>결승</b> 미리보기</a>
+  <a href="/webzine/news/?news=1004">짧음</a>
+  <a href="/webzine/news/?news=abc">숫자 아닌 기사 번호</a>
+  <a href="/webzine/news/?hotnews=1005">다른 형식의 링크입니다</a>
+</div>
+</body></html>
+"""
+
+PAGES = [
+    # (스크래퍼, 이전 파서, HTML, 인코딩, 기대 게시글 수)
+    (DcinsideScraper, _soup_dcinside, DCINSIDE_HTML, "utf-8", 3),
+    (PpomppuScraper, _soup_ppomppu, PPOMPPU_HTML, "euc-kr", 3),
+    (RuliwebScraper, _soup_ruliweb, RULIWEB_HTML, "utf-8", 3),
+    (InvenScraper, _soup_inven, INVEN_HTML, "utf-8", 3),
+]
+
+
+def _encode(html: str, encoding: str) -> bytes:
+    """HTML → 응답 바이트 ({bad}는 해당 인코딩에서 잘못된 바이트로 바꿈)"""
+    return html.encode(encoding).replace(b"{bad}", b"\xff\xfe")
+
+
+@pytest.fixture(params=PAGES, ids=lambda page: page[0].__name__)
+def page(request):
+    scraper_class, soup_parse, html, encoding, expected = request.param
+    scraper = scraper_class()
+    result = FetchResult(scraper.page_url(1), _encode(html, encoding), encoding)
+    return scraper, soup_parse, result, expected
+
+
+def _reference(scraper, soup_parse, result: FetchResult) -> list[dict]:
+    return soup_parse(scraper, BeautifulSoup(result.text, "lxml"))
+
+
+def test_reference_finds_posts(page):
+    scraper, soup_parse, result, expected = page
+    assert len(_reference(scraper, soup_parse, result)) == expected
+
+
+def test_full_document_matches_soup(page):
+    scraper, soup_parse, result, _ = page
+    doc = lxml_engine.parse_html(result.content, result.encoding)
+    assert scraper.parse(doc) == _reference(scraper, soup_parse, result)
+
+
+def test_region_matches_soup(page):
+    scraper, soup_parse, result, _ = page
+    assert scraper._parse_result(result) == _reference(scraper, soup_parse, result)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_streamed_region_matches_soup(page, chunk_size):
+    scraper, soup_parse, result, _ = page
+    if scraper.list_region is None:
+        pytest.skip("목록 영역을 지정하지 않은 스크래퍼")
+
+    stream_parser = lxml_engine.RegionStreamParser(scraper.list_region, result.encoding)
+    for offset in range(0, len(result.content), chunk_size):
+        if stream_parser.feed(result.content[offset:offset + chunk_size]):
+            break
+    doc = stream_parser.close()
+
+    assert doc is not None
+    assert scraper.parse(doc) == _reference(scraper, soup_parse, result)
+
+
+def test_missing_region_falls_back_to_full_page():
+    scraper = DcinsideScraper()
+    html = DCINSIDE_HTML.replace('class="gall_list"', 'class="gall_list_v2"')
+    result = FetchResult(scraper.page_url(1), html.encode(), "utf-8")
+
+    posts = scraper._parse_result(result)
+
+    assert posts == _reference(scraper, _soup_dcinside, result)
+    assert len(posts) == 3
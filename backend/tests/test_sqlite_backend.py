@@ -0,0 +1,132 @@
+"""SQLiteBackend - Upsert(보낸 컬럼만 갱신), 조회 순서, 보존 기간 삭제, 일시적 오류 판정"""
+import sqlite3
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from storage import SQLiteBackend
+from supabase_client import bulk_upsert_rankings
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteBackend(tmp_path / "storage.sqlite3")
+    yield backend
+    backend.close()
+
+
+def _ranking(keyword: str, category: str = "issue", score: int = 0, **extra) -> dict:
+    return {"keyword": keyword, "category": category, "popularity_score": score, "source_urls": [], **extra}
+
+
+def test_upsert_rankings_is_idempotent(backend):
+    backend.upsert_rankings([_ranking("첫 글", score=10, source_urls=["https://example.com/1"])])
+    backend.upsert_rankings([_ranking("첫 글", score=20, source_urls=["https://example.com/1"])])
+
+    rankings = backend.get_rankings()
+
+    assert len(rankings) == 1
+    assert rankings[0]["popularity_score"] == 20
+    assert rankings[0]["source_urls"] == ["https://example.com/1"]
+
+
+def test_upsert_updates_only_sent_columns(backend):
+    backend.upsert_rankings([_ranking("첫 글", score=10, summary="요약", ai_summary="AI 요약")])
+    created_at = backend.get_rankings()[0]["created_at"]
+
+    # 보내지 않은 summary / ai_summary는 기존 값 유지, 보낸 컬럼(created_at 포함)만 갱신 (PostgREST upsert와 같음)
+    row = _ranking("첫 글", score=30)
+    row["created_at"] = (datetime.utcnow() + timedelta(days=1)).isoformat()
+    backend.upsert_rankings([row])
+
+    ranking = backend.get_rankings()[0]
+    assert ranking["popularity_score"] == 30
+    assert ranking["summary"] == "요약"
+    assert ranking["ai_summary"] == "AI 요약"
+    assert ranking["created_at"] != created_at
+
+
+def test_insert_raw_posts_generates_ids_and_deduplicates(backend):
+    posts = [
+        {"source": "dcinside", "title": "제목", "url": "https://example.com/1", "views": 1},
+        {"source": "dcinside", "title": "제목 (수정)", "url": "https://example.com/1", "views": 2},
+        {"source": "ruliweb", "title": "다른 글", "url": "https://example.com/2", "views": 3},
+    ]
+
+    backend.insert_raw_posts(posts)
+
+    assert {post["url"]: post["views"] for post in backend.get_raw_posts()} == {
+        "https://example.com/1": 2,
+        "https://example.com/2": 3,
+    }
+    assert [post["source"] for post in backend.get_raw_posts(source="ruliweb")] == ["ruliweb"]
+
+
+def test_get_rankings_orders_by_popularity(backend):
+    backend.upsert_rankings([
+        _ranking("a", "sports", 5),
+        _ranking("b", "game", 50),
+        _ranking("c", "sports", 30),
+        _ranking("d", "sports", 10),
+    ])
+
+    assert [ranking["keyword"] for ranking in backend.get_rankings()] == ["b", "c", "d", "a"]
+    assert [ranking["keyword"] for ranking in backend.get_rankings(category="sports", limit=2)] == ["c", "d"]
+
+
+def test_delete_old_rankings_uses_updated_at(backend):
+    backend.upsert_rankings([_ranking(f"글 {i}", score=i) for i in range(6)])
+    old = (datetime.utcnow() - timedelta(days=8)).isoformat()
+    recent = (datetime.utcnow() - timedelta(days=6)).isoformat()
+    with backend._conn:
+        backend._conn.execute("UPDATE rankings SET updated_at = ? WHERE popularity_score < 2", (old,))
+        backend._conn.execute("UPDATE rankings SET updated_at = ? WHERE popularity_score = 2", (recent,))
+
+    assert backend.delete_old_rankings(days=7) == 2
+    assert sorted(ranking["popularity_score"] for ranking in backend.get_rankings()) == [2, 3, 4, 5]
+    assert backend.delete_old_rankings(days=7) == 0
+
+
+def test_unknown_column_is_a_data_error(backend):
+    with pytest.raises(ValueError, match="알 수 없는 컬럼"):
+        backend.upsert_rankings([_ranking("글", views=1)])
+
+    assert not backend.is_transient(ValueError("unknown column"))
+
+
+def test_is_transient(backend):
+    assert backend.is_transient(sqlite3.OperationalError("database is locked"))
+    assert backend.is_transient(httpx.ConnectError("refused"))
+    assert not backend.is_transient(sqlite3.IntegrityError("NOT NULL constraint failed"))
+
+
+def test_bulk_upsert_splits_out_bad_rows(backend):
+    rankings = [_ranking(f"글 {i}", score=i) for i in range(50)]
+    rankings[17]["keyword"] = None  # NOT NULL 위반
+
+    result = bulk_upsert_rankings(rankings, backend=backend, max_in_flight=1)
+
+    assert result.written == 49
+    assert [row["popularity_score"] for row, _ in result.failed] == [17]
+    assert not result.deferred
+    assert len(backend.get_rankings(limit=100)) == 49
+
+
+def test_locked_database_defers_rows(backend, tmp_path):
+    blocker = sqlite3.connect(tmp_path / "storage.sqlite3", timeout=0)
+    blocker.execute("BEGIN EXCLUSIVE")
+    backend._conn.execute("PRAGMA busy_timeout = 0")
+    try:
+        result = bulk_upsert_rankings(
+            [_ranking(f"글 {i}") for i in range(5)],
+            backend=backend, max_in_flight=1, max_retries=1, base_delay=0, max_delay=0,
+        )
+    finally:
+        blocker.rollback()
+        blocker.close()
+
+    assert result.written == 0
+    assert len(result.deferred) == 5
+    assert not result.failed
+    assert result.splits == 0
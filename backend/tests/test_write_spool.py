@@ -0,0 +1,203 @@
+"""쓰기 스풀 - flush 성공/실패/보류/dead letter, 저장소별 분리, 이전 형식 파일 변환"""
+import json
+import sqlite3
+import time
+import zlib
+
+import pytest
+
+from storage import SQLiteBackend
+from supabase_client import BulkWriteResult, flush_spool
+from write_spool import WriteSpool
+
+
+def _rows(*ids: str, **extra) -> list[dict]:
+    return [{"id": row_id, **extra} for row_id in ids]
+
+
+class FakeWrite:
+    """스풀 flush에 넘기는 저장 함수 (failing: 데이터 오류, deferring: 일시적 오류로 보류할 ID)"""
+
+    def __init__(self, failing: set[str] = frozenset(), deferring: set[str] = frozenset()):
+        self.failing = failing
+        self.deferring = deferring
+        self.calls: list[list[str]] = []
+        self.saved: dict[str, dict] = {}
+
+    def __call__(self, rows: list[dict]) -> BulkWriteResult:
+        self.calls.append([row["id"] for row in rows])
+        result = BulkWriteResult(table="raw_posts", rows=len(rows))
+        for row in rows:
+            if row["id"] in self.failing:
+                result.failed.append((row, "invalid input syntax"))
+            elif row["id"] in self.deferring:
+                result.deferred.append((row, "connection refused"))
+            else:
+                self.saved[row["id"]] = row
+                result.written += 1
+        return result
+
+
+@pytest.fixture
+def spool(tmp_path):
+    spool = WriteSpool(tmp_path / "spool.sqlite3", max_attempts=3)
+    yield spool
+    spool.close()
+
+
+def test_flush_writes_rows_in_order_and_empties_spool(spool):
+    spool.append("raw_posts", _rows("a", "b", "c"))
+    spool.append("raw_posts", _rows("d"))
+    write = FakeWrite()
+
+    result = spool.flush("raw_posts", write, chunk_rows=2)
+
+    assert write.calls == [["a", "b"], ["c", "d"]]
+    assert (result.rows, result.written, result.failed, result.deferred) == (4, 4, 0, 0)
+    assert spool.pending() == 0
+
+
+def test_append_replaces_pending_row(spool):
+    spool.append("raw_posts", _rows("a", title="old"))
+    spool.append("raw_posts", _rows("a", title="new"))
+    write = FakeWrite()
+
+    spool.flush("raw_posts", write)
+
+    assert write.calls == [["a"]]
+    assert write.saved["a"]["title"] == "new"
+
+
+def test_failed_rows_stay_until_dead_lettered(spool, tmp_path):
+    spool.append("raw_posts", _rows("a", "bad"))
+    write = FakeWrite(failing={"bad"})
+
+    for _ in range(1, spool.max_attempts):
+        result = spool.flush("raw_posts", write)
+        assert (result.failed, result.dead) == (1, 0)
+        assert spool.pending() == 1
+
+    result = spool.flush("raw_posts", write)
+
+    assert (result.failed, result.dead) == (1, 1)
+    assert spool.pending() == 0
+    with sqlite3.connect(tmp_path / "spool.sqlite3") as conn:
+        dead = conn.execute("SELECT backend, table_name, id, error FROM dead_letters").fetchall()
+    assert dead == [("supabase", "raw_posts", "bad", "invalid input syntax")]
+
+
+def test_deferred_rows_stop_the_flush(spool):
+    spool.append("raw_posts", _rows("a", "b", "c", "d"))
+    write = FakeWrite(deferring={"b"})
+
+    result = spool.flush("raw_posts", write, chunk_rows=2)
+
+    # 일시적 오류가 난 뒤의 조각은 보내지 않음
+    assert write.calls == [["a", "b"]]
+    assert (result.written, result.deferred, result.failed) == (1, 1, 0)
+    assert spool.pending() == 3
+
+    result = spool.flush("raw_posts", FakeWrite())
+
+    assert result.written == 3
+    assert spool.pending() == 0
+
+
+def test_deferred_rows_do_not_count_as_attempts(spool):
+    spool.append("raw_posts", _rows("a"))
+
+    for _ in range(spool.max_attempts + 1):
+        spool.flush("raw_posts", FakeWrite(deferring={"a"}))
+
+    assert spool.pending() == 1
+
+
+def test_row_rewritten_during_flush_is_kept(spool):
+    spool.append("raw_posts", _rows("a", title="old"))
+    write = FakeWrite()
+
+    def write_and_rewrite(rows):
+        # 첫 조각을 저장하는 동안 같은 ID가 새 내용으로 다시 기록됨
+        if not write.calls:
+            spool.append("raw_posts", _rows("a", title="new"))
+        return write(rows)
+
+    spool.flush("raw_posts", write_and_rewrite)
+
+    # 새로 기록된 행은 지워지지 않고 같은 flush의 다음 조각으로 저장됨
+    assert write.calls == [["a"], ["a"]]
+    assert write.saved["a"]["title"] == "new"
+    assert spool.pending() == 0
+
+
+def test_flush_only_sends_rows_for_the_given_backend(spool):
+    spool.append("raw_posts", _rows("a"), backend="supabase")
+    spool.append("raw_posts", _rows("b"), backend="sqlite")
+    spool.append("rankings", _rows("r"), backend="sqlite")
+    write = FakeWrite()
+
+    spool.flush("raw_posts", write, backend="sqlite")
+
+    assert write.calls == [["b"]]
+    assert spool.backends() == {"sqlite": 1, "supabase": 1}
+    assert spool.tables("sqlite") == ["rankings"]
+    assert spool.tables("supabase") == ["raw_posts"]
+    assert spool.pending(backend="supabase") == 1
+
+
+def test_same_id_is_kept_per_backend(spool):
+    spool.append("raw_posts", _rows("a", title="supabase"), backend="supabase")
+    spool.append("raw_posts", _rows("a", title="sqlite"), backend="sqlite")
+    write = FakeWrite()
+
+    spool.flush("raw_posts", write, backend="supabase")
+
+    assert write.saved["a"]["title"] == "supabase"
+    assert spool.pending(backend="sqlite") == 1
+
+
+def test_migrates_spool_without_backend_column(tmp_path):
+    path = tmp_path / "old.sqlite3"
+    with sqlite3.connect(path) as conn:
+        conn.executescript("""
+            CREATE TABLE spool (
+                table_name TEXT NOT NULL, id TEXT NOT NULL, seq INTEGER NOT NULL, payload BLOB NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0, enqueued_at REAL NOT NULL, PRIMARY KEY (table_name, id)
+            );
+            CREATE INDEX spool_seq ON spool (table_name, seq);
+            CREATE TABLE dead_letters (
+                table_name TEXT NOT NULL, id TEXT NOT NULL, payload BLOB NOT NULL, error TEXT, failed_at REAL NOT NULL
+            );
+        """)
+        conn.execute(
+            "INSERT INTO spool VALUES ('raw_posts', 'a', 1, ?, 2, ?)",
+            (zlib.compress(json.dumps({"id": "a"}).encode()), time.time()),
+        )
+
+    spool = WriteSpool(path)
+    try:
+        assert spool.backends() == {"supabase": 1}
+        write = FakeWrite()
+        spool.flush("raw_posts", write)
+        assert write.calls == [["a"]]
+    finally:
+        spool.close()
+
+
+def test_flush_spool_into_sqlite_backend(spool, tmp_path):
+    backend = SQLiteBackend(tmp_path / "storage.sqlite3")
+    try:
+        posts = [
+            {"source": "dcinside", "title": f"제목 {i}", "url": f"https://example.com/{i}", "views": i, "likes": 0}
+            for i in range(30)
+        ]
+        spool.append("raw_posts", [dict(post, id=f"id-{i}") for i, post in enumerate(posts)], backend=backend.name)
+        spool.append("raw_posts", _rows("other"), backend="supabase")
+
+        results = flush_spool(spool, backend=backend, max_in_flight=1)
+
+        assert [(result.table, result.written) for result in results] == [("raw_posts", 30)]
+        assert len(backend.get_raw_posts(limit=100)) == 30
+        assert spool.backends() == {"supabase": 1}
+    finally:
+        backend.close()
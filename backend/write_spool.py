@@ -0,0 +1,291 @@
+"""로컬 쓰기 스풀 (SQLite) - 모든 저장은 스풀에 먼저 기록하고 Supabase에는 나중에 한꺼번에 반영
+
+Supabase가 느리거나 연결되지 않아도 수집한 데이터를 잃지 않는다.
+- append(): 행을 압축(zlib) JSON으로 스풀에 기록 (synchronous=FULL - 반환되면 디스크에 남아 있음)
+- flush(): 스풀을 오래된 순서로 읽어 대량 저장하고, 저장에 성공한 행만 스풀에서 삭제
+  이번 실행에 실패한 행은 남아 있다가 다음 실행의 flush()에서 다시 보냄
+  (일시적 오류 - 연결 실패 등 - 가 나면 남은 스풀은 건드리지 않고 다음 실행으로 미룸)
+
+행은 기록할 저장소(STORAGE_BACKEND 이름)와 함께 남기고, flush()는 지정한 저장소의 행만 보낸다
+(sqlite로 실행할 때 남은 행이 다음 Supabase 실행에서 운영 DB로 넘어가지 않도록).
+행은 (저장소, 테이블, 결정론적 ID)당 하나만 남고(나중에 기록한 내용이 이김) 저장은 ID 기준 Upsert라서,
+flush 도중 중단돼 같은 행을 다시 보내도 결과는 한 번 저장한 것과 같다.
+데이터 문제로 max_attempts번 실패한 행은 dead_letters 테이블로 옮긴다.
+
+GitHub Actions에서는 스풀 파일이 backend/.cache와 함께 actions/cache로만 보존된다
+(워크플로별 키, 실패·시간 초과에도 저장). 캐시가 만료(7일 미사용)되거나 용량 초과로 지워지면 남은 행은 사라진다.
+"""
+import os
+import json
+import time
+import zlib
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+
+DEFAULT_SPOOL_PATH = Path(__file__).resolve().parent / ".cache" / "write_spool.sqlite3"
+# 저장소를 지정하지 않은 행 (supabase_client 함수의 backend=None과 같은 Supabase)
+DEFAULT_BACKEND = "supabase"
+
+
+def _encode(row: dict) -> bytes:
+    return zlib.compress(json.dumps(row, ensure_ascii=False, default=str).encode(), 6)
+
+
+def _decode(payload: bytes) -> dict:
+    return json.loads(zlib.decompress(payload))
+
+
+@dataclass
+class FlushResult:
+    """테이블 하나의 flush 결과"""
+    table: str
+    # 스풀에서 꺼낸 행 수
+    rows: int = 0
+    written: int = 0
+    skipped: int = 0
+    failed: int = 0
+    # 일시적 오류로 스풀에 남겨 둔 행 수 (다음 flush에서 다시 보냄)
+    deferred: int = 0
+    # dead_letters로 옮긴 행 수
+    dead: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class WriteSpool:
+    """내구성 있는 쓰기 스풀 (스레드 안전)"""
+
+    def __init__(self, path: str | Path | None = None, max_attempts: int = 5):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: WRITE_SPOOL_PATH 환경변수 또는 backend/.cache/write_spool.sqlite3)
+            max_attempts: 이 횟수만큼 저장에 실패한 행은 dead_letters로 옮김
+        """
+        self.path = Path(path or os.getenv("WRITE_SPOOL_PATH") or DEFAULT_SPOOL_PATH)
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=FULL;")
+        self._migrate()
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS spool (
+                backend TEXT NOT NULL DEFAULT '{DEFAULT_BACKEND}',
+                table_name TEXT NOT NULL,
+                id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                payload BLOB NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                enqueued_at REAL NOT NULL,
+                PRIMARY KEY (backend, table_name, id)
+            );
+            CREATE INDEX IF NOT EXISTS spool_backend_seq ON spool (backend, table_name, seq);
+            CREATE TABLE IF NOT EXISTS dead_letters (
+                backend TEXT NOT NULL DEFAULT '{DEFAULT_BACKEND}',
+                table_name TEXT NOT NULL,
+                id TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                error TEXT,
+                failed_at REAL NOT NULL
+            );
+        """)
+
+    def _columns(self, table: str) -> list[str]:
+        return [row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+
+    def _migrate(self) -> None:
+        """저장소 컬럼이 없던 스풀 파일 변환 (남아 있던 행은 Supabase 행으로 봄)"""
+        spool_columns = self._columns("spool")
+        if spool_columns and "backend" not in spool_columns:
+            with self._conn:
+                self._conn.execute("ALTER TABLE spool RENAME TO spool_old")
+                self._conn.execute("DROP INDEX IF EXISTS spool_seq")
+                self._conn.execute(f"""
+                    CREATE TABLE spool (
+                        backend TEXT NOT NULL DEFAULT '{DEFAULT_BACKEND}',
+                        table_name TEXT NOT NULL,
+                        id TEXT NOT NULL,
+                        seq INTEGER NOT NULL,
+                        payload BLOB NOT NULL,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        enqueued_at REAL NOT NULL,
+                        PRIMARY KEY (backend, table_name, id)
+                    )
+                """)
+                self._conn.execute(
+                    "INSERT INTO spool (table_name, id, seq, payload, attempts, enqueued_at)"
+                    " SELECT table_name, id, seq, payload, attempts, enqueued_at FROM spool_old"
+                )
+                self._conn.execute("DROP TABLE spool_old")
+        dead_letter_columns = self._columns("dead_letters")
+        if dead_letter_columns and "backend" not in dead_letter_columns:
+            with self._conn:
+                self._conn.execute(
+                    f"ALTER TABLE dead_letters ADD COLUMN backend TEXT NOT NULL DEFAULT '{DEFAULT_BACKEND}'"
+                )
+
+    def append(self, table: str, rows: list[dict], backend: str = DEFAULT_BACKEND) -> int:
+        """
+        행 기록 (같은 저장소에 같은 ID가 아직 스풀에 있으면 내용을 새 것으로 교체)
+
+        Args:
+            table: 테이블 이름
+            rows: ID가 채워진 행
+            backend: 행을 반영할 저장소 이름 (StorageBackend.name)
+
+        Returns:
+            기록한 행 수
+        """
+        if not rows:
+            return 0
+
+        now = time.time()
+        with self._lock, self._conn:
+            seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM spool").fetchone()[0]
+            self._conn.executemany(
+                "INSERT INTO spool (backend, table_name, id, seq, payload, attempts, enqueued_at)"
+                " VALUES (?, ?, ?, ?, ?, 0, ?)"
+                " ON CONFLICT (backend, table_name, id) DO UPDATE SET"
+                " seq = excluded.seq, payload = excluded.payload, attempts = 0, enqueued_at = excluded.enqueued_at",
+                [(backend, table, str(row["id"]), seq + i + 1, _encode(row), now) for i, row in enumerate(rows)],
+            )
+        return len(rows)
+
+    def pending(self, table: str | None = None, backend: str | None = None) -> int:
+        """스풀에 남은 행 수 (backend 지정 시 그 저장소의 행만)"""
+        conditions = {"table_name": table, "backend": backend}
+        conditions = {column: value for column, value in conditions.items() if value is not None}
+        where = " AND ".join(f"{column} = ?" for column in conditions)
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM spool{' WHERE ' + where if where else ''}", list(conditions.values())
+            ).fetchone()[0]
+
+    def backends(self) -> dict[str, int]:
+        """저장소별 남은 행 수"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT backend, COUNT(*) FROM spool GROUP BY backend ORDER BY backend"))
+
+    def tables(self, backend: str = DEFAULT_BACKEND) -> list[str]:
+        """저장소의 스풀에 행이 남은 테이블 (먼저 기록된 순)"""
+        with self._lock:
+            return [
+                table for table, in self._conn.execute(
+                    "SELECT table_name FROM spool WHERE backend = ? GROUP BY table_name ORDER BY MIN(seq)", (backend,)
+                )
+            ]
+
+    def _read(self, backend: str, table: str, after_seq: int, limit: int) -> list[tuple[int, int, dict]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, attempts, payload FROM spool WHERE backend = ? AND table_name = ? AND seq > ?"
+                " ORDER BY seq LIMIT ?",
+                (backend, table, after_seq, limit),
+            ).fetchall()
+        return [(seq, attempts, _decode(payload)) for seq, attempts, payload in rows]
+
+    def flush(
+        self,
+        table: str,
+        write: Callable[[list[dict]], object],
+        chunk_rows: int = 5000,
+        backend: str = DEFAULT_BACKEND,
+    ) -> FlushResult:
+        """
+        저장소 하나의 테이블 스풀을 chunk_rows개씩 꺼내 저장 (다른 저장소의 행은 건드리지 않음)
+
+        Args:
+            table: 테이블 이름
+            write: 행 목록을 저장하고 BulkWriteResult(written/skipped/failed/deferred)를 반환하는 함수
+            chunk_rows: 한 번에 꺼내는 행 수
+            backend: 반영할 저장소 이름 (write가 저장하는 저장소)
+
+        Returns:
+            FlushResult
+        """
+        result = FlushResult(table=table)
+        started = time.perf_counter()
+        last_seq = 0
+
+        while True:
+            entries = self._read(backend, table, last_seq, chunk_rows)
+            if not entries:
+                break
+            last_seq = entries[-1][0]
+            rows = [row for _, _, row in entries]
+
+            write_result = write(rows)
+            errors = {str(row["id"]): error for row, error in write_result.failed}
+            deferred = {str(row["id"]) for row, _ in write_result.deferred}
+
+            result.rows += len(rows)
+            result.written += write_result.written
+            result.skipped += write_result.skipped
+            result.failed += len(errors)
+            result.deferred += len(deferred)
+
+            done = [
+                (backend, table, row_id, seq)
+                for seq, _, row in entries
+                if (row_id := str(row["id"])) not in errors and row_id not in deferred
+            ]
+            dead = [
+                (seq, row, errors[str(row["id"])])
+                for seq, attempts, row in entries
+                if str(row["id"]) in errors and attempts + 1 >= self.max_attempts
+            ]
+            result.dead += len(dead)
+
+            with self._lock, self._conn:
+                # 저장하는 동안 같은 ID가 다시 기록됐으면(seq가 바뀜) 남겨 둠
+                self._conn.executemany(
+                    "DELETE FROM spool WHERE backend = ? AND table_name = ? AND id = ? AND seq = ?", done
+                )
+                self._conn.executemany(
+                    "UPDATE spool SET attempts = attempts + 1"
+                    " WHERE backend = ? AND table_name = ? AND id = ? AND seq = ?",
+                    [(backend, table, row_id, seq) for seq, _, row in entries if (row_id := str(row["id"])) in errors],
+                )
+                self._conn.executemany(
+                    "INSERT INTO dead_letters (backend, table_name, id, payload, error, failed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [(backend, table, str(row["id"]), _encode(row), error, time.time()) for _, row, error in dead],
+                )
+                self._conn.executemany(
+                    "DELETE FROM spool WHERE backend = ? AND table_name = ? AND id = ? AND seq = ?",
+                    [(backend, table, str(row["id"]), seq) for seq, row, _ in dead],
+                )
+
+            # 저장소가 응답하지 않으면 나머지는 다음 실행으로 미룸
+            if deferred:
+                break
+
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_default_spool: WriteSpool | None = None
+_default_spool_lock = threading.Lock()
+
+
+def get_write_spool() -> WriteSpool | None:
+    """기본 쓰기 스풀 (WRITE_SPOOL=0이면 None - Supabase에 바로 저장)"""
+    global _default_spool
+    if os.getenv("WRITE_SPOOL", "1").lower() in ("0", "false", "off"):
+        return None
+    with _default_spool_lock:
+        if _default_spool is None:
+            _default_spool = WriteSpool()
+        return _default_spool